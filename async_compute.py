@@ -0,0 +1,65 @@
+import maya.cmds as cmds
+import maya.utils
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+# Maya's scene and UI may only be touched from the main thread, so workers only ever see
+# plain data snapshots taken up front; their results are applied back through executeDeferred.
+_executor = None
+_generations = {}
+_pending_labels = {}  # key -> (button, label shown before the pending state)
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="dinoRigCompute")
+    return _executor
+
+def submit(key, compute, snapshot, apply, button=None):
+    """
+    Runs compute(snapshot) on a worker thread, then apply(result) on Maya's main thread.
+
+    Only the newest request per key is applied: clicking again while a computation is
+    still running makes the older result stale and it is dropped when it arrives.
+
+    :param key: Name of the operation, e.g. "joint_chain".
+    :param compute: Pure function of the snapshot; must not call maya.cmds or OpenMaya.
+    :param snapshot: Scene data gathered on the main thread before submitting.
+    :param apply: Called on the main thread with the result, makes the scene edits.
+    :param button: Optional UI button that shows a pending state while computing.
+    """
+    generation = _generations.get(key, 0) + 1
+    _generations[key] = generation
+
+    if button and key not in _pending_labels and cmds.button(button, exists=True):
+        label = cmds.button(button, query=True, label=True)
+        _pending_labels[key] = (button, label)
+        cmds.button(button, edit=True, label=label + " (computing...)")
+
+    future = _get_executor().submit(compute, snapshot)
+    future.add_done_callback(
+        lambda done: maya.utils.executeDeferred(_finish, key, generation, done, apply))
+    return future
+
+def _restore_label(key):
+    button, label = _pending_labels.pop(key, (None, None))
+    if button and cmds.button(button, exists=True):
+        cmds.button(button, edit=True, label=label)
+
+def _finish(key, generation, future, apply):
+    """Main thread half of submit: applies the result unless a newer request replaced it."""
+    if _generations.get(key) != generation:
+        return  # stale, a newer click owns the pending state and the result
+    _restore_label(key)
+    if future.cancelled():
+        return
+    error = future.exception()
+    if error is not None:
+        cmds.warning(f"{key} failed: " + "".join(traceback.format_exception(type(error), error, error.__traceback__)))
+        return
+    apply(future.result())
+
+def cancel(key):
+    """Drops the result of the running computation for key, if any."""
+    _generations[key] = _generations.get(key, 0) + 1
+    _restore_label(key)
@@ -0,0 +1,85 @@
+import maya.cmds as cmds
+import itertools
+import time
+
+DEFAULT_CHUNK_SIZE = 50
+
+def _format_seconds(seconds):
+    if seconds is None:
+        return "--:--"
+    minutes, seconds = divmod(int(seconds + 0.5), 60)
+    return f"{minutes:02d}:{seconds:02d}"
+
+def run_chunked(targets, func, title="Working", chunk_size=DEFAULT_CHUNK_SIZE, total=None):
+    """
+    Applies func to every target, consuming the targets as a stream in fixed size chunks.
+    Between chunks the progress window (or a printed line in batch mode) is updated with an
+    ETA and the user can cancel with Esc. All edits go into one undo chunk, so cancelling
+    undoes everything done so far and leaves the scene as it was. When that chunk cannot be
+    undone on its own (undo is off, or the caller has a chunk of its own open) the changes
+    made before cancelling are kept and the warning says so.
+
+    :param targets: Any iterable of nodes/components; generators are never turned into lists.
+    :param func: Called once per target.
+    :param title: Progress window title and undo chunk name.
+    :param chunk_size: Targets processed between progress updates and cancel checks.
+    :param total: Number of targets, for the progress bar and ETA (taken from len() when possible).
+    :return: Dictionary with the processed count, seconds, nodes per second and whether it was cancelled.
+    """
+    if total is None and hasattr(targets, "__len__"):
+        total = len(targets)
+    interactive = not cmds.about(batch=True)
+    undo_enabled = cmds.undoInfo(query=True, state=True)
+
+    if interactive:
+        cmds.progressWindow(title=title, progress=0, maxValue=max(total or 0, 1),
+                            status="Starting...", isInterruptable=True)
+    if undo_enabled:
+        cmds.undoInfo(openChunk=True, chunkName=title)
+
+    stream = iter(targets)
+    processed = 0
+    cancelled = False
+    start = time.perf_counter()
+    try:
+        while True:
+            chunk = list(itertools.islice(stream, chunk_size))
+            if not chunk:
+                break
+            for target in chunk:
+                func(target)
+            processed += len(chunk)
+
+            elapsed = time.perf_counter() - start
+            rate = processed / elapsed if elapsed else 0.0
+            eta = (total - processed) / rate if total and rate else None
+            status = f"{processed}/{total if total else '?'}  ETA {_format_seconds(eta)}"
+            if interactive:
+                cmds.progressWindow(edit=True, progress=processed, status=status)
+                if cmds.progressWindow(query=True, isCancelled=True):
+                    cancelled = True
+                    break
+            else:
+                print(f"{title}: {status}")
+    finally:
+        if undo_enabled:
+            cmds.undoInfo(closeChunk=True)
+        if interactive:
+            cmds.progressWindow(endProgress=True)
+
+    elapsed = time.perf_counter() - start
+    rate = processed / elapsed if elapsed else 0.0
+    if cancelled:
+        # the top of the undo queue is only this chunk if it was closed at the top level and
+        # recorded something; otherwise undo would take back an unrelated, earlier action
+        rolled_back = False
+        if undo_enabled and processed and cmds.undoInfo(query=True, undoName=True) == title:
+            cmds.undo()
+            rolled_back = True
+        if rolled_back:
+            cmds.warning(f"{title} cancelled after {processed} node(s); changes were undone.")
+        else:
+            cmds.warning(f"{title} cancelled after {processed} node(s); the changes made so far were kept.")
+    else:
+        print(f"{title}: processed {processed} node(s) in {elapsed:.2f}s ({rate:.0f} nodes/sec)")
+    return {"processed": processed, "seconds": elapsed, "rate": rate, "cancelled": cancelled}
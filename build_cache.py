@@ -0,0 +1,282 @@
+import maya.cmds as cmds
+import maya.api.OpenMaya as om
+import hashlib
+import inspect
+import json
+import os
+import sys
+import numpy as np
+import controlJoint_creation
+import foot_joint_creation
+import joint_chain_calc
+import joint_spline_chain
+import skeleton_io
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".dino_rig_cache")
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024  # evict least recently used parts above this size
+FLOAT_DIGITS = 6  # inputs are rounded so float noise does not change the hash
+
+# attribute on a clustered curve remembering the inputs its clusters were built from
+CLUSTER_HASH_ATTR = "clusterBuildHash"
+
+# the rig tool modules live next to this one; their functions and constants are part of a part's key
+_TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def _round(value):
+    """Rounds all floats in nested lists/tuples/dicts for hashing."""
+    if isinstance(value, float):
+        return round(value, FLOAT_DIGITS)
+    if isinstance(value, (list, tuple)):
+        return [_round(v) for v in value]
+    if isinstance(value, dict):
+        return {str(key): _round(v) for key, v in value.items()}
+    return value
+
+def _builder_source(func):
+    """Source of a builder, so editing the builder invalidates its cached parts."""
+    try:
+        return inspect.getsource(func)
+    except (OSError, TypeError):
+        return func.__qualname__
+
+def _is_tool_module(module):
+    path = getattr(module, "__file__", None)
+    return bool(path) and os.path.dirname(os.path.abspath(path)) == _TOOLS_DIR
+
+def _code_names(code):
+    """Global and attribute names used by a code object and the functions nested in it."""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            names |= _code_names(const)
+    return names
+
+def _dependencies(builder):
+    """
+    Sources of the builder and of every tool function it calls, directly or through other
+    tool functions, and the values of the tool module constants they read.
+
+    :return: (function name -> source, constant name -> value) dictionaries.
+    """
+    sources = {}
+    constants = {}
+    pending = [builder]
+    while pending:
+        func = pending.pop()
+        func_name = f"{func.__module__}.{func.__qualname__}"
+        if func_name in sources:
+            continue
+        sources[func_name] = _builder_source(func)
+        names = _code_names(func.__code__)
+        # names are looked up in the function's module and in every tool module it refers to,
+        # which covers both calculate_points_spread(...) and joint_chain_calc.calculate_points_spread(...)
+        modules = [sys.modules.get(func.__module__)]
+        modules += [func.__globals__[name] for name in names
+                    if inspect.ismodule(func.__globals__.get(name)) and _is_tool_module(func.__globals__[name])]
+        for module in modules:
+            if module is None:
+                continue
+            for name in names:
+                value = getattr(module, name, None)
+                if inspect.isfunction(value) and _is_tool_module(inspect.getmodule(value)):
+                    pending.append(value)
+                elif isinstance(value, (int, float, str, list, tuple, dict)) and not isinstance(value, bool):
+                    constants[f"{module.__name__}.{name}"] = _round(value)
+    return sources, constants
+
+def hash_inputs(kind, builder, **inputs):
+    """
+    Content hash of one rig part: the part kind, the code of the builder and of the tool
+    functions it depends on, the tool constants they read and every input value.
+
+    :param kind: Part kind, e.g. "leg" or "chain".
+    :param builder: The builder function the part is made with.
+    :param inputs: Positions, curve CVs, spread, count, radius, template, ...
+    :return: Hex digest used as the cache key.
+    """
+    sources, constants = _dependencies(builder)
+    payload = json.dumps({"kind": kind, "builder": sources, "constants": constants,
+                          "inputs": {key: _round(value) for key, value in inputs.items()}},
+                         sort_keys=True)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+def _entry_path(key, cache_dir):
+    return os.path.join(cache_dir, key[:2], key + ".npz")
+
+def cache_lookup(key, cache_dir=DEFAULT_CACHE_DIR):
+    """
+    Finds a cached part and marks it as recently used.
+
+    :return: The cached arrays (see skeleton_io.read_skeleton) or None on a miss.
+    """
+    path = _entry_path(key, cache_dir)
+    if not os.path.exists(path):
+        return None
+    os.utime(path, None)  # the modification time doubles as the LRU clock
+    return skeleton_io.load_skeleton(path)
+
+def cache_store(key, roots, meta=None, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+    """
+    Stores the hierarchies under the roots as a cached part, then evicts old parts if the
+    cache grew past max_bytes.
+
+    :param meta: Extra JSON-serialisable data restored with the part (e.g. constraints).
+    """
+    data = skeleton_io.read_skeleton(roots)
+    data["meta"] = np.array(json.dumps(meta or {}), dtype=np.str_)
+    path = _entry_path(key, cache_dir)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as f:
+        np.savez(f, **data)
+    os.replace(temp_path, path)  # never leave a half written entry behind
+    evict(cache_dir, max_bytes)
+
+def evict(cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+    """
+    Deletes least recently used parts until the cache is at most max_bytes.
+
+    :return: Number of parts deleted.
+    """
+    entries = []
+    for folder, _, files in os.walk(cache_dir):
+        for name in files:
+            if name.endswith(".npz"):
+                stat = os.stat(os.path.join(folder, name))
+                entries.append((stat.st_mtime, stat.st_size, os.path.join(folder, name)))
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        os.remove(path)
+        total -= size
+        removed += 1
+    return removed
+
+def clear_cache(cache_dir=DEFAULT_CACHE_DIR):
+    """Deletes every cached part."""
+    return evict(cache_dir, max_bytes=0)
+
+def _restore(data):
+    """Rebuilds a cached part; returns the created names keyed by their cached names."""
+    created = skeleton_io.build_skeleton(data)
+    return dict(zip((str(name) for name in data["names"]), created)), json.loads(str(data["meta"]))
+
+def _base_curve_shape(curve_name):
+    """The curve's undeformed shape: its intermediate (Orig) shape once deformers are on it."""
+    shapes = cmds.listRelatives(curve_name, shapes=True, type="nurbsCurve", fullPath=True) or []
+    intermediate = [shape for shape in shapes if cmds.getAttr(f"{shape}.intermediateObject")]
+    return (intermediate or shapes)[0]
+
+def _curve_inputs(curve_name):
+    """World space CVs, knots and degree of a curve (transform or shape) for hashing."""
+    selection = om.MSelectionList()
+    selection.add(curve_name)
+    curve_fn = om.MFnNurbsCurve(selection.getDagPath(0))
+    cvs = [(p.x, p.y, p.z) for p in curve_fn.cvPositions(om.MSpace.kWorld)]
+    return {"cvs": cvs, "knots": list(curve_fn.knots()), "degree": curve_fn.degree}
+
+def cached_leg_chain(jntRadi, hipPos, kneePos, anklePos, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+    """
+    foot_joint_creation.build_leg_chain, restored from the cache when the same leg was built before.
+
+    :return: The root (hip) joint.
+    """
+    key = hash_inputs("leg", foot_joint_creation.build_leg_chain,
+                      radius=jntRadi, hip=list(hipPos), knee=list(kneePos), ankle=list(anklePos))
+    data = cache_lookup(key, cache_dir)
+    if data is not None:
+        names, _ = _restore(data)
+        return names[str(data["names"][0])]
+    root = foot_joint_creation.build_leg_chain(jntRadi, hipPos, kneePos, anklePos)
+    cache_store(key, [root], cache_dir=cache_dir, max_bytes=max_bytes)
+    return root
+
+def cached_joint_chain(start, end, spread_factor, num_points, joint_radius, name_prefix="joint",
+                       cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+    """
+    joint_chain_calc.build_joint_chain, restored from the cache when the same chain was built before.
+
+    :return: List of the chain's joints from start to end.
+    """
+    key = hash_inputs("chain", joint_chain_calc.build_joint_chain, start=list(start), end=list(end),
+                      spread=spread_factor, count=num_points, radius=joint_radius, template=name_prefix)
+    data = cache_lookup(key, cache_dir)
+    if data is not None:
+        names, _ = _restore(data)
+        return list(names.values())
+    joints = joint_chain_calc.build_joint_chain(start, end, spread_factor, num_points, joint_radius, name_prefix)
+    cache_store(key, joints[:1], cache_dir=cache_dir, max_bytes=max_bytes)
+    return joints
+
+def cached_chain_on_curve(curve_name, spread_factor, num_points, joint_radius, name_prefix="joint",
+                          cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+    """
+    joint_spline_chain.build_chain_on_curve, restored from the cache when a curve with the same
+    CVs was chained with the same settings before.
+
+    :return: List of the chain's joints from start to end.
+    """
+    key = hash_inputs("curve_chain", joint_spline_chain.build_chain_on_curve, spread=spread_factor,
+                      count=num_points, radius=joint_radius, template=name_prefix, **_curve_inputs(curve_name))
+    data = cache_lookup(key, cache_dir)
+    if data is not None:
+        names, _ = _restore(data)
+        return list(names.values())
+    joints = joint_spline_chain.build_chain_on_curve(curve_name, spread_factor, num_points, joint_radius, name_prefix)
+    cache_store(key, joints[:1], cache_dir=cache_dir, max_bytes=max_bytes)
+    return joints
+
+def cached_fk_control(joint, selected_axis="X Axis", size=20, ctrlConnect=True,
+                      cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+    """
+    controlJoint_creation.build_fk_control, restored from the cache when a control for a joint
+    with the same world transform, rotate order, axis and size was built before. The orient
+    constraint is a connection to the joint, so it is recreated rather than cached.
+
+    :return: The name of the control.
+    """
+    key = hash_inputs("fk_control", controlJoint_creation.build_fk_control,
+                      matrix=cmds.xform(joint, query=True, worldSpace=True, matrix=True),
+                      rotate_order=cmds.getAttr(joint + ".rotateOrder"),
+                      template=joint + "_CTRL", axis=selected_axis, size=size)
+    data = cache_lookup(key, cache_dir)
+    if data is not None:
+        names, meta = _restore(data)
+        circle = names[meta["control"]]
+    else:
+        circle = controlJoint_creation.build_fk_control(joint, selected_axis, size, ctrlConnect=False)
+        group = cmds.listRelatives(circle, parent=True)[0]
+        cache_store(key, [group], meta={"control": circle}, cache_dir=cache_dir, max_bytes=max_bytes)
+    if ctrlConnect:
+        cmds.orientConstraint(circle, joint, maintainOffset=True)
+    return circle
+
+def cached_curve_clusters(curve_name):
+    """
+    joint_spline_chain.cluster_curve_cvs, skipped when the curve already carries clusters built
+    from the same CVs. Clusters are deformers in the curve's history rather than hierarchy data,
+    so they cannot be stored on disk like the joint parts; the hash is kept on the curve instead.
+    The hash is taken from the undeformed curve, so moving the cluster handles does not count as
+    a change, and clusters from an earlier build are deleted before new ones are made.
+
+    :return: List of the cluster handles, one per CV.
+    """
+    key = hash_inputs("clusters", joint_spline_chain.cluster_curve_cvs,
+                      **_curve_inputs(_base_curve_shape(curve_name)))
+    handles = cmds.listRelatives(curve_name, children=True, type="transform", fullPath=True) or []
+    handles = [handle for handle in handles
+               if cmds.listRelatives(handle, shapes=True, type="clusterHandle")]
+    if cmds.attributeQuery(CLUSTER_HASH_ATTR, node=curve_name, exists=True):
+        if cmds.getAttr(f"{curve_name}.{CLUSTER_HASH_ATTR}") == key and handles:
+            return handles
+    if handles:
+        # deleting a handle deletes its cluster, so the old set leaves the curve's history
+        # instead of a second set stacking on top of it
+        cmds.delete(handles)
+    clusters = joint_spline_chain.cluster_curve_cvs(curve_name)
+    if not cmds.attributeQuery(CLUSTER_HASH_ATTR, node=curve_name, exists=True):
+        cmds.addAttr(curve_name, longName=CLUSTER_HASH_ATTR, dataType="string")
+    cmds.setAttr(f"{curve_name}.{CLUSTER_HASH_ATTR}", key, type="string")
+    return clusters
@@ -0,0 +1,222 @@
+import maya.cmds as cmds
+import maya.api.OpenMaya as om
+from collections import Counter
+import undoable_modifier
+
+# Rough cost in microseconds of one record, for comparing plans rather than predicting exact times
+RECORD_COST = {"CreateNode": 20.0, "SetAttr": 2.0, "Connect": 4.0, "Command": 150.0}
+LEGACY_COMMAND_COST = 100.0  # an average maya.cmds call making one of the same edits
+
+class CreateNode:
+    """Creates a node; other records refer to it by passing this record instead of a name."""
+    __slots__ = ("node_type", "name", "parent")
+
+    def __init__(self, node_type, name, parent=None):
+        self.node_type = node_type
+        self.name = name
+        self.parent = parent
+
+    def __repr__(self):
+        parent = f" under {_label(self.parent)}" if self.parent is not None else ""
+        return f"create {self.node_type} '{self.name}'{parent}"
+
+class SetAttr:
+    __slots__ = ("node", "attr", "value")
+
+    def __init__(self, node, attr, value):
+        self.node = node
+        self.attr = attr
+        self.value = value
+
+    def __repr__(self):
+        return f"set {_label(self.node)}.{self.attr} = {self.value}"
+
+class Connect:
+    __slots__ = ("source", "source_attr", "destination", "destination_attr")
+
+    def __init__(self, source, source_attr, destination, destination_attr):
+        self.source = source
+        self.source_attr = source_attr
+        self.destination = destination
+        self.destination_attr = destination_attr
+
+    def __repr__(self):
+        return f"connect {_label(self.source)}.{self.source_attr} -> {_label(self.destination)}.{self.destination_attr}"
+
+class Command:
+    """A maya.cmds call for what cannot be expressed as node/attribute edits (e.g. constraints)."""
+    __slots__ = ("func", "args", "kwargs")
+
+    def __init__(self, func, args, kwargs):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+
+    def __repr__(self):
+        return f"cmds.{self.func}({', '.join(_label(arg) for arg in self.args)})"
+
+def _label(node):
+    return f"'{node.name}'" if isinstance(node, CreateNode) else repr(node)
+
+class BuildPlan:
+    """
+    Ordered node-creation and attribute-write records produced by the tools' plan_* functions
+    (controlJoint_creation.plan_fk_control, joint_chain_calc.plan_joints_at), applied in one
+    pass by execute_plan.
+    """
+    __slots__ = ("name", "records")
+
+    def __init__(self, name):
+        self.name = name
+        self.records = []
+
+    def create(self, node_type, name, parent=None):
+        record = CreateNode(node_type, name, parent)
+        self.records.append(record)
+        return record
+
+    def set(self, node, attr, value):
+        self.records.append(SetAttr(node, attr, value))
+
+    def connect(self, source, source_attr, destination, destination_attr):
+        self.records.append(Connect(source, source_attr, destination, destination_attr))
+
+    def command(self, func, *args, **kwargs):
+        self.records.append(Command(func, args, kwargs))
+
+    def extend(self, other):
+        self.records.extend(other.records)
+
+    def summary(self):
+        """
+        Record counts and estimated cost of the plan, against making the same edits with one
+        maya.cmds call per record.
+        """
+        counts = Counter(type(record).__name__ for record in self.records)
+        cost = sum(RECORD_COST[kind] * count for kind, count in counts.items())
+        return {
+            "records": dict(counts),
+            "commands": counts.get("Command", 0),
+            "modifier_doits": 2 if len(self.records) > counts.get("Command", 0) else 0,
+            "estimated_us": cost,
+            "legacy_commands": len(self.records),
+            "legacy_estimated_us": len(self.records) * LEGACY_COMMAND_COST,
+        }
+
+    def print_plan(self):
+        """Prints every record and the summary (the dry run output)."""
+        print(f"Build plan '{self.name}' ({len(self.records)} records):")
+        for record in self.records:
+            print(f"  {record!r}")
+        summary = self.summary()
+        print(f"  -> {summary['modifier_doits']} modifier doIt(s) + {summary['commands']} command(s), "
+              f"~{summary['estimated_us'] / 1000.0:.2f} ms estimated")
+        print(f"  one call per record: {summary['legacy_commands']} maya.cmds calls, "
+              f"~{summary['legacy_estimated_us'] / 1000.0:.2f} ms estimated")
+
+_dag_types = {}
+
+def _is_dag_type(node_type):
+    if node_type not in _dag_types:
+        _dag_types[node_type] = "dagNode" in (cmds.nodeType(node_type, isTypeName=True, inherited=True) or [])
+    return _dag_types[node_type]
+
+def _queue_value(modifier, plug, value):
+    """Queues a plain, compound (3 values) or matrix (16 values) attribute value."""
+    if isinstance(value, (tuple, list)):
+        if len(value) == 16:
+            modifier.newPlugValue(plug, om.MFnMatrixData().create(om.MMatrix(value)))
+            return
+        for i, child_value in enumerate(value):
+            _queue_value(modifier, plug.child(i), child_value)
+        return
+    attribute = plug.attribute()
+    if attribute.hasFn(om.MFn.kUnitAttribute) and om.MFnUnitAttribute(attribute).unitType() == om.MFnUnitAttribute.kAngle:
+        modifier.newPlugValueMAngle(plug, om.MAngle(value, om.MAngle.kDegrees))
+    elif isinstance(value, bool):
+        modifier.newPlugValueBool(plug, value)
+    elif isinstance(value, int):
+        modifier.newPlugValueInt(plug, value)
+    else:
+        modifier.newPlugValueDouble(plug, float(value))
+
+def execute_plan(plan, dry_run=False):
+    """
+    Applies a build plan: every DG node is created by one MDGModifier, and every DAG node,
+    rename, attribute write and connection is queued on one MDagModifier, so the scene is
+    edited in two doIt calls. Command records run afterwards, in order, and the whole plan
+    is one undo step.
+
+    :param plan: BuildPlan from the plan_* functions.
+    :param dry_run: Only print the plan and its estimated cost; the scene is not touched.
+    :return: Dictionary of plan node names to created node names (None for a dry run).
+    """
+    if dry_run:
+        plan.print_plan()
+        return None
+
+    dg_modifier = om.MDGModifier()
+    dag_modifier = om.MDagModifier()
+    objects = {}
+
+    def resolve(node):
+        if isinstance(node, CreateNode):
+            return objects[id(node)]
+        selection = om.MSelectionList()
+        selection.add(node)
+        return selection.getDependNode(0)
+
+    def plug(node, attr):
+        return om.MFnDependencyNode(resolve(node)).findPlug(attr, False)
+
+    commands = []
+    for record in plan.records:
+        if isinstance(record, CreateNode):
+            if _is_dag_type(record.node_type):
+                parent = resolve(record.parent) if record.parent is not None else om.MObject.kNullObj
+                obj = dag_modifier.createNode(record.node_type, parent)
+                dag_modifier.renameNode(obj, record.name)
+            else:
+                obj = dg_modifier.createNode(record.node_type)
+                dg_modifier.renameNode(obj, record.name)
+            objects[id(record)] = obj
+        elif isinstance(record, SetAttr):
+            _queue_value(dag_modifier, plug(record.node, record.attr), record.value)
+        elif isinstance(record, Connect):
+            dag_modifier.connect(plug(record.source, record.source_attr),
+                                 plug(record.destination, record.destination_attr))
+        else:
+            commands.append(record)
+
+    names = {}
+    cmds.undoInfo(openChunk=True, chunkName=f"Build {plan.name}")
+    try:
+        undoable_modifier.commit(dg_modifier)
+        undoable_modifier.commit(dag_modifier)
+        for record in plan.records:
+            if isinstance(record, CreateNode):
+                names[record.name] = om.MFnDependencyNode(objects[id(record)]).name()
+        for record in commands:
+            args = [names[arg.name] if isinstance(arg, CreateNode) else arg for arg in record.args]
+            getattr(cmds, record.func)(*args, **record.kwargs)
+    finally:
+        cmds.undoInfo(closeChunk=True)
+    return names
+
+def compare_command_counts(plans):
+    """
+    Prints the dry run numbers of several plans side by side, e.g. one plan_fk_control per
+    joint: the Maya calls execute_plan makes for each against one maya.cmds call per record.
+
+    :param plans: BuildPlan objects.
+    :return: List of (plan name, execute_plan calls, one call per record) tuples.
+    """
+    rows = []
+    for plan in plans:
+        summary = plan.summary()
+        calls = summary["modifier_doits"] + summary["commands"]
+        rows.append((plan.name, calls, summary["legacy_commands"]))
+        print(f"{plan.name:<40} {len(plan.records):5d} records in {calls} call(s), "
+              f"~{summary['estimated_us'] / 1000.0:.2f} ms | one call per record: "
+              f"~{summary['legacy_estimated_us'] / 1000.0:.2f} ms")
+    return rows
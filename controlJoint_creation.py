@@ -1,5 +1,18 @@
 import maya.cmds as cmds
 import maya.api.OpenMaya as om
+import batch_progress
+import build_plan
+import math
+import re
+import undoable_modifier
+
+# normal vector of the control circle for each axis choice in the UI
+AXIS_NORMALS = {
+    "X Axis": [1, 0, 0],
+    "Y Axis": [0, 1, 0],
+    "Z Axis": [0, 0, 1],
+}
+
 def create_nurbs_circle_around_joint(selected_axis, size, ctrl_connect):
     """
     Creates trial nurbs circle for quick testing
@@ -130,7 +143,7 @@ def recolor_nurbs_shapes(hex_color):
         cmds.warning("No objects selected. Please select NURBS shapes to recolor.")
         return
 
-    for obj in selection:
+    def recolor(obj):
         shapes = cmds.listRelatives(obj, shapes=True, fullPath=True) or []
         for shape in shapes:
             if cmds.nodeType(shape) in ['nurbsCurve', 'nurbsSurface']:
@@ -140,6 +153,8 @@ def recolor_nurbs_shapes(hex_color):
                 cmds.setAttr(f"{shape}.overrideColorRGB", r, g, b)
                 print(f"Recolored: {shape}")
 
+    batch_progress.run_chunked(selection, recolor, title="Recolor NURBS Shapes")
+
 def create_locator_at_pivot():
     selection = cmds.ls(selection=True, long=True)
     if not selection:
@@ -208,7 +223,96 @@ def create_nurbs_control_with_joint(nurbs_surface, joint):
     joint_rotation_order = cmds.getAttr(joint + ".rotateOrder")
     cmds.setAttr(nurbs_surface + ".rotateOrder", joint_rotation_order)
     print("Grouping control created")
-    return
+    return group
+
+def _dag_path(name):
+    selection = om.MSelectionList()
+    selection.add(name)
+    return selection.getDagPath(0)
+
+def pair_controls_with_joints(controls=None, pattern="{joint}_CTRL"):
+    """
+    Bulk version of create_nurbs_control_with_joint: every control whose name fits the
+    pattern is matched to its joint through a name index built once, and all the _OFFSET
+    groups are created, placed from the joints' world matrices and parented in one
+    MDagModifier pass. Like the single version the control's scale is frozen, its
+    translation zeroed and its rotation order set to the joint's; all of it is one undo step.
+
+    :param controls: Control transforms to pair (defaults to every curve or surface transform in the scene).
+    :param pattern: Control name with {joint} where the joint name goes, e.g. "{joint}_CTRL".
+    :return: List of the created _OFFSET groups.
+    """
+    prefix, _, suffix = pattern.partition("{joint}")
+    name_regex = re.compile(f"^{re.escape(prefix)}(.+){re.escape(suffix)}$")
+    if controls is None:
+        controls = [node for node in cmds.ls(type="transform")
+                    if cmds.listRelatives(node, shapes=True, type=["nurbsCurve", "nurbsSurface"])]
+
+    # short joint name -> joint, built once for all controls; a short name shared by several
+    # joints cannot tell them apart, so those joints are left out
+    joint_index = {}
+    duplicates = set()
+    for joint in cmds.ls(type="joint", long=True):
+        short_name = joint.rsplit("|", 1)[-1]
+        if short_name in joint_index:
+            duplicates.add(short_name)
+        joint_index[short_name] = joint
+    for short_name in duplicates:
+        del joint_index[short_name]
+    if duplicates:
+        cmds.warning(f"Skipping joint names used more than once: {', '.join(sorted(duplicates))}.")
+    pairs = []
+    for control in dict.fromkeys(controls):  # a control listed twice is paired once
+        short_name = control.rsplit("|", 1)[-1]
+        match = name_regex.match(short_name)
+        parent = cmds.listRelatives(control, parent=True) or [""]
+        if match and match.group(1) in joint_index and parent[0] != short_name + "_OFFSET":
+            pairs.append((control, joint_index[match.group(1)]))
+    if not pairs:
+        cmds.warning(f"No unpaired controls named like '{pattern}' with a matching joint.")
+        return []
+
+    # the scale freeze and the modifier undo together
+    cmds.undoInfo(openChunk=True, chunkName="Pair controls with joints")
+    try:
+        cmds.makeIdentity([control for control, _ in pairs], apply=True, scale=True)
+
+        modifier = om.MDagModifier()
+        groups = []
+        for control, joint in pairs:
+            # one selection list per name: a shared list merges repeated nodes and shifts indices
+            control_obj = _dag_path(control).node()
+            joint_path = _dag_path(joint)
+            world = om.MTransformationMatrix(joint_path.inclusiveMatrix())
+            position = world.translation(om.MSpace.kWorld)
+            rotation = world.rotation()
+
+            group = modifier.createNode("transform", om.MObject.kNullObj)
+            modifier.renameNode(group, control.rsplit("|", 1)[-1] + "_OFFSET")
+            group_fn = om.MFnDependencyNode(group)
+            for attr, values in (("translate", (position.x, position.y, position.z)),
+                                 ("rotate", (rotation.x, rotation.y, rotation.z))):
+                for axis, value in zip("XYZ", values):
+                    plug = group_fn.findPlug(attr + axis, False)
+                    if attr == "rotate":
+                        modifier.newPlugValueMAngle(plug, om.MAngle(value))
+                    else:
+                        modifier.newPlugValueDouble(plug, value)
+
+            control_fn = om.MFnDependencyNode(control_obj)
+            modifier.reparentNode(control_obj, group)
+            for axis in "XYZ":
+                modifier.newPlugValueDouble(control_fn.findPlug("translate" + axis, False), 0.0)
+            rotate_order = om.MFnDependencyNode(joint_path.node()).findPlug("rotateOrder", False).asInt()
+            modifier.newPlugValueInt(control_fn.findPlug("rotateOrder", False), rotate_order)
+            groups.append(group)
+        undoable_modifier.commit(modifier)
+    finally:
+        cmds.undoInfo(closeChunk=True)
+
+    names = [om.MFnDependencyNode(group).name() for group in groups]
+    print(f"Paired {len(names)} control(s) with their joints")
+    return names
 
 
 def create_fk_control_with_group(selected_axis="X Axis", size=20, ctrlConnect=True):
@@ -228,30 +332,64 @@ def create_fk_control_with_group(selected_axis="X Axis", size=20, ctrlConnect=Tr
     
     joint = selected[0]
     
-    # Determine the normal vector based on the selected axis
-    if selected_axis == "X Axis":
-        normal = [1, 0, 0]
-    elif selected_axis == "Y Axis":
-        normal = [0, 1, 0]
-    elif selected_axis == "Z Axis":
-        normal = [0, 0, 1]
-    else:
+    if selected_axis not in AXIS_NORMALS:
         cmds.confirmDialog(title="Error", message="Invalid axis selected.", button=["OK"])
         return
     
-    # Create the control circle
-    circle_name = joint + '_CTRL'
-    circle = cmds.circle(name=circle_name, normal=normal)[0]
-    
-   
-    cmds.scale(size, size, size, circle)
-   
-    create_nurbs_control_with_joint(circle, joint)
-    # Create an orient constraint if specified
-    if ctrlConnect:
-        cmds.orientConstraint(circle, joint, maintainOffset=True)
+    build_fk_control(joint, selected_axis, size, ctrlConnect)
     
     cmds.confirmDialog(title="Success", message="FK control created and scaled with proper grouping.", button=["OK"])
+
+def build_fk_control(joint, selected_axis="X Axis", size=20, ctrlConnect=True, dry_run=False):
+    """
+    Creates the grouped FK control for a named joint without dialogs or selection,
+    so it can be driven from scripts and batch builds.
+    
+    :param joint: The joint to create the control for.
+    :param selected_axis: The axis to align the control circle ("X Axis", "Y Axis" or "Z Axis").
+    :param size: The size of the control.
+    :param ctrlConnect: Whether to connect the control to the joint with an orient constraint.
+    :param dry_run: Only print the build plan (see build_plan.execute_plan).
+    :return: The name of the created control (None for a dry run).
+    """
+    names = build_plan.execute_plan(plan_fk_control(joint, selected_axis, size, ctrlConnect), dry_run)
+    if names is None:
+        return None
+    return names[joint + '_CTRL']
+
+def plan_fk_control(joint, selected_axis="X Axis", size=20, ctrlConnect=True):
+    """
+    Build plan of the grouped FK control: <joint>_CTRL_OFFSET matched to the joint's world
+    position and rotation, the circle control inside it with the joint's rotate order, and
+    the orient constraint. The circle's scale is frozen into its geometry the way a scale
+    and freeze would, through a transformGeometry node after the makeNurbCircle.
+
+    :return: The BuildPlan.
+    """
+    plan = build_plan.BuildPlan(f"{joint} FK control")
+    world = om.MTransformationMatrix(om.MMatrix(cmds.xform(joint, query=True, worldSpace=True, matrix=True)))
+    translation = world.translation(om.MSpace.kWorld)
+    rotation = world.rotation()
+
+    circle_name = joint + '_CTRL'
+    offset = plan.create("transform", circle_name + "_OFFSET")
+    plan.set(offset, "translate", (translation.x, translation.y, translation.z))
+    plan.set(offset, "rotate", tuple(math.degrees(angle) for angle in (rotation.x, rotation.y, rotation.z)))
+    ctrl = plan.create("transform", circle_name, parent=offset)
+    plan.set(ctrl, "rotateOrder", cmds.getAttr(joint + ".rotateOrder"))
+    shape = plan.create("nurbsCurve", circle_name + "Shape", parent=ctrl)
+    circle = plan.create("makeNurbCircle", circle_name + "_makeNurbCircle")
+    plan.set(circle, "normal", tuple(float(value) for value in AXIS_NORMALS[selected_axis]))
+    frozen_scale = plan.create("transformGeometry", circle_name + "_transformGeometry")
+    plan.set(frozen_scale, "transform", (size, 0.0, 0.0, 0.0,
+                                         0.0, size, 0.0, 0.0,
+                                         0.0, 0.0, size, 0.0,
+                                         0.0, 0.0, 0.0, 1.0))
+    plan.connect(circle, "outputCurve", frozen_scale, "inputGeometry")
+    plan.connect(frozen_scale, "outputGeometry", shape, "create")
+    if ctrlConnect:
+        plan.command("orientConstraint", ctrl, joint, maintainOffset=True)
+    return plan
     
 def apply_group_transform_to_curve_and_delete_group(group_name, curve_name):
     """
@@ -0,0 +1,146 @@
+import maya.cmds as cmds
+import maya.api.OpenMaya as om
+import re
+import time
+import undoable_modifier
+
+DISPLAY_MODES = ("full", "proxy", "hidden")
+LAYER_SUFFIX = "_LYR"
+LEG_PART = "leg"  # foot_joint_creation joints are all named <bone>_JNT
+OTHER_PART = "rig"
+# joint attribute holding the drawStyle a joint had before proxy mode, present only while in proxy
+SAVED_DRAW_STYLE_ATTR = "lodSavedDrawStyle"
+
+def part_of(node):
+    """
+    Body part a tool-made node belongs to, from its name: <prefix>_NN chain joints go to
+    <prefix>, <joint>_CTRL controls go with their joint and *_JNT joints to the leg.
+    """
+    name = node.rsplit("|", 1)[-1].rsplit(":", 1)[-1]
+    if name.endswith("_CTRL"):
+        return part_of(name[:-len("_CTRL")])
+    match = re.match(r"^(.+?)_\d+$", name)
+    if match:
+        return match.group(1)
+    if name.endswith("_JNT"):
+        return LEG_PART
+    return OTHER_PART
+
+def register_rig(roots=None):
+    """
+    Sorts the joints and _CTRL controls under the roots (the whole scene by default) into one
+    <part>_JNT_LYR and one <part>_CTRL_LYR display layer per body part, so set_display_mode
+    only has to touch a handful of layers.
+
+    :param roots: Root nodes of the rig.
+    :return: Dictionary of layer names to their member count.
+    """
+    if roots:
+        nodes = cmds.ls(cmds.listRelatives(roots, allDescendents=True, fullPath=True) or [], long=True) + \
+            cmds.ls(roots, long=True)
+        joints = cmds.ls(nodes, type="joint", long=True)
+        transforms = cmds.ls(nodes, type="transform", long=True)
+    else:
+        joints = cmds.ls(type="joint", long=True)
+        transforms = cmds.ls("*_CTRL", type="transform", long=True)
+    controls = [node for node in transforms if node.endswith("_CTRL")
+                and cmds.listRelatives(node, shapes=True, type="nurbsCurve")]
+
+    members = {}
+    for kind, nodes in (("JNT", joints), ("CTRL", controls)):
+        for node in nodes:
+            members.setdefault(f"{part_of(node)}_{kind}{LAYER_SUFFIX}", []).append(node)
+    for layer, nodes in members.items():
+        if not cmds.objExists(layer):
+            cmds.createDisplayLayer(name=layer, empty=True, noRecurse=True)
+        cmds.editDisplayLayerMembers(layer, nodes, noRecurse=True)
+    print(f"Registered {len(joints)} joint(s) and {len(controls)} control(s) into {len(members)} display layer(s)")
+    return {layer: len(nodes) for layer, nodes in members.items()}
+
+def rig_layers():
+    """The display layers made by register_rig, as (layer, kind) pairs."""
+    layers = cmds.ls("*_JNT" + LAYER_SUFFIX, "*_CTRL" + LAYER_SUFFIX, type="displayLayer") or []
+    return [(layer, "CTRL" if layer.endswith("_CTRL" + LAYER_SUFFIX) else "JNT") for layer in layers]
+
+def _plug(node, attr):
+    selection = om.MSelectionList()
+    selection.add(node)
+    return om.MFnDependencyNode(selection.getDependNode(0)).findPlug(attr, False)
+
+def set_display_mode(mode, measure=False, frames=30):
+    """
+    Switches every registered layer at once, all writes going through one MDGModifier:
+
+    full: everything shown as built.
+    proxy: only the end joint of each chain is drawn, controls draw as bounding boxes.
+    hidden: joint and control layers hidden.
+
+    Entering proxy keeps each joint's drawStyle in a SAVED_DRAW_STYLE_ATTR attribute and
+    leaving it puts that drawStyle back, so styles set by hand or by other tools survive.
+    The switch is one undo step.
+
+    :param mode: One of DISPLAY_MODES.
+    :param measure: Print the viewport FPS before and after switching.
+    :param frames: Viewport redraws per FPS measurement.
+    :return: (fps before, fps after) when measuring, else None.
+    """
+    if mode not in DISPLAY_MODES:
+        cmds.warning(f"Unknown display mode '{mode}', use one of {', '.join(DISPLAY_MODES)}.")
+        return
+    layers = rig_layers()
+    if not layers:
+        cmds.warning("No rig display layers yet, register the rig first.")
+        return
+    before = measure_viewport_fps(frames) if measure else None
+
+    cmds.undoInfo(openChunk=True, chunkName=f"Display mode {mode}")
+    try:
+        modifier = om.MDGModifier()
+        restored = []
+        for layer, kind in layers:
+            modifier.newPlugValueBool(_plug(layer, "visibility"), mode != "hidden")
+            modifier.newPlugValueInt(_plug(layer, "levelOfDetail"), 1 if mode == "proxy" and kind == "CTRL" else 0)
+            if kind != "JNT":
+                continue
+            for joint in cmds.editDisplayLayerMembers(layer, query=True, fullNames=True) or []:
+                if cmds.nodeType(joint) != "joint":
+                    continue
+                in_proxy = cmds.attributeQuery(SAVED_DRAW_STYLE_ATTR, node=joint, exists=True)
+                if mode == "proxy":
+                    if not in_proxy:
+                        cmds.addAttr(joint, longName=SAVED_DRAW_STYLE_ATTR, attributeType="long")
+                        cmds.setAttr(f"{joint}.{SAVED_DRAW_STYLE_ATTR}", cmds.getAttr(f"{joint}.drawStyle"))
+                    end_joint = not cmds.listRelatives(joint, children=True, type="joint")
+                    # drawStyle 0 is bone, 2 is none
+                    modifier.newPlugValueInt(_plug(joint, "drawStyle"), 0 if end_joint else 2)
+                elif in_proxy:
+                    saved = cmds.getAttr(f"{joint}.{SAVED_DRAW_STYLE_ATTR}")
+                    modifier.newPlugValueInt(_plug(joint, "drawStyle"), saved)
+                    restored.append(joint)
+        undoable_modifier.commit(modifier)
+        for joint in restored:
+            cmds.deleteAttr(joint, attribute=SAVED_DRAW_STYLE_ATTR)
+    finally:
+        cmds.undoInfo(closeChunk=True)
+
+    if measure:
+        after = measure_viewport_fps(frames)
+        print(f"Display mode '{mode}': {before:.1f} fps before, {after:.1f} fps after")
+        return before, after
+    print(f"Display mode '{mode}' set on {len(layers)} layer(s)")
+
+def measure_viewport_fps(frames=30):
+    """
+    Times forced redraws of the active viewport.
+
+    :param frames: Number of redraws.
+    :return: Redraws per second (0 in batch mode, where there is no viewport).
+    """
+    if cmds.about(batch=True):
+        return 0.0
+    cmds.refresh(currentView=True, force=True)  # first redraw rebuilds caches, not timed
+    start = time.perf_counter()
+    for _ in range(frames):
+        cmds.refresh(currentView=True, force=True)
+    elapsed = time.perf_counter() - start
+    return frames / elapsed if elapsed else 0.0
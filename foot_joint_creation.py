@@ -1,4 +1,27 @@
 import maya.cmds as cmds
+import maya.api.OpenMaya as om
+import undoable_modifier
+
+# auto radius = this fraction of the mean length of the bones touching the joint
+DEFAULT_RADIUS_SCALE = 0.25
+
+# default world positions of the back toe, foot and toe joints (the guides can move them)
+FOOT_POSITIONS = {
+    "fakeBackToe1_JNT": (43, 86, -73),
+    "fakeBackToe2_JNT": (39, 71, -62),
+    "fakeBackToe3_JNT": (37, 56, -57),
+    "fakeBackToe4_JNT": (35, 37.5, -51),
+    "foot_JNT": (70, 21, -42),
+    "innerToe1_JNT": (49, 15, -19.5),
+    "innerToe2_JNT": (38, 12, -.5),
+    "innerToe3_JNT": (30, 5.5, 23),
+    "midToe1_JNT": (74, 17.5, -13),
+    "midToe2_JNT": (76, 15, 11),
+    "midToe3_JNT": (80, 11, 42),
+    "outterToe1_JNT": (98, 15, -25),
+    "outterToe2_JNT": (110, 11.5, -7),
+    "outterToe3_JNT": (121.5, 8, 15.5),
+}
 
 def create_joint_chain(jntRadi, hipLoc, kneeLoc, ankleLoc):
     # Get the position of the locators
@@ -6,6 +29,22 @@ def create_joint_chain(jntRadi, hipLoc, kneeLoc, ankleLoc):
     kneePos = cmds.xform(kneeLoc, query=True, worldSpace=True, translation=True)
     anklePos = cmds.xform(ankleLoc, query=True, worldSpace=True, translation=True)
 
+    return build_leg_chain(jntRadi, hipPos, kneePos, anklePos)
+
+def build_leg_chain(jntRadi, hipPos, kneePos, anklePos, foot_positions=None):
+    """
+    Builds the hip/knee/ankle chain with the back toe and three toe branches from
+    positions instead of locators, so it can run without any UI or selection.
+
+    :param jntRadi: Radius of every joint in the chain.
+    :param hipPos: (x, y, z) world position of the hip.
+    :param kneePos: (x, y, z) world position of the knee.
+    :param anklePos: (x, y, z) world position of the ankle.
+    :param foot_positions: Joint name -> (x, y, z) for any of the FOOT_POSITIONS joints to move.
+    :return: The root (hip) joint.
+    """
+    foot_positions = dict(FOOT_POSITIONS, **(foot_positions or {}))
+    cmds.select(clear=True)  # Start the chain at the world, not under the selection
     # Creation of the joints for hip, knee, and ankle
     hip = cmds.joint(p=hipPos, name="hip_JNT", radius=jntRadi)
     knee = cmds.joint(p=kneePos, name="knee_JNT", radius=jntRadi)
@@ -13,30 +52,30 @@ def create_joint_chain(jntRadi, hipLoc, kneeLoc, ankleLoc):
     
     # Branch to the fake back toe
     cmds.select(ankle)  # Selection of the ankle joint for proper branching
-    fake_back_toe1 = cmds.joint(p=(43, 86, -73), name="fakeBackToe1_JNT", radius=jntRadi)
-    fake_back_toe2 = cmds.joint(p=(39, 71, -62), name="fakeBackToe2_JNT", radius=jntRadi)
-    fake_back_toe3 = cmds.joint(p=(37, 56, -57), name="fakeBackToe3_JNT", radius=jntRadi)
-    fake_back_toe4 = cmds.joint(p=(35, 37.5, -51), name="fakeBackToe4_JNT", radius=jntRadi)
+    fake_back_toe1 = cmds.joint(p=foot_positions["fakeBackToe1_JNT"], name="fakeBackToe1_JNT", radius=jntRadi)
+    fake_back_toe2 = cmds.joint(p=foot_positions["fakeBackToe2_JNT"], name="fakeBackToe2_JNT", radius=jntRadi)
+    fake_back_toe3 = cmds.joint(p=foot_positions["fakeBackToe3_JNT"], name="fakeBackToe3_JNT", radius=jntRadi)
+    fake_back_toe4 = cmds.joint(p=foot_positions["fakeBackToe4_JNT"], name="fakeBackToe4_JNT", radius=jntRadi)
     
     # Foot for the support of the main toes
     cmds.select(ankle)
-    foot = cmds.joint(p=(70, 21, -42), name="foot_JNT", radius=jntRadi)
+    foot = cmds.joint(p=foot_positions["foot_JNT"], name="foot_JNT", radius=jntRadi)
     
     # All 3 toe branches
     cmds.select(foot)  # Selection for branching
-    inner_toe1 = cmds.joint(p=(49, 15, -19.5), name="innerToe1_JNT", radius=jntRadi)
-    inner_toe2 = cmds.joint(p=(38, 12, -.5), name="innerToe2_JNT", radius=jntRadi)
-    inner_toe3 = cmds.joint(p=(30, 5.5, 23), name="innerToe3_JNT", radius=jntRadi)
+    inner_toe1 = cmds.joint(p=foot_positions["innerToe1_JNT"], name="innerToe1_JNT", radius=jntRadi)
+    inner_toe2 = cmds.joint(p=foot_positions["innerToe2_JNT"], name="innerToe2_JNT", radius=jntRadi)
+    inner_toe3 = cmds.joint(p=foot_positions["innerToe3_JNT"], name="innerToe3_JNT", radius=jntRadi)
     
     cmds.select(foot)  # Select for branch
-    mid_toe1 = cmds.joint(p=(74, 17.5, -13), name="midToe1_JNT", radius=jntRadi)
-    mid_toe2 = cmds.joint(p=(76, 15, 11), name="midToe2_JNT", radius=jntRadi)
-    mid_toe3 = cmds.joint(p=(80, 11, 42), name="midToe3_JNT", radius=jntRadi)
+    mid_toe1 = cmds.joint(p=foot_positions["midToe1_JNT"], name="midToe1_JNT", radius=jntRadi)
+    mid_toe2 = cmds.joint(p=foot_positions["midToe2_JNT"], name="midToe2_JNT", radius=jntRadi)
+    mid_toe3 = cmds.joint(p=foot_positions["midToe3_JNT"], name="midToe3_JNT", radius=jntRadi)
 
     cmds.select(foot)  # Select for branch
-    outter_toe1 = cmds.joint(p=(98, 15, -25), name="outterToe1_JNT", radius=jntRadi)
-    outter_toe2 = cmds.joint(p=(110, 11.5, -7), name="outterToe2_JNT", radius=jntRadi)
-    outter_toe3 = cmds.joint(p=(121.5, 8, 15.5), name="outterToe3_JNT", radius=jntRadi)
+    outter_toe1 = cmds.joint(p=foot_positions["outterToe1_JNT"], name="outterToe1_JNT", radius=jntRadi)
+    outter_toe2 = cmds.joint(p=foot_positions["outterToe2_JNT"], name="outterToe2_JNT", radius=jntRadi)
+    outter_toe3 = cmds.joint(p=foot_positions["outterToe3_JNT"], name="outterToe3_JNT", radius=jntRadi)
 
     # Return the root joint
     return hip
@@ -48,8 +87,86 @@ def change_bone_radius(radius):
         cmds.warning("No joints selected. Please select some joints.")
         return
     
-    # Change the radius of each selected joint
-    for joint in selected_joints:
-        cmds.setAttr(f"{joint}.radius", radius)
+    set_joint_radii(selected_joints, radius)
     
-    print(f"Changed radius of {len(selected_joints)} joint(s) to {radius}")
\ No newline at end of file
+    print(f"Changed radius of {len(selected_joints)} joint(s) to {radius}")
+
+def set_joint_radii(joints, radii):
+    """
+    Sets the radius of any number of joints in one modifier pass, committed with
+    undoable_modifier so it is one undo step.
+
+    :param joints: Joint names or MObjects.
+    :param radii: One radius for all joints, or one per joint.
+    """
+    if isinstance(radii, (int, float)):
+        radii = [radii] * len(joints)
+    modifier = om.MDGModifier()
+    for joint, radius in zip(joints, radii):
+        if isinstance(joint, om.MObject):
+            node = joint
+        else:
+            # one selection list per joint: a shared list merges a joint passed twice
+            selection = om.MSelectionList()
+            selection.add(joint)
+            node = selection.getDependNode(0)
+        modifier.newPlugValueDouble(om.MFnDependencyNode(node).findPlug("radius", False), float(radius))
+    undoable_modifier.commit(modifier)
+
+def auto_joint_radii(positions, parents, scale=DEFAULT_RADIUS_SCALE):
+    """
+    Radius per joint from the lengths of the bones touching it (to its parent and to its children),
+    for a whole hierarchy at once.
+
+    :param positions: (N, 3) array of joint world positions.
+    :param parents: (N,) array of parent indices, -1 for roots.
+    :param scale: Radius as a fraction of the mean adjacent bone length.
+    :return: (N,) array of radii; joints without any bone get the median radius.
+    """
+    # imported here so the leg tools (and the UI importing them) load in a Maya without NumPy
+    import numpy as np
+    positions = np.asarray(positions, dtype=np.float64)
+    parents = np.asarray(parents)
+    count = len(positions)
+    children = np.flatnonzero(parents >= 0)
+    lengths = np.linalg.norm(positions[children] - positions[parents[children]], axis=1)
+
+    # every bone counts for both the child and the parent joint
+    total = np.bincount(children, weights=lengths, minlength=count) + \
+        np.bincount(parents[children], weights=lengths, minlength=count)
+    bones = np.bincount(children, minlength=count) + np.bincount(parents[children], minlength=count)
+    radii = np.zeros(count)
+    has_bones = bones > 0
+    radii[has_bones] = scale * total[has_bones] / bones[has_bones]
+    radii[~has_bones] = np.median(radii[has_bones]) if has_bones.any() else 1.0
+    return radii
+
+def auto_radius_hierarchy(roots, scale=DEFAULT_RADIUS_SCALE):
+    """
+    Gives every joint under the roots a radius from its adjacent bone lengths, so chains with a
+    geometric spread get small joints where they are dense and large ones where they are sparse.
+
+    :param roots: Root joints.
+    :param scale: Radius as a fraction of the mean adjacent bone length.
+    :return: Number of joints changed.
+    """
+    import skeleton_io  # needs NumPy, see auto_joint_radii
+    dag_paths, parents = skeleton_io.collect_hierarchy(roots)
+    joint_rows = [i for i, path in enumerate(dag_paths) if path.hasFn(om.MFn.kJoint)]
+    row_of = {row: i for i, row in enumerate(joint_rows)}
+    # bones only run between joints, groups and controls in between start a new root
+    joint_parents = [row_of.get(parents[row], -1) for row in joint_rows]
+    positions = [om.MTransformationMatrix(dag_paths[row].inclusiveMatrix()).translation(om.MSpace.kWorld)
+                 for row in joint_rows]
+    radii = auto_joint_radii([(p.x, p.y, p.z) for p in positions], joint_parents, scale)
+    set_joint_radii([dag_paths[row].node() for row in joint_rows], radii)
+    return len(joint_rows)
+
+def auto_radius_selected(scale=DEFAULT_RADIUS_SCALE):
+    """Applies auto_radius_hierarchy to the hierarchies of the selected joints."""
+    selected_joints = cmds.ls(selection=True, type='joint')
+    if not selected_joints:
+        cmds.warning("No joints selected. Please select the root joints.")
+        return
+    changed = auto_radius_hierarchy(selected_joints, scale)
+    print(f"Set automatic radius on {changed} joint(s)")
\ No newline at end of file
@@ -0,0 +1,120 @@
+import maya.cmds as cmds
+import json
+import foot_joint_creation
+import joint_chain_calc
+
+GUIDES_GROUP = "GUIDES_GRP"
+GUIDE_SUFFIX = "_GUIDE"
+
+# guide name -> default world position, for a creature at the scale of the foot chain
+DEFAULT_GUIDES = {
+    "hip": (55, 300, -90),
+    "knee": (60, 200, -10),
+    "ankle": (48, 105, -80),
+    "spine_start": (0, 320, -100),
+    "spine_end": (0, 340, 150),
+    "neck_start": (0, 340, 150),
+    "neck_end": (0, 420, 260),
+    "tail_start": (0, 320, -100),
+    "tail_end": (0, 250, -500),
+}
+# the foot and toe guides start where build_leg_chain puts those joints
+DEFAULT_GUIDES.update({name[:-len("_JNT")]: position
+                       for name, position in foot_joint_creation.FOOT_POSITIONS.items()})
+
+# straight chains built between <name>_start and <name>_end: (spread factor, joint count)
+CHAIN_GUIDES = {
+    "spine": (1.0, 6),
+    "neck": (1.0, 6),
+    "tail": (0.5, 12),
+}
+
+def guide_name(name):
+    return name + GUIDE_SUFFIX
+
+def create_guides(positions=None, size=10.0):
+    """
+    Creates the named guide locators under GUIDES_GRP in one go. Guides that already exist
+    are moved, not recreated, so this also resets a creature to given positions.
+
+    :param positions: Guide name -> (x, y, z); defaults to DEFAULT_GUIDES.
+    :param size: Locator display size.
+    :return: List of the guide locators.
+    """
+    positions = dict(DEFAULT_GUIDES, **(positions or {}))
+    if not cmds.objExists(GUIDES_GROUP):
+        cmds.group(empty=True, name=GUIDES_GROUP)
+    guides = []
+    for name, position in positions.items():
+        guide = guide_name(name)
+        if not cmds.objExists(guide):
+            guide = cmds.spaceLocator(name=guide)[0]
+            cmds.setAttr(f"{guide}.localScale", size, size, size)
+            cmds.parent(guide, GUIDES_GROUP)
+        cmds.xform(guide, worldSpace=True, translation=position)
+        guides.append(guide)
+    cmds.select(clear=True)
+    return guides
+
+def read_guides(names=None):
+    """
+    Reads the guide positions with one xform query.
+
+    :param names: Guide names (defaults to every DEFAULT_GUIDES guide).
+    :return: Dictionary of guide name -> (x, y, z), or None when a guide is missing.
+    """
+    names = list(names or DEFAULT_GUIDES)
+    missing = [name for name in names if not cmds.objExists(guide_name(name))]
+    if missing:
+        cmds.warning(f"Missing guide(s): {', '.join(missing)}. Create the guides first.")
+        return None
+    flat = cmds.xform([guide_name(name) for name in names], query=True, worldSpace=True, translation=True)
+    return {name: tuple(flat[3 * i:3 * i + 3]) for i, name in enumerate(names)}
+
+def save_guides(path):
+    """Saves the guide positions to a JSON file."""
+    positions = read_guides()
+    if positions is None:
+        return
+    with open(path, "w") as f:
+        json.dump({name: list(position) for name, position in positions.items()}, f, indent=4)
+    print(f"Saved {len(positions)} guide(s) to {path}")
+
+def load_guides(path):
+    """Creates or moves the guides to the positions in a JSON file from save_guides."""
+    with open(path) as f:
+        positions = json.load(f)
+    return create_guides(positions)
+
+def build_from_guides(joint_radius=1.0, chains=None):
+    """
+    Builds the leg and the spine, neck and tail chains from the guides, without touching the
+    selection or UI: all positions come from one read_guides call.
+
+    :param joint_radius: Radius of every joint.
+    :param chains: Chain name -> (spread factor, joint count); defaults to CHAIN_GUIDES.
+    :return: Dictionary with the hip joint under "leg" and each chain's joints under its name.
+    """
+    positions = read_guides()
+    if positions is None:
+        return
+    foot_positions = {name: positions[name[:-len("_JNT")]] for name in foot_joint_creation.FOOT_POSITIONS}
+    built = {"leg": foot_joint_creation.build_leg_chain(joint_radius, positions["hip"], positions["knee"],
+                                                        positions["ankle"], foot_positions)}
+    for name, (spread_factor, num_points) in (chains or CHAIN_GUIDES).items():
+        built[name] = joint_chain_calc.build_joint_chain(positions[f"{name}_start"], positions[f"{name}_end"],
+                                                         spread_factor, num_points, joint_radius, name_prefix=name)
+    print(f"Built the leg and {len(built) - 1} chain(s) from {len(positions)} guide(s)")
+    return built
+
+def save_guides_file():
+    """Asks for a file and saves the guides to it."""
+    path = cmds.fileDialog2(fileFilter="Guides (*.json)", dialogStyle=2, fileMode=0)
+    if path:
+        save_guides(path[0])
+
+def load_guides_file():
+    """Asks for a guides file and loads it."""
+    path = cmds.fileDialog2(fileFilter="Guides (*.json)", dialogStyle=2, fileMode=1)
+    if path:
+        load_guides(path[0])
@@ -1,5 +1,7 @@
 import maya.cmds as cmds
 import math
+import async_compute
+import build_plan
 
 # Function to calculate points between start and end locators
 def calculate_points_spread(start, end, spread_factor, num_points):
@@ -65,14 +67,86 @@ def create_joint_chain(spread_factor_field, num_points_field, joint_radius_field
     num_points = cmds.intField(num_points_field, query=True, value=True)
     joint_radius = cmds.floatField(joint_radius_field, query=True, value=True)
 
+    joint_chain = build_joint_chain(start, end, spread_factor, num_points, joint_radius)
+
+    print(f"Created joint chain: {joint_chain}")
+    return joint_chain
+
+def build_joint_chain(start, end, spread_factor, num_points, joint_radius, name_prefix="joint", dry_run=False):
+    """
+    Creates the joint chain between two positions without reading the UI or selection.
+
+    :param start: Tuple (x, y, z) for the start point.
+    :param end: Tuple (x, y, z) for the end point.
+    :param spread_factor: Float to determine spacing (0.5 for halving, 1 for equal, 2 for doubling).
+    :param num_points: Total number of joints, including start and end.
+    :param joint_radius: Radius of every joint in the chain.
+    :param name_prefix: Joints are named <name_prefix>_01, <name_prefix>_02, ...
+    :param dry_run: Only print the build plan (see build_plan.execute_plan).
+    :return: List of the created joints from start to end (None for a dry run).
+    """
     points = calculate_points_spread(start, end, spread_factor, num_points)
+    return create_joints_at(points, joint_radius, name_prefix, dry_run)
 
-    cmds.select(clear=True)  # Clear selection before creating joints
-    joint_chain = []
-    for i, position in enumerate(points):
-        joint_name = f"joint_{i + 1:02d}"
-        joint = cmds.joint(name=joint_name, position=position,radius=joint_radius)
-        joint_chain.append(joint)
+def plan_joints_at(points, joint_radius, name_prefix="joint"):
+    """
+    Build plan of a joint chain through points: each joint is parented to the previous one
+    and placed by its translate, the offset from the previous point.
 
-    print(f"Created joint chain: {joint_chain}")
-    
+    :param points: (x, y, z) world positions from start to end.
+    :param joint_radius: Radius of every joint in the chain.
+    :param name_prefix: Joints are named <name_prefix>_01, <name_prefix>_02, ...
+    :return: The BuildPlan.
+    """
+    plan = build_plan.BuildPlan(f"{name_prefix} chain")
+    parent = None
+    previous = (0.0, 0.0, 0.0)
+    for i, point in enumerate(points):
+        joint = plan.create("joint", f"{name_prefix}_{i + 1:02d}", parent=parent)
+        plan.set(joint, "translate", tuple(point[k] - previous[k] for k in range(3)))
+        plan.set(joint, "radius", float(joint_radius))
+        parent, previous = joint, point
+    return plan
+
+def create_joints_at(points, joint_radius, name_prefix="joint", dry_run=False):
+    """
+    Creates a joint chain through already computed points, from one build plan.
+
+    :param points: (x, y, z) world positions from start to end.
+    :param joint_radius: Radius of every joint in the chain.
+    :param name_prefix: Joints are named <name_prefix>_01, <name_prefix>_02, ...
+    :param dry_run: Only print the build plan (see build_plan.execute_plan).
+    :return: List of the created joints from start to end (None for a dry run).
+    """
+    names = build_plan.execute_plan(plan_joints_at(points, joint_radius, name_prefix), dry_run)
+    if names is None:
+        return None
+    return [names[f"{name_prefix}_{i + 1:02d}"] for i in range(len(points))]
+
+def create_joint_chain_async(spread_factor_field, num_points_field, joint_radius_field, button=None):
+    """
+    create_joint_chain with the spacing math on a worker thread: the locator positions and
+    field values are read up front, the joints are created once the points are ready.
+    """
+    selected = cmds.ls(selection=True, transforms=True)
+
+    if len(selected) != 2:
+        cmds.warning("Please select exactly two locators or transforms.")
+        return
+
+    snapshot = {
+        "start": cmds.xform(selected[0], query=True, translation=True, worldSpace=True),
+        "end": cmds.xform(selected[1], query=True, translation=True, worldSpace=True),
+        "spread_factor": cmds.floatField(spread_factor_field, query=True, value=True),
+        "num_points": cmds.intField(num_points_field, query=True, value=True),
+    }
+    joint_radius = cmds.floatField(joint_radius_field, query=True, value=True)
+
+    def compute(data):
+        return calculate_points_spread(data["start"], data["end"], data["spread_factor"], data["num_points"])
+
+    def apply(points):
+        joint_chain = create_joints_at(points, joint_radius)
+        print(f"Created joint chain: {joint_chain}")
+
+    async_compute.submit("joint_chain", compute, snapshot, apply, button=button)
@@ -1,5 +1,11 @@
 import maya.cmds as cmds
+import maya.api.OpenMaya as om
+import bisect
 import math
+import async_compute
+import batch_progress
+import joint_chain_calc
+import mesh_center
 
 def chain_on_curve(spread_factor_field, num_points_field, joint_radius_field):
     """
@@ -25,34 +31,315 @@ def chain_on_curve(spread_factor_field, num_points_field, joint_radius_field):
         cmds.error("Selected object is not a NURBS curve.")
         return
     
-    # Get the start and end parameter range of the curve
-    start_param = cmds.getAttr("{}.minValue".format(curve_name))
-    end_param = cmds.getAttr("{}.maxValue".format(curve_name))
-    
-    # Compute spread-adjusted parameter range
-    param_range = (end_param - start_param) * spread_factor
-    param_step = param_range / (num_points - 1)
-    
-    # Create joints along the curve
-    cmds.select(clear=True)
-    joint_chain = []
-    for i in range(num_points):
-        # Calculate parameter value for each joint
-        param = start_param + i * param_step
-        
-        # Get position on the curve at the parameter
-        pos = cmds.pointOnCurve(curve_name, pr=param, p=True)
-        
-        # Create joint at the position with specified radius
-        joint_name = f"joint_{i + 1:02d}"
-        joint = cmds.joint(name=joint_name, position=pos, radius=joint_radius)
-        joint_chain.append(joint)
+    joint_chain = build_chain_on_curve(curve_name, spread_factor, num_points, joint_radius)
     
     print("Created {} joints along the curve '{}'.".format(num_points, curve_name))
+    return joint_chain
+
+def build_chain_on_curve(curve_name, spread_factor, num_points, joint_radius, name_prefix="joint", dry_run=False):
+    """
+    Creates a joint chain along a named curve without reading the UI or selection. The curve
+    is read once (snapshot_curve) and the joints are made from one build plan.
+
+    :param curve_name: Transform of the NURBS curve to follow.
+    :param spread_factor: Portion of the curve's parameter range to cover (1 for the whole curve).
+    :param num_points: Total number of joints, including start and end.
+    :param joint_radius: Radius of every joint in the chain.
+    :param name_prefix: Joints are named <name_prefix>_01, <name_prefix>_02, ...
+    :param dry_run: Only print the build plan (see build_plan.execute_plan).
+    :return: List of the created joints from start to end (None for a dry run).
+    """
+    snapshot = snapshot_curve(curve_name)
+    positions = evaluate_curve_snapshot(snapshot, snapshot_params(snapshot, num_points, spread_factor))
+    return joint_chain_calc.create_joints_at(positions, joint_radius, name_prefix, dry_run)
+    
+def sample_curve(curve_name, samples):
+    """
+    Samples a curve at evenly spaced parameters (the same stepping chain_on_curve uses).
+
+    :param curve_name: Transform of the NURBS curve.
+    :param samples: Number of samples, including both ends.
+    :return: List of (x, y, z) world positions.
+    """
+    selection = om.MSelectionList()
+    selection.add(curve_name)
+    curve_fn = om.MFnNurbsCurve(selection.getDagPath(0).extendToShape())
+    start_param, end_param = curve_fn.knotDomain
+    step = (end_param - start_param) / (samples - 1)
+    points = []
+    for i in range(samples):
+        point = curve_fn.getPointAtParam(start_param + i * step, om.MSpace.kWorld)
+        points.append((point.x, point.y, point.z))
+    return points
+
+def _segment_error(points, a, b):
+    """
+    How far a straight bone from points[a] to points[b] strays from the sampled curve between them.
+
+    :return: (largest angle in degrees between the bone and the curve direction, largest distance
+             of a curve sample from the bone)
+    """
+    bone = [points[b][k] - points[a][k] for k in range(3)]
+    bone_length = math.sqrt(sum(c * c for c in bone))
+    if bone_length == 0:
+        return 0.0, 0.0
+    bone = [c / bone_length for c in bone]
+    max_angle = 0.0
+    max_chord = 0.0
+    for i in range(a, b):
+        step = [points[i + 1][k] - points[i][k] for k in range(3)]
+        step_length = math.sqrt(sum(c * c for c in step))
+        if step_length:
+            cos_angle = sum(step[k] * bone[k] for k in range(3)) / step_length
+            max_angle = max(max_angle, math.degrees(math.acos(max(-1.0, min(1.0, cos_angle)))))
+        if i > a:
+            offset = [points[i][k] - points[a][k] for k in range(3)]
+            along = sum(offset[k] * bone[k] for k in range(3))
+            max_chord = max(max_chord, math.sqrt(max(0.0, sum(c * c for c in offset) - along * along)))
+    return max_angle, max_chord
+
+def _within(points, a, b, max_angle, chord_tolerance):
+    angle, chord = _segment_error(points, a, b)
+    return (max_angle is None or angle <= max_angle) and (chord_tolerance is None or chord <= chord_tolerance)
+
+def _greedy_indices(points, max_angle, chord_tolerance):
+    """Longest bones that stay within tolerance, walking from the start of the curve."""
+    indices = [0]
+    start = 0
+    for end in range(2, len(points)):
+        if not _within(points, start, end, max_angle, chord_tolerance):
+            start = end - 1
+            indices.append(start)
+    indices.append(len(points) - 1)
+    return indices
+
+def _uniform_indices(sample_count, num_points):
+    return [round(i * (sample_count - 1) / (num_points - 1)) for i in range(num_points)]
+
+def _uniform_joints_needed(points, max_angle, chord_tolerance):
+    """Fewest uniformly spaced joints that meet the same tolerance."""
+    def meets(num_points):
+        indices = _uniform_indices(len(points), num_points)
+        return all(_within(points, a, b, max_angle, chord_tolerance) for a, b in zip(indices, indices[1:]))
+
+    high = 2
+    while high < len(points) and not meets(high):
+        high *= 2
+    high = min(high, len(points))
+    low = high // 2 + 1 if high > 2 else 2
+    while low < high:
+        middle = (low + high) // 2
+        if meets(middle):
+            high = middle
+        else:
+            low = middle + 1
+    return high
+
+def adaptive_curve_indices(points, max_angle=10.0, chord_tolerance=None, min_joints=2, max_joints=None):
+    """
+    Picks which curve samples get a joint so that no bone deviates from the curve by more than
+    max_angle degrees or chord_tolerance units: joints bunch up where the curve bends and thin
+    out on straight stretches.
+
+    :param points: Samples along the curve (see sample_curve).
+    :param max_angle: Largest angle between a bone and the curve it replaces, or None.
+    :param chord_tolerance: Largest distance between a bone and the curve it replaces, or None.
+    :param min_joints: Fewest joints to place.
+    :param max_joints: Most joints to place (tolerances are relaxed to fit), or None.
+    :return: Sorted sample indices, including the first and last sample.
+    """
+    indices = _greedy_indices(points, max_angle, chord_tolerance)
+
+    if max_joints and len(indices) > max_joints:
+        # relax both tolerances by the smallest factor that fits the joint budget
+        low, high = 1.0, 2.0
+        scale = lambda value, factor: None if value is None else value * factor
+        while len(_greedy_indices(points, scale(max_angle, high), scale(chord_tolerance, high))) > max_joints:
+            low, high = high, high * 2
+            if high > 1e6:
+                break
+        for _ in range(20):
+            middle = (low + high) / 2
+            if len(_greedy_indices(points, scale(max_angle, middle), scale(chord_tolerance, middle))) > max_joints:
+                low = middle
+            else:
+                high = middle
+        indices = _greedy_indices(points, scale(max_angle, high), scale(chord_tolerance, high))
+        indices = indices[:max_joints - 1] + [len(points) - 1] if len(indices) > max_joints else indices
+
+    while len(indices) < min(min_joints, len(points)):
+        # split the longest bone in the middle
+        gaps = [(b - a, i) for i, (a, b) in enumerate(zip(indices, indices[1:]))]
+        gap, i = max(gaps)
+        if gap < 2:
+            break
+        indices.insert(i + 1, indices[i] + gap // 2)
+    return indices
+
+def plan_adaptive_chain(points, max_angle=10.0, chord_tolerance=None, min_joints=2, max_joints=None):
+    """
+    Pure math half of build_adaptive_chain_on_curve, safe to run off the main thread.
+
+    :param points: Samples along the curve (see sample_curve).
+    :return: (joint positions, report) where the report holds the adaptive and equal fidelity
+             uniform joint counts.
+    """
+    indices = adaptive_curve_indices(points, max_angle, chord_tolerance, min_joints, max_joints)
+
+    # what the chain actually achieves, and how many uniform joints reach the same
+    errors = [_segment_error(points, a, b) for a, b in zip(indices, indices[1:])]
+    achieved_angle = max(angle for angle, _ in errors)
+    achieved_chord = max(chord for _, chord in errors)
+    uniform = _uniform_joints_needed(points, achieved_angle if max_angle is not None else None,
+                                     achieved_chord if chord_tolerance is not None else None)
+    report = {"joints": len(indices), "uniform_joints": uniform, "saved": uniform - len(indices),
+              "max_angle": achieved_angle, "max_chord": achieved_chord}
+    return [points[index] for index in indices], report
+
+def _print_adaptive_report(curve_name, report):
+    print(f"Created {report['joints']} adaptive joints along '{curve_name}' (uniform spacing needs "
+          f"{report['uniform_joints']} for the same fidelity, {report['saved']} saved).")
+
+def build_adaptive_chain_on_curve(curve_name, joint_radius, max_angle=10.0, chord_tolerance=None,
+                                  min_joints=2, max_joints=None, samples=500, name_prefix="joint"):
+    """
+    Creates a joint chain along a named curve with curvature adaptive spacing instead of the
+    fixed count of build_chain_on_curve.
+
+    :param curve_name: Transform of the NURBS curve to follow.
+    :param joint_radius: Radius of every joint in the chain.
+    :param max_angle: Largest angle in degrees between a bone and the curve, or None.
+    :param chord_tolerance: Largest distance between a bone and the curve, or None.
+    :param min_joints: Fewest joints to place.
+    :param max_joints: Most joints to place, or None.
+    :param samples: How finely the curve is sampled; joints always land on a sample.
+    :param name_prefix: Joints are named <name_prefix>_01, <name_prefix>_02, ...
+    :return: (joints, report) where the report holds the adaptive and equal fidelity uniform joint counts.
+    """
+    points = sample_curve(curve_name, samples)
+    positions, report = plan_adaptive_chain(points, max_angle, chord_tolerance, min_joints, max_joints)
+    joint_chain = joint_chain_calc.create_joints_at(positions, joint_radius, name_prefix)
+    _print_adaptive_report(curve_name, report)
+    return joint_chain, report
+
+def snapshot_curve(curve_name):
+    """
+    Copies what is needed to evaluate a curve into plain Python data, so the curve can be
+    evaluated on a worker thread with evaluate_curve_snapshot.
+
+    :param curve_name: Transform of the NURBS curve.
+    :return: Dictionary with the world space CVs, Maya's knot vector and the degree.
+    """
+    selection = om.MSelectionList()
+    selection.add(curve_name)
+    curve_fn = om.MFnNurbsCurve(selection.getDagPath(0).extendToShape())
+    return {
+        "cvs": [(p.x, p.y, p.z) for p in curve_fn.cvPositions(om.MSpace.kWorld)],
+        "knots": list(curve_fn.knots()),
+        "degree": curve_fn.degree,
+    }
+
+def evaluate_curve_snapshot(snapshot, params):
+    """
+    Positions on a snapshotted curve at the given parameters (de Boor's algorithm). Handles
+    the non-rational curves the curve tools draw; no Maya calls, safe off the main thread.
+
+    :param snapshot: Dictionary from snapshot_curve.
+    :param params: Curve parameters inside the knot domain.
+    :return: List of (x, y, z) world positions.
+    """
+    cvs = snapshot["cvs"]
+    degree = snapshot["degree"]
+    # Maya stores knots without the two outer ones of the textbook vector
+    knots = [snapshot["knots"][0]] + snapshot["knots"] + [snapshot["knots"][-1]]
+    last_span = len(cvs) - 1
+    positions = []
+    for param in params:
+        span = min(max(bisect.bisect_right(knots, param) - 1, degree), last_span)
+        d = [list(cvs[span - degree + j]) for j in range(degree + 1)]
+        for r in range(1, degree + 1):
+            for j in range(degree, r - 1, -1):
+                left = knots[span - degree + j]
+                denominator = knots[span + 1 + j - r] - left
+                alpha = (param - left) / denominator if denominator else 0.0
+                d[j] = [(1.0 - alpha) * d[j - 1][k] + alpha * d[j][k] for k in range(3)]
+        positions.append(tuple(d[degree]))
+    return positions
+
+def snapshot_params(snapshot, count, spread_factor=1.0):
+    """count parameters stepped evenly over spread_factor of the snapshot's knot domain."""
+    knots = snapshot["knots"]
+    start_param = knots[snapshot["degree"] - 1]
+    end_param = knots[len(snapshot["cvs"]) - 1]
+    step = (end_param - start_param) * spread_factor / (count - 1)
+    return [start_param + i * step for i in range(count)]
+
+def chain_on_curve_async(spread_factor_field, num_points_field, joint_radius_field, button=None, center_mesh=None):
+    """
+    chain_on_curve with the curve evaluation on a worker thread: the curve and field values
+    are snapshotted up front, the joints are created once the positions are ready. With a
+    center_mesh the positions are first moved to the middle of that mesh's volume
+    (mesh_center.center_positions_in_mesh, on the main thread).
+    """
+    spread_factor = cmds.floatField(spread_factor_field, query=True, value=True)
+    num_points = cmds.intField(num_points_field, query=True, value=True)
+    joint_radius = cmds.floatField(joint_radius_field, query=True, value=True)
+
+    selected = cmds.ls(selection=True, transforms=True)
+    if len(selected) != 1 or not cmds.listRelatives(selected[0], shapes=True, type="nurbsCurve"):
+        cmds.warning("Please select exactly one curve.")
+        return
+    curve_name = selected[0]
+    snapshot = snapshot_curve(curve_name)
+
+    def compute(curve):
+        return evaluate_curve_snapshot(curve, snapshot_params(curve, num_points, spread_factor))
+
+    def apply(positions):
+        if center_mesh:
+            positions = mesh_center.center_positions_in_mesh(center_mesh, positions)
+        joint_chain_calc.create_joints_at(positions, joint_radius)
+        print("Created {} joints along the curve '{}'.".format(num_points, curve_name))
+
+    async_compute.submit("chain_on_curve", compute, snapshot, apply, button=button)
+
+def chain_on_curve_adaptive(max_angle_field, chord_tolerance_field, min_joints_field, max_joints_field,
+                            joint_radius_field, button=None, samples=500):
+    """
+    Creates a curvature adaptive joint chain along the selected curve from the UI fields.
+    A chord tolerance or max joint count of 0 means no limit. Sampling and placement run on a
+    worker thread; the joints are created once the plan is ready.
+    """
+    max_angle = cmds.floatField(max_angle_field, query=True, value=True) or None
+    chord_tolerance = cmds.floatField(chord_tolerance_field, query=True, value=True) or None
+    min_joints = max(cmds.intField(min_joints_field, query=True, value=True), 2)
+    max_joints = cmds.intField(max_joints_field, query=True, value=True) or None
+    joint_radius = cmds.floatField(joint_radius_field, query=True, value=True)
+
+    selected = cmds.ls(selection=True, transforms=True)
+    if len(selected) != 1 or not cmds.listRelatives(selected[0], shapes=True, type="nurbsCurve"):
+        cmds.warning("Please select exactly one curve.")
+        return
+    curve_name = selected[0]
+    snapshot = snapshot_curve(curve_name)
+
+    def compute(curve):
+        points = evaluate_curve_snapshot(curve, snapshot_params(curve, samples))
+        return plan_adaptive_chain(points, max_angle, chord_tolerance, min_joints, max_joints)
+
+    def apply(plan):
+        positions, report = plan
+        joint_chain_calc.create_joints_at(positions, joint_radius)
+        _print_adaptive_report(curve_name, report)
+
+    async_compute.submit("chain_on_curve_adaptive", compute, snapshot, apply, button=button)
     
-def create_controls(positions, normal, size):
+def create_controls(positions, normal, size, prefix=None):
     controls = []
     control_names = ["start_CTRL", "mid_CTRL", "end_CTRL"]
+    if prefix:
+        # e.g. one set per ribbon, so a second ribbon's controls do not clash
+        control_names = [f"{prefix}_{name}" for name in control_names]
 
     for i, name in enumerate(control_names):
         ctrl = cmds.circle(name=name, normal=normal, radius=size)[0]
@@ -77,7 +364,7 @@ def create_curve_from_joints():
 
     # Step 3: Create a curve through the joint positions
     curve = cmds.curve(d=3, p=joint_positions)  # Degree 3 curve through the joint positions
-    cmds.rename(curve, "generatedCurve")
+    curve = cmds.rename(curve, "generatedCurve")
 
     return curve
 def cluster_cv_on_selected_curve():
@@ -92,25 +379,34 @@ def cluster_cv_on_selected_curve():
         cmds.warning("Please select exactly one curve.")
         return
     
-    curve_name = selected[0]
-    
+    return cluster_curve_cvs(selected[0])
+
+def cluster_curve_cvs(curve_name):
+    """
+    Clusters each control vertex (CV) on the named curve and parents the clusters to the curve.
+
+    :param curve_name: Transform of the NURBS curve to cluster.
+    :return: List of the created cluster handles, one per CV.
+    """
     # Step 2: Get the CVs of the curve
     cvs = cmds.ls(f"{curve_name}.cv[*]", flatten=True)
     
     # Step 3: Create clusters for each CV
     clusters = []
 
-    # Create a cluster for each CV
-    for cv in cvs:
+    # Create a cluster for each CV, hidden (cleanup) as it is made
+    def cluster_cv(cv):
         cluster = cmds.cluster(cv)[1]
-        cmds.parent(cluster, curve_name)
+        cluster = cmds.parent(cluster, curve_name)[0]
+        cmds.setAttr(f"{cluster}.visibility", 0)
         clusters.append(cluster)
 
-    # Optional: Hide the clusters (cleanup)
-    for cluster in clusters:
-        cmds.setAttr(f"{cluster}.visibility", 0)
+    result = batch_progress.run_chunked(cvs, cluster_cv, title="Cluster Curve")
+    if result["cancelled"]:
+        return []
 
     print(f"Created clusters for {len(cvs)} CVs successfully!")
+    return clusters
 
 ROTATE_ORDERS = ['xyz', 'yzx', 'zxy', 'xzy', 'yxz', 'zyx']
 
@@ -180,8 +476,7 @@ def joint_children_rotation_order(new_order, change_children_joints):
         else:
             cmds.warning(f"Object '{obj}' does not exist in the scene.")
 
-    for obj in selected_objects:
-        change_rotation_order(obj)
+    batch_progress.run_chunked(selected_objects, change_rotation_order, title="Rotation Order")
 
     return
 def change_curve_rotation_order(new_order):
@@ -0,0 +1,167 @@
+import maya.cmds as cmds
+import maya.api.OpenMaya as om
+import maya.utils
+import joint_chain_calc
+import joint_spline_chain
+
+MOVE_TOLERANCE = 1e-5
+
+# key -> live chain state, see _register
+_live_chains = {}
+_dirty = set()
+_flush_scheduled = False
+
+def _dependency_node(name):
+    selection = om.MSelectionList()
+    selection.add(name)
+    return selection.getDependNode(0)
+
+def _world_position(name):
+    return cmds.xform(name, query=True, worldSpace=True, translation=True)
+
+def _on_change(*args):
+    """Callback body: only marks the chain dirty, the work happens once per idle in _flush."""
+    global _flush_scheduled
+    _dirty.add(args[-1])
+    if not _flush_scheduled:
+        _flush_scheduled = True
+        maya.utils.executeDeferred(_flush)
+
+def _flush():
+    """Recomputes every chain dirtied since the last idle tick and moves its joints."""
+    global _flush_scheduled
+    _flush_scheduled = False
+    keys = list(_dirty)
+    _dirty.clear()
+    for key in keys:
+        if key in _live_chains:
+            _update(key)
+
+def _update(key):
+    state = _live_chains[key]
+    # a deleted joint or source ends the live chain instead of failing on every idle tick
+    if not all(handle.isValid() for handle in state["handles"] + state["source_handles"]):
+        print(f"Live chain '{key}' disabled: one of its joints or sources was deleted")
+        disable_live_chain(key)
+        return
+    positions = state["compute"]()
+
+    # joints are only translated, so every parent keeps its rotation and the local
+    # translate is the world offset from the parent through the stored parent inverse
+    changed = [max(abs(position[k] - last[k]) for k in range(3)) > MOVE_TOLERANCE
+               for position, last in zip(positions, state["positions"])]
+    modifier = om.MDGModifier()
+    moved = 0
+    for i, position in enumerate(positions):
+        # a joint whose parent moved needs a new local translate even if it stays put
+        if not changed[i] and (i == 0 or not changed[i - 1]):
+            continue
+        if i == 0:
+            local = om.MPoint(position) * state["parent_inverse"][0]
+        else:
+            offset = om.MVector(position) - om.MVector(positions[i - 1])
+            local = offset * state["parent_inverse"][i]
+        node_fn = om.MFnDependencyNode(state["handles"][i].object())
+        for axis, value in zip("XYZ", (local.x, local.y, local.z)):
+            modifier.newPlugValueDouble(node_fn.findPlug("translate" + axis, False), value)
+        moved += 1
+    if moved:
+        modifier.doIt()
+    state["positions"] = positions
+
+def _register(key, joints, sources, compute):
+    """Stores the chain state and adds the callbacks on its sources."""
+    disable_live_chain(key)
+    parent_inverse = []
+    for joint in joints:
+        parent_inverse.append(om.MMatrix(cmds.getAttr(f"{joint}.parentInverseMatrix[0]")))
+    callbacks = []
+    for source in sources:
+        obj = _dependency_node(source)
+        callbacks.append(om.MNodeMessage.addAttributeChangedCallback(obj, _on_change, key))
+        callbacks.append(om.MNodeMessage.addNodeDirtyCallback(obj, _on_change, key))
+    _live_chains[key] = {
+        "joints": list(joints),
+        "sources": list(sources),
+        "handles": [om.MObjectHandle(_dependency_node(joint)) for joint in joints],
+        "source_handles": [om.MObjectHandle(_dependency_node(source)) for source in sources],
+        "parent_inverse": parent_inverse,
+        "compute": compute,
+        "positions": [tuple(_world_position(joint)) for joint in joints],
+        "callbacks": callbacks,
+    }
+    print(f"Live chain '{key}': {len(joints)} joint(s) follow {', '.join(sources)}")
+    return key
+
+def enable_live_chain(joints, start, end, spread_factor=1.0):
+    """
+    Keeps a chain from joint_chain_calc.create_joint_chain on the line between two locators:
+    moving either locator re-spreads the joints with calculate_points_spread.
+
+    Callbacks on the locators only mark the chain dirty; however many events a drag sends,
+    the chain is recomputed once per idle tick and only the joints that actually moved are
+    written, in one MDGModifier.
+
+    :param joints: Chain joints from start to end.
+    :param start: Start locator.
+    :param end: End locator.
+    :param spread_factor: Spread the chain was built with.
+    :return: Key of the live chain (for disable_live_chain).
+    """
+    def compute():
+        return joint_chain_calc.calculate_points_spread(_world_position(start), _world_position(end),
+                                                        spread_factor, len(joints))
+    return _register(joints[0], joints, [start, end], compute)
+
+def enable_live_curve_chain(joints, curve, spread_factor=1.0):
+    """
+    Keeps a chain from joint_spline_chain.chain_on_curve on its curve while the curve or its
+    CVs move, evaluated from a snapshot of the curve (see enable_live_chain for the update).
+
+    :param joints: Chain joints from start to end.
+    :param curve: Curve transform the chain was built on.
+    :param spread_factor: Spread the chain was built with.
+    :return: Key of the live chain (for disable_live_chain).
+    """
+    shape = cmds.listRelatives(curve, shapes=True, type="nurbsCurve", fullPath=True)[0]
+
+    def compute():
+        snapshot = joint_spline_chain.snapshot_curve(curve)
+        params = joint_spline_chain.snapshot_params(snapshot, len(joints), spread_factor)
+        return joint_spline_chain.evaluate_curve_snapshot(snapshot, params)
+    return _register(joints[0], joints, [curve, shape], compute)
+
+def disable_live_chain(key):
+    """Removes the callbacks of a live chain; the joints stay where they are."""
+    state = _live_chains.pop(key, None)
+    if state:
+        om.MMessage.removeCallbacks(state["callbacks"])
+    _dirty.discard(key)
+
+def disable_all_live_chains():
+    for key in list(_live_chains):
+        disable_live_chain(key)
+    print("Live chains disabled")
+
+def live_chains():
+    """Keys and sources of the live chains."""
+    return {key: state["sources"] for key, state in _live_chains.items()}
+
+def enable_live_on_selection(spread_factor=1.0):
+    """
+    Makes the chain under the selected root joint live, following either the selected curve
+    or the two selected locators (start first).
+    """
+    root = cmds.ls(selection=True, type="joint")
+    others = [node for node in cmds.ls(selection=True, type="transform") if node not in root]
+    if not root:
+        cmds.warning("Please select the root joint of the chain and its curve or two locators.")
+        return
+    # allDescendents lists the deepest joint first
+    joints = [root[0]] + list(reversed(cmds.listRelatives(root[0], allDescendents=True, type="joint") or []))
+    curves = [node for node in others if cmds.listRelatives(node, shapes=True, type="nurbsCurve")]
+    if curves:
+        return enable_live_curve_chain(joints, curves[0], spread_factor)
+    if len(others) == 2:
+        return enable_live_chain(joints, others[0], others[1], spread_factor)
+    cmds.warning("Please select the root joint of the chain and its curve or two locators.")
@@ -3,6 +3,19 @@ import controlJoint_creation
 import foot_joint_creation
 import joint_chain_calc
 import joint_spline_chain
+import skeleton_io
+import rig_analyzer
+import ribbon_chain
+import spline_ik_setup
+import skin_binding
+import pose_library
+import reverse_foot
+import mesh_center
+import display_lod
+import rig_snapshot
+import guide_rig
+import live_chain
+import twist_joints
 
 def create_ui():
     # Check if the window exists
@@ -22,6 +35,15 @@ def create_ui():
     # Input for joint radius
     cmds.text(label="Joint Radius:")
     joint_radius_field = cmds.floatField(minValue=0.1, value=1.0)
+
+    # Guides: named locators for the whole creature, no selection needed to build
+    cmds.text(label="\n---[GUIDES]--\n")
+    cmds.button(label="Create / Reset Guides", command=lambda x: guide_rig.create_guides())
+    cmds.button(label="Save Guides", command=lambda x: guide_rig.save_guides_file())
+    cmds.button(label="Load Guides", command=lambda x: guide_rig.load_guides_file())
+    cmds.button(label="Build Leg, Spine, Neck and Tail From Guides", command=lambda x: guide_rig.build_from_guides(
+        cmds.floatField(joint_radius_field, query=True, value=True)))
+    cmds.text(label="\n---[LOCATOR PICKING]--\n")
     
     # Instructions for user
     cmds.text(label="1. Select the Hip Locator, then click the button.")
@@ -66,6 +88,20 @@ def create_ui():
     cmds.button(label="Create Foot Joint Chain", command=on_create_button_click)
     radius_field = cmds.textFieldGrp(label="New Selected Joint Radius", text="1.0")
     cmds.button(label="Apply Radius", command=lambda x: apply_radius(radius_field))
+    auto_radius_field = cmds.floatFieldGrp(label="Radius / Bone Length", value1=foot_joint_creation.DEFAULT_RADIUS_SCALE)
+    cmds.button(label="Auto Radius From Bone Length (select root joints)", command=lambda x: foot_joint_creation.auto_radius_selected(
+        cmds.floatFieldGrp(auto_radius_field, query=True, value1=True)))
+    cmds.text(label="\n---[REVERSE FOOT]--\n")
+    toe_break_field = cmds.floatFieldGrp(label="Toe Break Angle", value1=30.0)
+    cmds.button(label="Create Reverse Foot (select hip joint)", command=lambda x: reverse_foot.create_reverse_foot_on_selection(
+        cmds.floatFieldGrp(toe_break_field, query=True, value1=True)))
+    cmds.text(label="\n---[TWIST JOINTS]--\n")
+    twist_count_field = cmds.intFieldGrp(label="Thigh / Shin Twist Joints", numberOfFields=2, value1=3, value2=3)
+    twist_spread_field = cmds.floatFieldGrp(label="Twist Spread Factor", value1=1.0)
+    cmds.button(label="Add Leg Twist Joints (select hip joint)", command=lambda x: twist_joints.add_leg_twist_on_selection(
+        cmds.intFieldGrp(twist_count_field, query=True, value1=True),
+        cmds.intFieldGrp(twist_count_field, query=True, value2=True),
+        cmds.floatFieldGrp(twist_spread_field, query=True, value1=True)))
     cmds.setParent('..')
     
 
@@ -238,6 +274,15 @@ def create_ui():
     # Button to position the NURBS surface
     cmds.button(label="Position NURBS Surface", command=on_position_nurbs_click)
 
+    # Bulk pairing: every control named after its joint (selected controls only if any are selected)
+    cmds.text(label="\nControl Name Pattern:")
+    pair_pattern_field = cmds.textField(text="{joint}_CTRL")
+    def on_pair_controls_click(*args):
+        selected = [obj for obj in cmds.ls(selection=True, type="transform")
+                    if cmds.listRelatives(obj, shapes=True, type=["nurbsCurve", "nurbsSurface"])]
+        controlJoint_creation.pair_controls_with_joints(selected or None, cmds.textField(pair_pattern_field, query=True, text=True))
+    cmds.button(label="Position All Controls On Joints (by name)", command=on_pair_controls_click)
+
     cmds.text(label="\n")
     #--------------------------------------------------------------------------------------------Hex color any control
     cmds.text(label="Enter Hex Color Code (e.g., #FF5733):")
@@ -286,6 +331,12 @@ def create_ui():
         controlJoint_creation.create_locator_at_pivot()
     cmds.text(label="\nPlace locator at piviot point ")
     cmds.button(label="Create Control Locator", command=on_createLocator_button_click)
+
+    cmds.text(label="\n---[POSE LIBRARY]--\n")
+    cmds.button(label="Save Pose (selected controls, or all _CTRL)", command=lambda x: pose_library.save_selected_pose())
+    pose_weight_slider = cmds.floatSliderGrp(label="Blend", field=True, minValue=0.0, maxValue=1.0, value=1.0)
+    cmds.button(label="Apply Pose File", command=lambda x: pose_library.apply_pose_file(
+        cmds.floatSliderGrp(pose_weight_slider, query=True, value=True)))
         
     cmds.setParent('..')
     
@@ -309,14 +360,53 @@ def create_ui():
 
     # Button for creating the joint chain
     cmds.text(label="\n Linear Path Joint Chain (2 locators):")  
-    cmds.button(label="Create Joint Chain", command=lambda x: joint_chain_calc.create_joint_chain(
-        spread_factor_field, num_points_field, jointChain_radius_field))
+    # the chain buttons compute on a worker thread and show a pending state until the joints are made
+    chain_button = cmds.button(label="Create Joint Chain")
+    cmds.button(chain_button, edit=True, command=lambda x: joint_chain_calc.create_joint_chain_async(
+        spread_factor_field, num_points_field, jointChain_radius_field, button=chain_button))
     cmds.text(label="\n Non Linear Path Joint Chain(Select a curve):")    
-    cmds.button(label="Create Joint Chain Along Curve", command=lambda x:joint_spline_chain.chain_on_curve(spread_factor_field, num_points_field, jointChain_radius_field))
+    cmds.text(label="Center In Mesh (optional):")
+    center_mesh_field = cmds.textField()
+    def on_select_center_mesh(*args):
+        meshes = [obj for obj in cmds.ls(selection=True, type="transform") if cmds.listRelatives(obj, shapes=True, type="mesh")]
+        cmds.textField(center_mesh_field, edit=True, text=meshes[0] if meshes else "")
+    cmds.button(label="Use Selected Mesh", command=on_select_center_mesh)
+    curve_chain_button = cmds.button(label="Create Joint Chain Along Curve")
+    cmds.button(curve_chain_button, edit=True, command=lambda x: joint_spline_chain.chain_on_curve_async(
+        spread_factor_field, num_points_field, jointChain_radius_field, button=curve_chain_button,
+        center_mesh=cmds.textField(center_mesh_field, query=True, text=True) or None))
+    cmds.button(label="Center Chain In Mesh (select mesh + root joint)", command=lambda x: mesh_center.center_selected_chain_in_mesh())
+    cmds.text(label="\n Live Update (select root joint + curve, or root joint + start/end locators):")
+    cmds.button(label="Make Chain Live", command=lambda x: live_chain.enable_live_on_selection(
+        cmds.floatField(spread_factor_field, query=True, value=True)))
+    cmds.button(label="Stop All Live Chains", command=lambda x: live_chain.disable_all_live_chains())
+    cmds.text(label="\n Curvature Adaptive Joint Chain (Select a curve):")
+    cmds.text(label="Max Bend Angle Per Joint (degrees):")
+    max_angle_field = cmds.floatField(minValue=0.0, value=10.0)
+    cmds.text(label="Max Distance From Curve (0 = off):")
+    chord_tolerance_field = cmds.floatField(minValue=0.0, value=0.0)
+    cmds.text(label="Min / Max Joints (0 = no max):")
+    min_joints_field = cmds.intField(minValue=2, value=2)
+    max_joints_field = cmds.intField(minValue=0, value=0)
+    adaptive_chain_button = cmds.button(label="Create Adaptive Joint Chain Along Curve")
+    cmds.button(adaptive_chain_button, edit=True, command=lambda x: joint_spline_chain.chain_on_curve_adaptive(
+        max_angle_field, chord_tolerance_field, min_joints_field, max_joints_field, jointChain_radius_field,
+        button=adaptive_chain_button))
     
     cmds.text(label="\n---[SPLINE IK CONTROL HELPER]--\n")
     cmds.button(label="Create Curve (select joints)", command=lambda x: joint_spline_chain.create_curve_from_joints())
     cmds.button(label="Cluster Curve (select curve)", command=lambda x: joint_spline_chain.cluster_cv_on_selected_curve())
+    cmds.button(label="Create Spline IK (select root joint + curve)", command=lambda x: spline_ik_setup.create_spline_ik_on_selection())
+    cmds.text(label="\n---[SKIN TO CHAIN]--\n")
+    cmds.text(label="Max Influences Per Vertex:")
+    max_influences_field = cmds.intField(minValue=1, value=skin_binding.DEFAULT_MAX_INFLUENCES)
+    cmds.button(label="Bind Mesh To Chain (select mesh + root joint)", command=lambda x: skin_binding.bind_selected_mesh_to_chain(
+        cmds.intField(max_influences_field, query=True, value=True)))
+    cmds.text(label="\n---[RIBBON (uvPin)]--\n")
+    cmds.text(label="Ribbon Width:")
+    ribbon_width_field = cmds.floatField(minValue=0.1, value=10)
+    cmds.button(label="Create Ribbon (select chain root joint)", command=lambda x: ribbon_chain.create_ribbon_on_selected_chain(
+        cmds.floatField(ribbon_width_field, query=True, value=True)))
     cmds.text(label="\n---[JOINT+CHILDREN ROTATE ORDER]--\n")
     def apply_rotation_order(*args):
         """
@@ -344,6 +434,23 @@ def create_ui():
     rotationOrder_jointChildren_checkbox = cmds.checkBox(label="\nChildren Rotation Order Changed (joint ony)\n", value=True)
     
     cmds.button(label="Set Rotation Order (joints or controls)", command=apply_rotation_order)
+    
+    cmds.text(label="\n---[SKELETON EXPORT/IMPORT]--\n")
+    cmds.button(label="Export Skeleton (select root joints/groups)", command=lambda x: skeleton_io.export_selected_skeleton())
+    cmds.button(label="Import Skeleton", command=lambda x: skeleton_io.import_skeleton_file())
+    cmds.button(label="Save Rig Snapshot (select root joints/groups)", command=lambda x: rig_snapshot.save_selected_snapshot())
+    cmds.button(label="Compare Rig With Snapshot", command=lambda x: rig_snapshot.compare_selected_with_file())
+    
+    cmds.text(label="\n---[RIG COST REPORT]--\n")
+    cmds.button(label="Analyze Rig (select root joints/groups)", command=lambda x: rig_analyzer.analyze_selected_rig())
+
+    cmds.text(label="\n---[VIEWPORT DISPLAY]--\n")
+    cmds.button(label="Register Rig Display Layers (selected roots, or whole scene)",
+                command=lambda x: display_lod.register_rig(cmds.ls(selection=True, type="transform") or None))
+    cmds.rowLayout(numberOfColumns=3)
+    for display_mode in display_lod.DISPLAY_MODES:
+        cmds.button(label=display_mode.capitalize(), command=lambda x, mode=display_mode: display_lod.set_display_mode(mode, measure=True))
+    cmds.setParent('..')
     cmds.setParent('..')
     
     # Tab labels/layout for user to pan through
@@ -354,5 +461,6 @@ def create_ui():
     ))
     # Show the window
     cmds.showWindow(window)
-# Run the UI
-create_ui()
+# Run the UI when the file is run from the script editor, not when imported (e.g. by mayapy batch builds)
+if __name__ == "__main__":
+    create_ui()
@@ -132,5 +132,6 @@ def create_ui():
     create_nurbs_circle_tool()
     create_joint_chain_tool()
 
-# Run the UI
-create_ui()
+# Run the UI when the file is run from the script editor, not when imported (e.g. by mayapy batch builds)
+if __name__ == "__main__":
+    create_ui()
@@ -0,0 +1,106 @@
+import maya.cmds as cmds
+import maya.api.OpenMaya as om
+import math
+import time
+
+DEFAULT_RAYS = 16
+
+def chain_tangents(positions):
+    """Direction of a chain at every position (central differences, one sided at the ends)."""
+    points = [om.MVector(p) for p in positions]
+    tangents = []
+    for i in range(len(points)):
+        direction = points[min(i + 1, len(points) - 1)] - points[max(i - 1, 0)]
+        tangents.append(direction.normal() if direction.length() > 1e-8 else om.MVector(1, 0, 0))
+    return tangents
+
+def _cross_section_axes(tangent):
+    """Two unit vectors spanning the plane perpendicular to the tangent."""
+    reference = om.MVector(0, 1, 0) if abs(tangent.y) < 0.9 else om.MVector(1, 0, 0)
+    u = (tangent ^ reference).normal()
+    return u, (tangent ^ u).normal()
+
+def _mesh_fn(mesh):
+    selection = om.MSelectionList()
+    selection.add(mesh)
+    return om.MFnMesh(selection.getDagPath(0).extendToShape())
+
+def center_positions_in_mesh(mesh, positions, tangents=None, rays=DEFAULT_RAYS, max_distance=None, iterations=2):
+    """
+    Moves every position to the middle of the mesh cross-section around it: a fan of rays is
+    cast in the plane perpendicular to the chain and the position moves to the centroid of
+    the hits. Repeating from the moved position (iterations) refines positions that started
+    off centre or outside the mesh.
+
+    All rays go through one MFnMesh with a uniform grid acceleration structure that Maya
+    builds on the first ray and reuses for every following one.
+
+    :param mesh: Mesh transform or shape (e.g. the tail or neck geometry).
+    :param positions: (x, y, z) world positions, in chain order.
+    :param tangents: Chain direction per position (defaults to chain_tangents(positions)).
+    :param rays: Rays per cross-section.
+    :param max_distance: Ray length (defaults to the mesh's bounding box diagonal).
+    :param iterations: Times the fan is cast per position.
+    :return: List of centred (x, y, z) positions; positions without at least three hits are kept.
+    """
+    start = time.perf_counter()
+    mesh_fn = _mesh_fn(mesh)
+    accel = mesh_fn.autoUniformGridParams()
+    if max_distance is None:
+        box = cmds.exactWorldBoundingBox(mesh)
+        max_distance = math.sqrt(sum((box[i + 3] - box[i]) ** 2 for i in range(3)))
+    if tangents is None:
+        tangents = chain_tangents(positions)
+    angles = [2.0 * math.pi * k / rays for k in range(rays)]
+
+    centered = []
+    cast = 0
+    for position, tangent in zip(positions, tangents):
+        u, v = _cross_section_axes(om.MVector(tangent))
+        center = om.MVector(position)
+        for _ in range(iterations):
+            source = om.MFloatPoint(center.x, center.y, center.z)
+            hits = []
+            for angle in angles:
+                direction = u * math.cos(angle) + v * math.sin(angle)
+                hit = mesh_fn.closestIntersection(source, om.MFloatVector(direction), om.MSpace.kWorld,
+                                                  max_distance, False, accelParams=accel)
+                cast += 1
+                if hit[2] >= 0:
+                    hits.append(om.MVector(hit[0].x, hit[0].y, hit[0].z))
+            if len(hits) < 3:
+                break
+            center = sum(hits, om.MVector()) / len(hits)
+        centered.append((center.x, center.y, center.z))
+
+    mesh_fn.freeCachedIntersectionAccelerator()
+    print(f"Centred {len(centered)} position(s) in '{mesh}' with {cast} rays in {time.perf_counter() - start:.3f}s")
+    return centered
+
+def center_joints_in_mesh(joints, mesh, rays=DEFAULT_RAYS):
+    """
+    Moves the joints of a chain to the centre of the mesh volume around them.
+
+    :param joints: Chain joints from root to tip.
+    :param mesh: Mesh transform or shape.
+    :param rays: Rays per cross-section.
+    :return: The centred world positions.
+    """
+    flat = cmds.xform(joints, query=True, worldSpace=True, translation=True)
+    positions = center_positions_in_mesh(mesh, [flat[i:i + 3] for i in range(0, len(flat), 3)], rays=rays)
+    # root first, so moving a parent never shifts a child that is already placed
+    for joint, position in zip(joints, positions):
+        cmds.xform(joint, worldSpace=True, translation=position)
+    return positions
+
+def center_selected_chain_in_mesh(rays=DEFAULT_RAYS):
+    """Centres the chain under the selected root joint in the selected mesh."""
+    root = cmds.ls(selection=True, type="joint")
+    meshes = [obj for obj in cmds.ls(selection=True, type="transform")
+              if cmds.listRelatives(obj, shapes=True, type="mesh")]
+    if not root or not meshes:
+        cmds.warning("Please select the mesh and the root joint of the chain.")
+        return
+    # allDescendents lists the deepest joint first
+    chain = [root[0]] + list(reversed(cmds.listRelatives(root[0], allDescendents=True, type="joint") or []))
+    return center_joints_in_mesh(chain, meshes[0], rays)
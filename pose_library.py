@@ -0,0 +1,204 @@
+import maya.cmds as cmds
+import maya.api.OpenMaya as om
+import numpy as np
+import undoable_modifier
+
+# bump when the array layout below changes
+POSE_FORMAT_VERSION = 1
+
+CONTROL_PATTERN = "*_CTRL"
+TRANSFORM_CHANNELS = (("translate", "XYZ"), ("rotate", "XYZ"), ("scale", "XYZ"))
+
+def control_registry(controls=None, pattern=CONTROL_PATTERN):
+    """
+    The controls a pose is captured for, in a fixed order that indexes the pose arrays.
+
+    :param controls: Explicit control names; defaults to every curve transform matching pattern
+                     (the controls made by create_fk_control_with_group and the chain tools).
+    :param pattern: Name pattern of the controls.
+    :return: Sorted list of control names.
+    """
+    if controls is None:
+        controls = [node for node in cmds.ls(pattern, type="transform")
+                    if cmds.listRelatives(node, shapes=True, type="nurbsCurve")]
+    return sorted(controls)
+
+def _transform_fns(controls):
+    """MFnTransform per control, None for controls missing from the scene."""
+    fns = []
+    for control in controls:
+        # one selection list per control: a shared list merges a control listed twice
+        selection = om.MSelectionList()
+        try:
+            selection.add(control)
+        except RuntimeError:
+            fns.append(None)
+            continue
+        fns.append(om.MFnTransform(selection.getDagPath(0)))
+    return fns
+
+def capture_pose(controls=None):
+    """
+    Reads the local transform of every control into contiguous arrays.
+
+    :param controls: Control names (see control_registry).
+    :return: Dictionary with "controls" (N,), "translate" (N, 3), "rotate" (N, 4 quaternions xyzw) and "scale" (N, 3).
+    """
+    controls = control_registry(controls)
+    count = len(controls)
+    translate = np.zeros((count, 3))
+    rotate = np.tile([0.0, 0.0, 0.0, 1.0], (count, 1))
+    scale = np.ones((count, 3))
+    for i, fn in enumerate(_transform_fns(controls)):
+        if fn is None:
+            cmds.warning(f"Control '{controls[i]}' does not exist, captured as rest pose.")
+            continue
+        t = fn.translation(om.MSpace.kTransform)
+        q = fn.rotation(om.MSpace.kTransform, asQuaternion=True)
+        translate[i] = (t.x, t.y, t.z)
+        rotate[i] = (q.x, q.y, q.z, q.w)
+        scale[i] = fn.scale()
+    return {"controls": np.array(controls), "translate": translate, "rotate": rotate, "scale": scale}
+
+def save_pose(pose, path):
+    """
+    Saves a pose as a compressed .npz file of float32 arrays.
+
+    :param pose: Dictionary from capture_pose.
+    :param path: File to write.
+    """
+    with open(path, "wb") as f:
+        np.savez_compressed(f, format_version=np.int32(POSE_FORMAT_VERSION),
+                            controls=pose["controls"].astype(str),
+                            translate=pose["translate"].astype(np.float32),
+                            rotate=pose["rotate"].astype(np.float32),
+                            scale=pose["scale"].astype(np.float32))
+    print(f"Saved pose of {len(pose['controls'])} control(s) to {path}")
+
+def load_pose(path):
+    """
+    Loads a pose saved by save_pose.
+
+    :param path: .npz file.
+    :return: Dictionary like capture_pose returns.
+    """
+    with np.load(path, allow_pickle=False) as archive:
+        pose = {key: archive[key] for key in archive.files}
+    if int(pose.pop("format_version")) != POSE_FORMAT_VERSION:
+        cmds.error(f"'{path}' is not a pose of format {POSE_FORMAT_VERSION}.")
+        return
+    for key in ("translate", "rotate", "scale"):
+        pose[key] = pose[key].astype(np.float64)
+    return pose
+
+def align_pose(pose, controls):
+    """
+    Reorders a pose to another control registry. Controls the pose does not have get the
+    pose's first row and are marked False in the returned mask.
+
+    :param pose: Dictionary from capture_pose or load_pose.
+    :param controls: Control names to align to.
+    :return: (aligned pose, boolean (N,) mask of the controls found in the pose).
+    """
+    index_of = {name: i for i, name in enumerate(pose["controls"].tolist())}
+    rows = np.array([index_of.get(name, -1) for name in controls], dtype=np.int64)
+    found = rows >= 0
+    rows[~found] = 0
+    aligned = {"controls": np.array(controls)}
+    for key in ("translate", "rotate", "scale"):
+        aligned[key] = pose[key][rows] if len(pose[key]) else np.zeros((len(controls), pose[key].shape[1]))
+    return aligned, found
+
+def slerp(q0, q1, weight):
+    """
+    Vectorized quaternion slerp.
+
+    :param q0: (N, 4) quaternions.
+    :param q1: (N, 4) quaternions.
+    :param weight: Blend weight, scalar or (N,).
+    :return: (N, 4) quaternions.
+    """
+    weight = np.broadcast_to(np.asarray(weight, dtype=np.float64), (len(q0),))[:, None]
+    dot = np.einsum("ij,ij->i", q0, q1)
+    # take the short way round
+    q1 = np.where((dot < 0.0)[:, None], -q1, q1)
+    dot = np.abs(dot)[:, None]
+
+    theta = np.arccos(np.clip(dot, -1.0, 1.0))
+    sin_theta = np.sin(theta)
+    near = sin_theta < 1e-6
+    safe = np.where(near, 1.0, sin_theta)
+    a = np.where(near, 1.0 - weight, np.sin((1.0 - weight) * theta) / safe)
+    b = np.where(near, weight, np.sin(weight * theta) / safe)
+    result = a * q0 + b * q1
+    return result / np.linalg.norm(result, axis=1, keepdims=True)
+
+def blend_poses(pose_a, pose_b, weight):
+    """
+    Blends two poses of the same registry: lerp of translate and scale, slerp of rotate.
+
+    :param weight: 0 gives pose_a, 1 gives pose_b; scalar or one weight per control.
+    :return: Blended pose.
+    """
+    w = np.broadcast_to(np.asarray(weight, dtype=np.float64), (len(pose_a["controls"]),))[:, None]
+    return {"controls": pose_a["controls"],
+            "translate": pose_a["translate"] + (pose_b["translate"] - pose_a["translate"]) * w,
+            "rotate": slerp(pose_a["rotate"], pose_b["rotate"], w[:, 0]),
+            "scale": pose_a["scale"] + (pose_b["scale"] - pose_a["scale"]) * w}
+
+def apply_pose(pose, weight=1.0, controls=None):
+    """
+    Applies (or blends towards) a pose. The current pose of the controls is captured, blended
+    with the stored one, and every channel is written through one MDGModifier, committed as
+    one undo step. Rotations are written as the Euler solution closest to each control's
+    current rotation, so controls past 360 degrees keep their winding. Locked and connected
+    channels are left alone.
+
+    :param pose: Dictionary from capture_pose or load_pose.
+    :param weight: 1 applies the pose, lower values blend from the current pose towards it.
+    :param controls: Limit to these controls (defaults to every control in the pose).
+    :return: Number of controls posed.
+    """
+    controls = control_registry(controls if controls is not None else pose["controls"].tolist())
+    target, found = align_pose(pose, controls)
+    current = capture_pose(controls)
+    blended = blend_poses(current, target, np.where(found, weight, 0.0))
+
+    modifier = om.MDGModifier()
+    posed = 0
+    for i, fn in enumerate(_transform_fns(controls)):
+        if fn is None or not found[i]:
+            continue
+        q = blended["rotate"][i]
+        euler = om.MQuaternion(q[0], q[1], q[2], q[3]).asEulerRotation().reorder(
+            fn.findPlug("rotateOrder", False).asInt())
+        euler.setToClosestSolution(fn.rotation(om.MSpace.kTransform))
+        values = {"translate": blended["translate"][i], "rotate": (euler.x, euler.y, euler.z),
+                  "scale": blended["scale"][i]}
+        for attr, axes in TRANSFORM_CHANNELS:
+            for axis, value in zip(axes, values[attr]):
+                plug = fn.findPlug(attr + axis, False)
+                if plug.isLocked or plug.isDestination:
+                    continue
+                if attr == "rotate":
+                    modifier.newPlugValueMAngle(plug, om.MAngle(value))
+                else:
+                    modifier.newPlugValueDouble(plug, float(value))
+        posed += 1
+    undoable_modifier.commit(modifier)
+    return posed
+
+def save_selected_pose():
+    """Asks for a file and saves the pose of the selected controls (all controls if none are selected)."""
+    selected = [node for node in cmds.ls(selection=True, type="transform")
+                if cmds.listRelatives(node, shapes=True, type="nurbsCurve")]
+    path = cmds.fileDialog2(fileFilter="Pose (*.npz)", dialogStyle=2, fileMode=0)
+    if path:
+        save_pose(capture_pose(selected or None), path[0])
+
+def apply_pose_file(weight=1.0):
+    """Asks for a pose file and applies it with the given blend weight."""
+    path = cmds.fileDialog2(fileFilter="Pose (*.npz)", dialogStyle=2, fileMode=1)
+    if path:
+        posed = apply_pose(load_pose(path[0]), weight)
+        print(f"Applied pose to {posed} control(s) at weight {weight}")
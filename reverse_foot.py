@@ -0,0 +1,204 @@
+import maya.cmds as cmds
+import math
+import rig_analyzer
+
+# Joint names made by foot_joint_creation.build_leg_chain
+FOOT_JOINTS = {
+    "hip": "hip_JNT",
+    "ankle": "ankle_JNT",
+    "ball": "foot_JNT",
+    "toe": "midToe1_JNT",
+    "toe_tip": "midToe3_JNT",
+    "inner_tip": "innerToe3_JNT",
+    "outer_tip": "outterToe3_JNT",
+}
+
+def find_foot_joints(hip):
+    """
+    Finds the joints of a foot_joint_creation chain under (and including) the hip joint.
+
+    :param hip: The hip joint of the chain.
+    :return: Dictionary of FOOT_JOINTS roles to joint names, or None when one is missing.
+    """
+    joints = [hip] + (cmds.listRelatives(hip, allDescendents=True, type="joint", fullPath=True) or [])
+    by_name = {joint.rsplit("|", 1)[-1].rsplit(":", 1)[-1]: joint for joint in joints}
+    missing = [name for name in FOOT_JOINTS.values() if name not in by_name]
+    if missing:
+        cmds.warning(f"'{hip}' is not a foot_joint_creation chain, missing: {', '.join(missing)}")
+        return None
+    return {role: by_name[name] for role, name in FOOT_JOINTS.items()}
+
+def _position(node):
+    return cmds.xform(node, query=True, worldSpace=True, translation=True)
+
+def _pivot(name, parent, position):
+    pivot = cmds.group(empty=True, name=name, parent=parent)
+    cmds.xform(pivot, worldSpace=True, translation=position)
+    return pivot
+
+def _local_x(position, origin, yaw):
+    """Sideways offset of a position in a frame at origin turned yaw degrees around Y."""
+    angle = math.radians(yaw)
+    return (position[0] - origin[0]) * math.cos(angle) - (position[2] - origin[2]) * math.sin(angle)
+
+def _pole_direction(hip_pos, knee_pos, ankle_pos, forward):
+    """
+    Unit direction from the knee to its pole vector: the way the knee bends away from the
+    hip-ankle line, or, for a straight leg where there is no bend, the foot's forward
+    direction (then world Z) taken square to the leg.
+    """
+    leg = [ankle_pos[i] - hip_pos[i] for i in range(3)]
+    leg_length = math.sqrt(sum(value * value for value in leg)) or 1.0
+    leg = [value / leg_length for value in leg]
+    for direction in ([knee_pos[i] - hip_pos[i] for i in range(3)], list(forward), [0.0, 0.0, 1.0]):
+        along = sum(direction[i] * leg[i] for i in range(3))
+        square = [direction[i] - along * leg[i] for i in range(3)]
+        length = math.sqrt(sum(value * value for value in square))
+        if length > 1e-4 * leg_length:
+            return [value / length for value in square]
+    return [1.0, 0.0, 0.0]
+
+def build_reverse_foot(hip, name="leg", toe_break=30.0, pole_distance=None):
+    """
+    Reverse foot rig for a chain from foot_joint_creation.create_joint_chain: a rotate plane
+    IK on the leg, single chain IKs for the ball and toes, and heel, toe tip, bank and ball
+    pivots placed from the toe joints.
+
+    The pivots hang under <name>_foot_CTRL, which is turned to face along the foot so every
+    pivot rolls around its local X (roll) or Z (bank). Roll, bank and toe wiggle are
+    attributes on the control; roll and bank run through two clamp nodes and one
+    addDoubleLinear whatever the foot looks like.
+
+    :param hip: The hip joint of the chain.
+    :param name: Prefix for the created nodes.
+    :param toe_break: Roll angle at which the ball stops and the toe tip takes over.
+    :param pole_distance: Distance of the knee pole vector locator (defaults to the thigh length).
+    :return: Dictionary with the control, pivots, IK handles and the list of created nodes.
+    """
+    joints = find_foot_joints(hip)
+    if joints is None:
+        return
+    knee = cmds.listRelatives(joints["ankle"], parent=True, fullPath=True)[0]
+    hip_pos, knee_pos, ankle_pos, ball_pos, toe_tip_pos, inner_pos, outer_pos = [
+        _position(node) for node in (joints["hip"], knee, joints["ankle"], joints["ball"],
+                                     joints["toe_tip"], joints["inner_tip"], joints["outer_tip"])]
+    ground = min(toe_tip_pos[1], inner_pos[1], outer_pos[1])
+    heel_pos = (ankle_pos[0], ground, ankle_pos[2])
+    yaw = math.degrees(math.atan2(toe_tip_pos[0] - heel_pos[0], toe_tip_pos[2] - heel_pos[2]))
+    foot_length = math.hypot(toe_tip_pos[0] - heel_pos[0], toe_tip_pos[2] - heel_pos[2])
+
+    created = []
+    cmds.undoInfo(openChunk=True, chunkName="Build reverse foot")
+    try:
+        leg_ik = cmds.ikHandle(startJoint=joints["hip"], endEffector=joints["ankle"], solver="ikRPsolver", name=f"{name}_IKH")
+        ball_ik = cmds.ikHandle(startJoint=joints["ankle"], endEffector=joints["ball"], solver="ikSCsolver", name=f"{name}_ball_IKH")
+        toe_ik = cmds.ikHandle(startJoint=joints["ball"], endEffector=joints["toe"], solver="ikSCsolver", name=f"{name}_toe_IKH")
+        created += leg_ik + ball_ik + toe_ik
+
+        # Control at the heel, facing down the foot
+        group = cmds.group(empty=True, name=f"{name}_foot_CTRL_GRP")
+        cmds.xform(group, worldSpace=True, translation=heel_pos, rotation=(0, yaw, 0))
+        ctrl = cmds.circle(name=f"{name}_foot_CTRL", normal=(0, 1, 0), radius=foot_length * 0.5,
+                           center=(0, 0, foot_length * 0.5), constructionHistory=False)[0]
+        ctrl = cmds.parent(ctrl, group, relative=True)[0]
+        created += [group, ctrl]
+        cmds.addAttr(ctrl, longName="roll", attributeType="double", keyable=True)
+        cmds.addAttr(ctrl, longName="bank", attributeType="double", keyable=True)
+        cmds.addAttr(ctrl, longName="toeWiggle", attributeType="double", keyable=True)
+
+        # Pivot chain: heel > toe tip > banks (ball IK) > ball (leg IK) / toe (toe IK); the ball
+        # IK sits above the ball pivot so ball roll lifts the ankle instead of turning the handle
+        heel = _pivot(f"{name}_heel_PIV", ctrl, heel_pos)
+        toe_tip = _pivot(f"{name}_toeTip_PIV", heel, toe_tip_pos)
+        inner_bank = _pivot(f"{name}_innerBank_PIV", toe_tip, (inner_pos[0], ground, inner_pos[2]))
+        outer_bank = _pivot(f"{name}_outerBank_PIV", inner_bank, (outer_pos[0], ground, outer_pos[2]))
+        ball = _pivot(f"{name}_ball_PIV", outer_bank, ball_pos)
+        toe = _pivot(f"{name}_toe_PIV", outer_bank, ball_pos)
+        created += [heel, toe_tip, inner_bank, outer_bank, ball, toe]
+        cmds.parent(leg_ik[0], ball)
+        cmds.parent(ball_ik[0], outer_bank)
+        cmds.parent(toe_ik[0], toe)
+
+        # Roll: heel below 0, ball from 0 to the toe break, toe tip past the break
+        roll_clamp = cmds.createNode("clamp", name=f"{name}_roll_CLP")
+        cmds.connectAttr(f"{ctrl}.roll", f"{roll_clamp}.inputR")
+        cmds.connectAttr(f"{ctrl}.roll", f"{roll_clamp}.inputG")
+        cmds.setAttr(f"{roll_clamp}.minR", -180)
+        cmds.setAttr(f"{roll_clamp}.maxG", toe_break)
+        cmds.connectAttr(f"{roll_clamp}.outputR", f"{heel}.rotateX")
+        cmds.connectAttr(f"{roll_clamp}.outputG", f"{ball}.rotateX")
+
+        past_break = cmds.createNode("addDoubleLinear", name=f"{name}_toeRoll_ADL")
+        cmds.connectAttr(f"{ctrl}.roll", f"{past_break}.input1")
+        cmds.setAttr(f"{past_break}.input2", -toe_break)
+
+        # Toe tip roll and the two banks share the second clamp
+        tip_bank_clamp = cmds.createNode("clamp", name=f"{name}_tipBank_CLP")
+        cmds.connectAttr(f"{past_break}.output", f"{tip_bank_clamp}.inputR")
+        cmds.setAttr(f"{tip_bank_clamp}.maxR", 180)
+        cmds.connectAttr(f"{ctrl}.bank", f"{tip_bank_clamp}.inputG")
+        cmds.connectAttr(f"{ctrl}.bank", f"{tip_bank_clamp}.inputB")
+        cmds.setAttr(f"{tip_bank_clamp}.maxG", 180)
+        cmds.setAttr(f"{tip_bank_clamp}.minB", -180)
+        cmds.connectAttr(f"{tip_bank_clamp}.outputR", f"{toe_tip}.rotateX")
+        # positive bank rotates around the pivot on the foot's local -X side
+        positive_bank, negative_bank = (inner_bank, outer_bank) \
+            if _local_x(inner_pos, heel_pos, yaw) < _local_x(outer_pos, heel_pos, yaw) else (outer_bank, inner_bank)
+        cmds.connectAttr(f"{tip_bank_clamp}.outputG", f"{positive_bank}.rotateZ")
+        cmds.connectAttr(f"{tip_bank_clamp}.outputB", f"{negative_bank}.rotateZ")
+        cmds.connectAttr(f"{ctrl}.toeWiggle", f"{toe}.rotateX")
+        created += [roll_clamp, past_break, tip_bank_clamp]
+
+        # Knee pole vector, out in front of the knee
+        thigh = [knee_pos[i] - hip_pos[i] for i in range(3)]
+        forward = (math.sin(math.radians(yaw)), 0.0, math.cos(math.radians(yaw)))
+        bend = _pole_direction(hip_pos, knee_pos, ankle_pos, forward)
+        distance = pole_distance or math.sqrt(sum(value * value for value in thigh))
+        pole = cmds.spaceLocator(name=f"{name}_pole_LOC")[0]
+        cmds.xform(pole, worldSpace=True, translation=[knee_pos[i] + bend[i] * distance for i in range(3)])
+        created += [pole, cmds.poleVectorConstraint(pole, leg_ik[0])[0]]
+    finally:
+        cmds.undoInfo(closeChunk=True)
+    cmds.select(clear=True)
+
+    return {"control": ctrl, "group": group, "pole": pole,
+            "pivots": {"heel": heel, "toe_tip": toe_tip, "inner_bank": inner_bank,
+                       "outer_bank": outer_bank, "ball": ball, "toe": toe},
+            "ik": {"leg": leg_ik[0], "ball": ball_ik[0], "toe": toe_ik[0]}, "created": created}
+
+def report_reverse_foot(setup, hip, frames=50):
+    """
+    Prints the node count of a reverse foot setup and its per frame evaluation time
+    (roll and bank keyed over the frame range so the whole foot evaluates).
+
+    :param setup: Dictionary from build_reverse_foot.
+    :param hip: The hip joint of the chain.
+    :param frames: Frames played for the measurement.
+    :return: The rig_analyzer report.
+    """
+    ctrl = setup["control"]
+    cmds.setKeyframe(ctrl, attribute="roll", time=1, value=-30)
+    cmds.setKeyframe(ctrl, attribute="roll", time=frames, value=90)
+    cmds.setKeyframe(ctrl, attribute="bank", time=1, value=-20)
+    cmds.setKeyframe(ctrl, attribute="bank", time=frames, value=20)
+    report = rig_analyzer.analyze_rig([hip, setup["group"], setup["pole"]], measure=True, start=1, end=frames)
+    cmds.cutKey(ctrl, attribute=["roll", "bank"], clear=True)
+    cmds.setAttr(f"{ctrl}.roll", 0)
+    cmds.setAttr(f"{ctrl}.bank", 0)
+
+    fps = report["measured_fps"]
+    print(f"Reverse foot '{ctrl}': {len(setup['created'])} node(s) created, {report['nodes']} in the leg rig, "
+          f"~{report['estimated_us_per_frame']:.0f} us/frame estimated, "
+          f"{1000.0 / fps if fps else 0.0:.3f} ms/frame measured")
+    return report
+
+def create_reverse_foot_on_selection(toe_break=30.0):
+    """Builds the reverse foot on the selected hip joint and prints its cost."""
+    selected = cmds.ls(selection=True, type="joint")
+    if not selected:
+        cmds.warning("Please select the hip joint of a foot chain.")
+        return
+    setup = build_reverse_foot(selected[0], toe_break=toe_break)
+    if setup:
+        report_reverse_foot(setup, selected[0])
+    return setup
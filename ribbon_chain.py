@@ -0,0 +1,202 @@
+import maya.cmds as cmds
+import maya.api.OpenMaya as om
+import joint_chain_calc
+import joint_spline_chain
+import rig_analyzer
+
+def chain_from_root(root):
+    """
+    Follows the first child joint from root down to the end of the chain.
+
+    :param root: Root joint of the chain (e.g. joint_01 from chain_on_curve).
+    :return: Joints from root to tip.
+    """
+    chain = [root]
+    while True:
+        children = cmds.listRelatives(chain[-1], children=True, type="joint")
+        if not children:
+            return chain
+        chain.append(children[0])
+
+def _normalize(vector):
+    length = vector.length()
+    return vector / length if length > 1e-8 else None
+
+def _xyz(vector):
+    return (vector.x, vector.y, vector.z)
+
+def create_ribbon_surface(positions, width, name):
+    """
+    Lofts a NURBS ribbon through the positions, width wide, running along U.
+
+    :param positions: World positions the ribbon centre passes through, in order.
+    :param width: Width of the ribbon across V.
+    :param name: Name of the surface transform.
+    :return: The surface transform.
+    """
+    points = [om.MVector(p) for p in positions]
+    direction = _normalize(points[-1] - points[0]) or om.MVector(1, 0, 0)
+    # lay the ribbon flat, sideways to the chain; fall back to Z when the chain runs along Y
+    side = _normalize(direction ^ om.MVector(0, 1, 0)) or _normalize(direction ^ om.MVector(0, 0, 1))
+    offset = side * (width * 0.5)
+
+    degree = min(3, len(points) - 1)
+    edge_a = cmds.curve(d=degree, ep=[_xyz(p + offset) for p in points])
+    edge_b = cmds.curve(d=degree, ep=[_xyz(p - offset) for p in points])
+    surface = cmds.loft(edge_a, edge_b, constructionHistory=False, uniform=True, degree=1, name=name)[0]
+    cmds.delete(edge_a, edge_b)
+    return surface
+
+def _surface_coordinates(surface, positions):
+    """Normalized (u, v) of the closest surface point to every position."""
+    selection = om.MSelectionList()
+    selection.add(surface)
+    surface_fn = om.MFnNurbsSurface(selection.getDagPath(0).extendToShape())
+    u_min, u_max = surface_fn.knotDomainInU
+    v_min, v_max = surface_fn.knotDomainInV
+    coordinates = []
+    for position in positions:
+        _, u, v = surface_fn.closestPoint(om.MPoint(position), space=om.MSpace.kWorld)
+        coordinates.append(((u - u_min) / (u_max - u_min), (v - v_min) / (v_max - v_min)))
+    return coordinates
+
+def _flatten_joints(joints, group):
+    """Unparents the joints under group, zeroed, so their offsetParentMatrix alone places them."""
+    flat = []
+    for joint in joints:
+        joint = cmds.parent(joint, group)[0]
+        for attr in ("translate", "rotate", "jointOrient"):
+            cmds.setAttr(f"{joint}.{attr}", 0, 0, 0)
+        flat.append(joint)
+    return flat
+
+def attach_with_uv_pin(surface, joints, positions):
+    """
+    Pins every joint to the surface through one multi-output uvPin node.
+
+    :return: The uvPin node.
+    """
+    shape = cmds.listRelatives(surface, shapes=True, fullPath=True)[0]
+    pin = cmds.createNode("uvPin", name=surface + "_uvPin")
+    cmds.connectAttr(f"{shape}.worldSpace[0]", f"{pin}.deformedGeometry")
+    cmds.setAttr(f"{pin}.normalizedIsoParms", 1)
+    cmds.setAttr(f"{pin}.tangentAxis", 0)  # X follows the ribbon (U)
+    cmds.setAttr(f"{pin}.normalAxis", 1)  # Y follows the surface normal
+    for i, (joint, (u, v)) in enumerate(zip(joints, _surface_coordinates(surface, positions))):
+        cmds.setAttr(f"{pin}.coordinate[{i}].coordinateU", u)
+        cmds.setAttr(f"{pin}.coordinate[{i}].coordinateV", v)
+        cmds.connectAttr(f"{pin}.outputMatrix[{i}]", f"{joint}.offsetParentMatrix")
+    return pin
+
+def attach_with_follicles(surface, joints, positions):
+    """
+    The hand-built alternative kept for comparison: one follicle per joint plus a
+    parentConstraint snapping the joint to the follicle.
+
+    :return: The follicle transforms.
+    """
+    shape = cmds.listRelatives(surface, shapes=True, fullPath=True)[0]
+    follicles = []
+    for joint, (u, v) in zip(joints, _surface_coordinates(surface, positions)):
+        follicle_shape = cmds.createNode("follicle")
+        follicle = cmds.listRelatives(follicle_shape, parent=True)[0]
+        cmds.connectAttr(f"{shape}.local", f"{follicle_shape}.inputSurface")
+        cmds.connectAttr(f"{shape}.worldMatrix[0]", f"{follicle_shape}.inputWorldMatrix")
+        cmds.connectAttr(f"{follicle_shape}.outTranslate", f"{follicle}.translate")
+        cmds.connectAttr(f"{follicle_shape}.outRotate", f"{follicle}.rotate")
+        cmds.setAttr(f"{follicle}.inheritsTransform", 0)  # outTranslate/outRotate are world space
+        cmds.setAttr(f"{follicle_shape}.parameterU", u)
+        cmds.setAttr(f"{follicle_shape}.parameterV", v)
+        cmds.parentConstraint(follicle, joint, maintainOffset=False)
+        follicles.append(follicle)
+    return follicles
+
+def build_ribbon(joints, width=10, name="ribbon", control_size=None, use_follicles=False):
+    """
+    Builds a ribbon setup for a chain made by joint_spline_chain (or any single chain).
+
+    The joints are moved flat under <name>_bind_GRP and pinned to a lofted NURBS ribbon with
+    a single uvPin node. Start, mid and end controls from joint_spline_chain.create_controls
+    each carry a control joint, and the ribbon is skinned to those three joints.
+
+    :param joints: Chain joints from root to tip.
+    :param width: Ribbon width.
+    :param name: Prefix for the created nodes.
+    :param control_size: Control circle radius (defaults to the ribbon width).
+    :param use_follicles: Attach with follicles and constraints instead (for comparison only).
+    :return: Dictionary with the rig group, surface, attachment node(s), controls and control joints.
+    """
+    if len(joints) < 2:
+        cmds.warning("A ribbon needs a chain of at least two joints.")
+        return
+    flat = cmds.xform(joints, query=True, worldSpace=True, translation=True)
+    positions = [tuple(flat[i:i + 3]) for i in range(0, len(flat), 3)]
+
+    rig_group = cmds.group(empty=True, name=f"{name}_RIBBON_GRP")
+    surface = create_ribbon_surface(positions, width, f"{name}_SURF")
+    cmds.parent(surface, rig_group)
+    # the surface is skinned to the control joints, which already carry the rig group's transform
+    cmds.setAttr(f"{surface}.inheritsTransform", 0)
+    bind_group = cmds.group(empty=True, name=f"{name}_bind_GRP", parent=rig_group)
+    # the pinned joints are placed in world space, so moving the rig group must not move them again
+    cmds.setAttr(f"{bind_group}.inheritsTransform", 0)
+    joints = _flatten_joints(joints, bind_group)
+
+    if use_follicles:
+        attachment = attach_with_follicles(surface, joints, positions)
+        cmds.parent(attachment, rig_group)
+    else:
+        attachment = attach_with_uv_pin(surface, joints, positions)
+
+    # start/mid/end controls, each holding the control joint the ribbon is skinned to
+    direction = om.MVector(positions[-1]) - om.MVector(positions[0])
+    control_positions = [positions[0], positions[len(positions) // 2], positions[-1]]
+    controls = joint_spline_chain.create_controls(control_positions, _xyz(direction.normal()), control_size or width,
+                                                  prefix=name)
+    control_joints = []
+    for ctrl, position in zip(controls, control_positions):
+        cmds.select(clear=True)
+        control_joint = cmds.joint(name=f"{ctrl}_JNT", position=position, radius=width * 0.25)
+        control_joints.append(cmds.parent(control_joint, ctrl)[0])
+        cmds.setAttr(f"{control_joints[-1]}.visibility", 0)
+        cmds.parent(cmds.listRelatives(ctrl, parent=True)[0], rig_group)
+    cmds.skinCluster(control_joints, surface, toSelectedBones=True, maximumInfluences=2, dropoffRate=4.0)
+    cmds.select(clear=True)
+
+    return {"group": rig_group, "surface": surface, "attachment": attachment,
+            "controls": controls, "control_joints": control_joints, "joints": joints}
+
+def create_ribbon_on_selected_chain(width):
+    """Builds a ribbon on the chain under the selected root joint."""
+    selected = cmds.ls(selection=True, type="joint")
+    if not selected:
+        cmds.warning("Please select the root joint of a chain.")
+        return
+    result = build_ribbon(chain_from_root(selected[0]), width=width)
+    if result:
+        print(f"Ribbon '{result['group']}' created for {len(result['joints'])} joint(s).")
+    return result
+
+def compare_attachment_cost(joint_count=50, length=200.0, frames=50):
+    """
+    Builds the same ribbon twice in the current scene, once with one uvPin and once with
+    follicles and constraints, reports the analyzer numbers of both and deletes them again.
+
+    :param joint_count: Joints on the test chain.
+    :param length: Length of the test chain.
+    :param frames: Frames played for the FPS measurement.
+    :return: Dictionary with the "uvPin" and "follicle" analysis reports.
+    """
+    reports = {}
+    for label, use_follicles in (("uvPin", False), ("follicle", True)):
+        joints = joint_chain_calc.build_joint_chain((0, 0, 0), (length, 0, 0), 1.0, joint_count, 1.0,
+                                                    name_prefix=f"{label}Compare")
+        result = build_ribbon(joints, width=length * 0.05, name=f"{label}Compare", use_follicles=use_follicles)
+        reports[label] = rig_analyzer.analyze_rig([result["group"]], measure=True, start=1, end=frames)
+        cmds.delete(result["group"])
+
+    for label, report in reports.items():
+        fps = report["measured_fps"]
+        print(f"{label:>9}: {report['nodes']:5d} nodes, {report['connections']:5d} connections, "
+              f"~{report['estimated_us_per_frame']:.0f} us/frame estimated, {fps:.1f} fps measured")
+    return reports
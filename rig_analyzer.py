@@ -0,0 +1,287 @@
+import maya.cmds as cmds
+import maya.api.OpenMaya as om
+import argparse
+import json
+import sys
+import time
+from collections import Counter
+
+# Rough evaluation cost per node type in microseconds per frame, for comparing rigs built
+# with these tools against each other rather than as an absolute prediction.
+EVAL_COST = {
+    "transform": 1.0,
+    "joint": 1.5,
+    "nurbsCurve": 2.0,
+    "nurbsSurface": 4.0,
+    "orientConstraint": 6.0,
+    "pointConstraint": 5.0,
+    "aimConstraint": 7.0,
+    "parentConstraint": 8.0,
+    "scaleConstraint": 5.0,
+    "cluster": 10.0,
+    "clusterHandle": 1.0,
+    "skinCluster": 50.0,
+    "ikHandle": 10.0,
+    "ikEffector": 1.0,
+    "follicle": 5.0,
+    "uvPin": 4.0,
+    "curveInfo": 3.0,
+    "multiplyDivide": 1.0,
+    "plusMinusAverage": 1.0,
+    "clamp": 1.0,
+    "addDoubleLinear": 0.5,
+    "multDoubleLinear": 0.5,
+    "unitConversion": 0.3,
+    "multMatrix": 1.5,
+    "decomposeMatrix": 1.5,
+    "quatToEuler": 1.0,
+}
+DEFAULT_EVAL_COST = 2.0
+CONNECTION_COST = 0.2  # dirty propagation and data copy per DG connection
+
+# never followed when walking the graph out of the rig, they connect to the whole scene
+SKIP_TYPES = {"time", "shadingEngine", "objectSet", "displayLayer", "displayLayerManager",
+              "renderLayer", "renderLayerManager", "nodeGraphEditorInfo", "hyperLayout",
+              "lightLinker", "partition", "animLayer"}
+
+def collect_rig_nodes(roots):
+    """
+    Gathers every node a rig evaluates: the DAG under the roots plus the DG network
+    (constraints, clusters, utility nodes, ...) connected to it.
+
+    :param roots: Names of the rig's root nodes.
+    :return: (nodes, dag_nodes) as lists of long names.
+    """
+    dag_nodes = cmds.ls(roots, dag=True, long=True) or []
+    nodes = set(dag_nodes)
+    defaults = set(cmds.ls(defaultNodes=True) or [])
+    frontier = list(dag_nodes)
+    while frontier:
+        connected = cmds.listConnections(frontier, source=True, destination=True, skipConversionNodes=False) or []
+        connected = cmds.ls(connected, long=True) or []
+        frontier = []
+        for node in set(connected) - nodes:
+            if node in defaults or cmds.nodeType(node) in SKIP_TYPES:
+                continue
+            nodes.add(node)
+            frontier.append(node)
+            # constraints and cluster handles live in the DAG, bring their shapes along
+            for child in cmds.listRelatives(node, shapes=True, fullPath=True) or []:
+                nodes.add(child)
+    return sorted(nodes), dag_nodes
+
+def _count_connections(nodes):
+    """Number of incoming DG connections on the given nodes, in one query."""
+    connections = cmds.listConnections(nodes, connections=True, plugs=True, source=True, destination=False) or []
+    return len(connections) // 2
+
+def _hierarchy_depths(dag_nodes, roots):
+    """Depth of every DAG node below its root (roots are depth 0)."""
+    root_depths = {}
+    for root in cmds.ls(roots, long=True) or []:
+        root_depths[root] = root.count("|")
+    depths = []
+    for node in dag_nodes:
+        owner = max((root for root in root_depths if node == root or node.startswith(root + "|")), key=len, default=None)
+        if owner is not None:
+            depths.append(node.count("|") - root_depths[owner])
+    return depths
+
+def _find_patterns(nodes, types):
+    """
+    Flags tool-generated patterns that dominate the evaluation cost, most expensive first.
+    """
+    by_type = {}
+    for node, node_type in types.items():
+        by_type.setdefault(node_type, []).append(node)
+    patterns = []
+
+    # create_fk_control_with_group / create_nurbs_circle_around_joint: one orientConstraint per control
+    ctrl_constraints = []
+    for constraint in by_type.get("orientConstraint", []):
+        targets = cmds.orientConstraint(constraint, query=True, targetList=True) or []
+        if any(target.endswith("_CTRL") for target in targets):
+            ctrl_constraints.append(constraint)
+    if ctrl_constraints:
+        patterns.append({
+            "pattern": "orientConstraint per _CTRL control",
+            "source": "controlJoint_creation.create_fk_control_with_group",
+            "count": len(ctrl_constraints),
+            "cost": len(ctrl_constraints) * (EVAL_COST["orientConstraint"] + 6 * CONNECTION_COST),
+            "advice": "Drive the joint rotation directly (or through offsetParentMatrix) instead of a constraint node per control.",
+        })
+
+    # cluster_cv_on_selected_curve: one cluster deformer per curve CV
+    clusters = by_type.get("cluster", [])
+    if clusters:
+        patterns.append({
+            "pattern": "cluster deformer per curve CV",
+            "source": "joint_spline_chain.cluster_cv_on_selected_curve",
+            "count": len(clusters),
+            "cost": len(clusters) * (EVAL_COST["cluster"] + EVAL_COST["clusterHandle"]),
+            "advice": "Each cluster is a separate deformer pass over the curve; fewer control CVs or one skinned curve is cheaper.",
+        })
+
+    # Group NURBS Circle / create_nurbs_control_with_joint: _AUTO and _OFFSET transforms above controls
+    groups = [node for node in by_type.get("transform", [])
+              if node.endswith("_AUTO") or node.endswith("_OFFSET")]
+    if groups:
+        patterns.append({
+            "pattern": "_AUTO/_OFFSET group transforms",
+            "source": "controlJoint_creation.create_nurbs_control_with_joint",
+            "count": len(groups),
+            "cost": len(groups) * EVAL_COST["transform"],
+            "advice": "Bake the groups into offsetParentMatrix with apply_group_transform_to_children_and_delete_selected_group.",
+        })
+
+    # any group holding a single child with an identity transform adds a matrix multiply for nothing;
+    # nodes with a shape (controls, cluster handles) are not groups, their only child is their own shape
+    identity = om.MMatrix()
+    empty_groups = []
+    for node in by_type.get("transform", []):
+        if cmds.listRelatives(node, shapes=True):
+            continue
+        children = cmds.listRelatives(node, children=True, type="transform", fullPath=True) or []
+        if len(children) == 1 and om.MMatrix(cmds.xform(node, query=True, matrix=True)) == identity:
+            empty_groups.append(node)
+    if empty_groups:
+        patterns.append({
+            "pattern": "identity transform with a single child",
+            "source": "per-control grouping",
+            "count": len(empty_groups),
+            "cost": len(empty_groups) * EVAL_COST["transform"],
+            "advice": "These groups do not move anything; parent the child one level up.",
+        })
+
+    return sorted(patterns, key=lambda pattern: pattern["cost"], reverse=True)
+
+def measure_playback(nodes, start=1, end=100):
+    """
+    Plays the frame range and pulls the world matrix of every transform so the rig really
+    evaluates. When the rig has no animation every node is dirtied per frame, which gives
+    the full, uncached evaluation cost.
+
+    :param nodes: Rig nodes (from collect_rig_nodes).
+    :return: Measured frames per second.
+    """
+    transforms = cmds.ls(nodes, type="transform", long=True) or []
+    if not transforms:
+        return 0.0
+    selection = om.MSelectionList()
+    for node in transforms:
+        selection.add(node)
+    plugs = []
+    for i in range(selection.length()):
+        node_fn = om.MFnDependencyNode(selection.getDependNode(i))
+        plugs.append(node_fn.findPlug("worldMatrix", False).elementByLogicalIndex(0))
+
+    animated = bool(cmds.listConnections(nodes, type="animCurve"))
+    current = cmds.currentTime(query=True)
+    frames = int(end - start + 1)
+    begin = time.perf_counter()
+    for frame in range(int(start), int(end) + 1):
+        if not animated:
+            cmds.dgdirty(nodes)
+        cmds.currentTime(frame, update=True)
+        for plug in plugs:
+            plug.asMObject()
+    elapsed = time.perf_counter() - begin
+    cmds.currentTime(current, update=True)
+    return frames / elapsed if elapsed else 0.0
+
+def analyze_rig(roots, measure=False, start=1, end=100):
+    """
+    Walks a rig built with these tools and reports what it costs to evaluate.
+
+    :param roots: Names of the rig's root nodes (root joints, control groups, ...).
+    :param measure: Also play the frame range and measure FPS (use under mayapy or in a
+                    quiet scene; the viewport is not drawn).
+    :return: Report dictionary, see print_report.
+    """
+    nodes, dag_nodes = collect_rig_nodes(roots)
+    shown = cmds.ls(nodes, showType=True, long=True) or []
+    types = dict(zip(shown[0::2], shown[1::2]))
+    type_counts = Counter(types.values())
+    connections = _count_connections(nodes)
+    depths = _hierarchy_depths(dag_nodes, roots)
+
+    node_cost = sum(EVAL_COST.get(node_type, DEFAULT_EVAL_COST) * count for node_type, count in type_counts.items())
+    report = {
+        "roots": list(roots),
+        "nodes": len(nodes),
+        "node_types": dict(type_counts.most_common()),
+        "connections": connections,
+        "constraints": len(cmds.ls(nodes, type="constraint") or []),
+        "deformers": len(cmds.ls(nodes, type="geometryFilter") or []),
+        "max_depth": max(depths) if depths else 0,
+        "mean_depth": sum(depths) / len(depths) if depths else 0.0,
+        "estimated_us_per_frame": node_cost + connections * CONNECTION_COST,
+        "patterns": _find_patterns(nodes, types),
+        "measured_fps": None,
+    }
+    if measure:
+        report["measured_fps"] = measure_playback(nodes, start, end)
+    return report
+
+def print_report(report):
+    """Prints a rig analysis report."""
+    print(f"Rig analysis of {', '.join(report['roots'])}:")
+    print(f"  nodes: {report['nodes']}   connections: {report['connections']}   "
+          f"constraints: {report['constraints']}   deformers: {report['deformers']}")
+    print(f"  hierarchy depth: max {report['max_depth']}, mean {report['mean_depth']:.1f}")
+    print("  nodes by type:")
+    for node_type, count in report["node_types"].items():
+        print(f"    {node_type:<24}{count:6d}")
+    print(f"  estimated evaluation cost: {report['estimated_us_per_frame']:.0f} us/frame")
+    if report["measured_fps"] is not None:
+        print(f"  measured playback: {report['measured_fps']:.1f} fps")
+    if report["patterns"]:
+        print("  optimize first:")
+        for pattern in report["patterns"]:
+            print(f"    {pattern['pattern']} x{pattern['count']} (~{pattern['cost']:.0f} us/frame, {pattern['source']})")
+            print(f"      {pattern['advice']}")
+
+def analyze_selected_rig(measure=False):
+    """Analyzes the rig under the selected root nodes and prints the report."""
+    selected = cmds.ls(selection=True, type="transform")
+    if not selected:
+        cmds.warning("Please select the root joint(s) or control group(s) of the rig.")
+        return
+    report = analyze_rig(selected, measure=measure)
+    print_report(report)
+    return report
+
+def main(argv=None):
+    """
+    Command line entry point, run with mayapy:
+
+        mayapy rig_analyzer.py spinosaurus_rig.ma --roots hip_JNT tail_01 --frames 1 200
+    """
+    parser = argparse.ArgumentParser(description="Report the evaluation cost of a rig.")
+    parser.add_argument("scene", help="Maya scene to open.")
+    parser.add_argument("--roots", nargs="+", help="Root nodes of the rig (defaults to every top level transform).")
+    parser.add_argument("--frames", nargs=2, type=int, default=(1, 100), metavar=("START", "END"))
+    parser.add_argument("--json", help="Also write the report to this file.")
+    args = parser.parse_args(argv)
+
+    import maya.standalone
+    maya.standalone.initialize(name="python")
+    try:
+        cmds.file(args.scene, open=True, force=True)
+        roots = args.roots
+        if not roots:
+            # every top level transform except the cameras
+            roots = [root for root in cmds.ls(assemblies=True)
+                     if not cmds.listRelatives(root, shapes=True, type="camera")]
+        report = analyze_rig(roots, measure=True, start=args.frames[0], end=args.frames[1])
+    finally:
+        maya.standalone.uninitialize()
+
+    print_report(report)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
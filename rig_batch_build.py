@@ -0,0 +1,207 @@
+import maya.cmds as cmds
+import argparse
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from functools import partial
+import controlJoint_creation
+import foot_joint_creation
+import joint_chain_calc
+import joint_spline_chain
+
+# Build stages in the order they run. Every stage is timed, even when the description leaves it empty.
+BUILD_STAGES = ["scene", "curves", "legs", "chains", "curve_chains", "clusters",
+                "controls", "colors", "rotation_orders", "save"]
+
+def load_description(path):
+    """
+    Reads a rig description file (JSON).
+
+    A description lists what the three UI tabs would otherwise build by hand, e.g.
+
+        {
+            "name": "spinosaurus",
+            "output": "spinosaurus_rig.ma",
+            "curves": [{"name": "tail_CRV", "points": [[0, 90, -60], ...], "degree": 3}],
+            "legs": [{"radius": 1.0, "hip": [60, 150, -40], "knee": [...], "ankle": [...]}],
+            "chains": [{"name": "spine", "start": [...], "end": [...], "spread": 1.0, "count": 8, "radius": 20}],
+            "curve_chains": [{"name": "tail", "curve": "tail_CRV", "spread": 1.0, "count": 12, "radius": 20}],
+            "clusters": ["tail_CRV"],
+            "controls": [{"joints": ["hip_JNT", "knee_JNT"], "axis": "X Axis", "size": 20, "constrain": true}],
+            "colors": [{"nodes": ["hip_JNT_CTRL"], "hex": "#4477aa"}, {"nodes": ["knee_JNT_CTRL"], "index": 6}],
+            "rotation_orders": [{"nodes": ["hip_JNT"], "order": "yzx", "children": true}]
+        }
+
+    :param path: Path to the description file.
+    :return: The description as a dictionary.
+    """
+    with open(path, "r") as f:
+        description = json.load(f)
+    if not isinstance(description, dict):
+        raise ValueError(f"Rig description '{path}' must be a JSON object.")
+    return description
+
+@contextmanager
+def _stage(timings, name):
+    """Times one build stage into the timings dictionary."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[name] = time.perf_counter() - start
+
+def build_rig(description, output=None, new_scene=True, cache_dir=None):
+    """
+    Builds a whole rig from a description with the tool functions, no UI or dialogs involved.
+
+    :param description: Rig description dictionary (see load_description).
+    :param output: Scene file to save to. Falls back to the description's "output"; nothing is saved if neither is set.
+    :param new_scene: Start from an empty scene before building.
+    :param cache_dir: Build cache folder. Parts whose inputs did not change are restored from it instead of rebuilt.
+    :return: Dictionary with the rig name, output path, created nodes per stage and seconds per stage.
+    """
+    output = output or description.get("output")
+    if cache_dir:
+        import build_cache
+        build_leg_chain = partial(build_cache.cached_leg_chain, cache_dir=cache_dir)
+        build_joint_chain = partial(build_cache.cached_joint_chain, cache_dir=cache_dir)
+        build_chain_on_curve = partial(build_cache.cached_chain_on_curve, cache_dir=cache_dir)
+        cluster_curve_cvs = build_cache.cached_curve_clusters
+        build_fk_control = partial(build_cache.cached_fk_control, cache_dir=cache_dir)
+    else:
+        build_leg_chain = foot_joint_creation.build_leg_chain
+        build_joint_chain = joint_chain_calc.build_joint_chain
+        build_chain_on_curve = joint_spline_chain.build_chain_on_curve
+        cluster_curve_cvs = joint_spline_chain.cluster_curve_cvs
+        build_fk_control = controlJoint_creation.build_fk_control
+    timings = {}
+    created = {}
+    build_start = time.perf_counter()
+
+    with _stage(timings, "scene"):
+        if new_scene:
+            cmds.file(new=True, force=True)
+
+    with _stage(timings, "curves"):
+        created["curves"] = []
+        for curve in description.get("curves", []):
+            name = cmds.curve(d=curve.get("degree", 3), p=[tuple(p) for p in curve["points"]])
+            if curve.get("name"):
+                name = cmds.rename(name, curve["name"])
+            created["curves"].append(name)
+
+    with _stage(timings, "legs"):
+        created["legs"] = []
+        for leg in description.get("legs", []):
+            root = build_leg_chain(leg.get("radius", 1.0), leg["hip"], leg["knee"], leg["ankle"])
+            created["legs"].append(root)
+
+    with _stage(timings, "chains"):
+        created["chains"] = []
+        for chain in description.get("chains", []):
+            joints = build_joint_chain(
+                chain["start"], chain["end"], chain.get("spread", 1.0), chain.get("count", 8),
+                chain.get("radius", 20), name_prefix=chain.get("name", "joint"))
+            created["chains"].extend(joints)
+
+    with _stage(timings, "curve_chains"):
+        created["curve_chains"] = []
+        for chain in description.get("curve_chains", []):
+            joints = build_chain_on_curve(
+                chain["curve"], chain.get("spread", 1.0), chain.get("count", 8),
+                chain.get("radius", 20), name_prefix=chain.get("name", "joint"))
+            created["curve_chains"].extend(joints)
+
+    with _stage(timings, "clusters"):
+        created["clusters"] = []
+        for curve_name in description.get("clusters", []):
+            created["clusters"].extend(cluster_curve_cvs(curve_name))
+
+    with _stage(timings, "controls"):
+        created["controls"] = []
+        for control in description.get("controls", []):
+            for joint in control["joints"]:
+                ctrl = build_fk_control(
+                    joint, control.get("axis", "X Axis"), control.get("size", 20), control.get("constrain", True))
+                created["controls"].append(ctrl)
+
+    with _stage(timings, "colors"):
+        for color in description.get("colors", []):
+            nodes = color["nodes"]
+            if "index" in color:
+                for node in nodes:
+                    controlJoint_creation.recolor_nurbs_curve(node, color["index"])
+                continue
+            joints = cmds.ls(nodes, type="joint")
+            shapes = [node for node in nodes if node not in joints]
+            if joints:
+                cmds.select(joints, replace=True)
+                controlJoint_creation.color_joints_with_hex(color["hex"])
+            if shapes:
+                cmds.select(shapes, replace=True)
+                controlJoint_creation.recolor_nurbs_shapes(color["hex"])
+
+    with _stage(timings, "rotation_orders"):
+        for rotation in description.get("rotation_orders", []):
+            cmds.select(rotation["nodes"], replace=True)
+            joint_spline_chain.joint_children_rotation_order(rotation["order"], rotation.get("children", False))
+        cmds.select(clear=True)
+
+    with _stage(timings, "save"):
+        if output:
+            file_type = "mayaBinary" if output.lower().endswith(".mb") else "mayaAscii"
+            cmds.file(rename=os.path.abspath(output))
+            cmds.file(save=True, type=file_type, force=True)
+
+    return {
+        "name": description.get("name", "rig"),
+        "output": os.path.abspath(output) if output else None,
+        "created": created,
+        "stages": {stage: timings[stage] for stage in BUILD_STAGES},
+        "total_seconds": time.perf_counter() - build_start,
+    }
+
+def print_timings(result):
+    """Prints the per stage timing table of a build result."""
+    print(f"Build timings for '{result['name']}':")
+    for stage, seconds in result["stages"].items():
+        print(f"  {stage:<16}{seconds * 1000.0:10.1f} ms")
+    print(f"  {'total':<16}{result['total_seconds'] * 1000.0:10.1f} ms")
+
+def main(argv=None):
+    """
+    Command line entry point, run with mayapy:
+
+        mayapy rig_batch_build.py spinosaurus.json -o spinosaurus_rig.ma
+    """
+    parser = argparse.ArgumentParser(description="Build a rig headlessly from a rig description file.")
+    parser.add_argument("description", help="Rig description JSON file.")
+    parser.add_argument("-o", "--output", help="Scene file to save (.ma or .mb). Overrides the description's output.")
+    parser.add_argument("--timings", help="Where to write the timing report (defaults to <output>.timings.json).")
+    parser.add_argument("--cache", help="Build cache folder; unchanged rig parts are restored from it instead of rebuilt.")
+    args = parser.parse_args(argv)
+
+    description = load_description(args.description)
+    output = args.output or description.get("output")
+    if not output:
+        parser.error("No output scene given on the command line or in the description.")
+
+    import maya.standalone
+    maya.standalone.initialize(name="python")
+    try:
+        result = build_rig(description, output=output, cache_dir=args.cache)
+    finally:
+        maya.standalone.uninitialize()
+
+    timings_path = args.timings or result["output"] + ".timings.json"
+    with open(timings_path, "w") as f:
+        json.dump(result, f, indent=2)
+
+    print_timings(result)
+    print(f"Saved rig to {result['output']} and timings to {timings_path}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
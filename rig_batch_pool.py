@@ -0,0 +1,191 @@
+import argparse
+import atexit
+import io
+import json
+import os
+import subprocess
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import redirect_stderr, redirect_stdout
+
+# Maya is only imported inside the workers, so the driver itself can run from plain python
+# when every build is handed to a separate mayapy process.
+BUILD_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "rig_batch_build.py")
+
+def _prepare_jobs(descriptions, output_dir):
+    """
+    Turns description dictionaries or description file paths into jobs with unique names,
+    output scenes and description files inside output_dir. Descriptions that would write the
+    same scene (e.g. variants copied from one file) get the job index added to the file name.
+    """
+    jobs = []
+    used_names = set()
+    used_outputs = set()
+    for i, description in enumerate(descriptions):
+        source = None
+        if not isinstance(description, dict):
+            source = os.path.abspath(description)
+            with open(source, "r") as f:
+                description = json.load(f)
+
+        name = description.get("name") or f"rig_{i + 1:03d}"
+        if name in used_names:
+            name = f"{name}_{i + 1:03d}"
+        used_names.add(name)
+
+        output = description.get("output") or f"{name}.ma"
+        if not os.path.isabs(output):
+            output = os.path.join(output_dir, os.path.basename(output))
+        output = os.path.abspath(output)
+        stem, extension = os.path.splitext(output)
+        while os.path.normcase(output) in used_outputs:
+            stem = f"{stem}_{i + 1:03d}"
+            output = stem + extension
+        used_outputs.add(os.path.normcase(output))
+
+        jobs.append({
+            "index": i,
+            "name": name,
+            "description": description,
+            "source": source,
+            "output": output,
+        })
+    return jobs
+
+def _init_worker():
+    """Starts Maya once per worker process; every job in the worker then reuses it."""
+    import maya.standalone
+    maya.standalone.initialize(name="python")
+    atexit.register(maya.standalone.uninitialize)
+
+def _run_job_in_process(job):
+    """Builds one rig inside an already initialized worker process, capturing its log."""
+    import rig_batch_build
+    log = io.StringIO()
+    result = {"name": job["name"], "output": job["output"], "pid": os.getpid(), "error": None, "stages": {}}
+    start = time.perf_counter()
+    try:
+        with redirect_stdout(log), redirect_stderr(log):
+            build = rig_batch_build.build_rig(job["description"], output=job["output"])
+        result["stages"] = build["stages"]
+    except Exception:
+        result["error"] = traceback.format_exc()
+    result["seconds"] = time.perf_counter() - start
+    result["log"] = log.getvalue()
+    return result
+
+def _run_job_with_mayapy(job, mayapy):
+    """Builds one rig in its own mayapy process through the rig_batch_build command line."""
+    description_path = job["source"]
+    if description_path is None:
+        description_path = os.path.splitext(job["output"])[0] + ".json"
+        with open(description_path, "w") as f:
+            json.dump(job["description"], f, indent=2)
+    timings_path = job["output"] + ".timings.json"
+
+    result = {"name": job["name"], "output": job["output"], "pid": None, "error": None, "stages": {}}
+    start = time.perf_counter()
+    proc = subprocess.run([mayapy, BUILD_SCRIPT, description_path, "-o", job["output"], "--timings", timings_path],
+                          stdout=subprocess.PIPE, stderr=subprocess.STDOUT, universal_newlines=True)
+    result["seconds"] = time.perf_counter() - start
+    result["log"] = proc.stdout
+    if proc.returncode != 0:
+        result["error"] = f"mayapy exited with code {proc.returncode}"
+    elif os.path.exists(timings_path):
+        with open(timings_path, "r") as f:
+            result["stages"] = json.load(f)["stages"]
+    return result
+
+def run_batch(descriptions, output_dir, workers=None, mayapy=None):
+    """
+    Builds many rig variants in parallel and collects their outputs, logs and stage timings.
+
+    By default the builds run in a pool of worker processes that each start Maya once
+    (run the driver itself with mayapy). When mayapy is given, every build instead runs as
+    its own mayapy process, which also works when the driver is started from plain python.
+
+    :param descriptions: List of rig description dictionaries or description file paths.
+    :param output_dir: Folder for the scenes, logs and the batch_summary.json report.
+    :param workers: Number of parallel builds (defaults to the CPU count).
+    :param mayapy: Path to mayapy to run each build in a separate process.
+    :return: The summary dictionary also written to batch_summary.json.
+    """
+    output_dir = os.path.abspath(output_dir)
+    os.makedirs(output_dir, exist_ok=True)
+    jobs = _prepare_jobs(descriptions, output_dir)
+    workers = max(1, min(workers or os.cpu_count() or 1, len(jobs) or 1))
+
+    if mayapy:
+        executor = ThreadPoolExecutor(max_workers=workers)
+        submit = lambda job: executor.submit(_run_job_with_mayapy, job, mayapy)
+    else:
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+        submit = lambda job: executor.submit(_run_job_in_process, job)
+
+    results = [None] * len(jobs)
+    batch_start = time.perf_counter()
+    with executor:
+        futures = {submit(job): job for job in jobs}
+        for done, future in enumerate(as_completed(futures), 1):
+            job = futures[future]
+            try:
+                result = future.result()
+            except Exception:
+                # The worker process itself died (e.g. Maya crashed), not just the build
+                result = {"name": job["name"], "output": job["output"], "pid": None, "stages": {},
+                          "seconds": 0.0, "log": "", "error": traceback.format_exc()}
+            results[job["index"]] = result
+            status = "FAILED" if result["error"] else "ok"
+            print(f"[{done}/{len(jobs)}] {result['name']}: {status} in {result['seconds']:.1f}s")
+    wall_seconds = time.perf_counter() - batch_start
+
+    stage_totals = {}
+    for result in results:
+        log_path = os.path.join(output_dir, f"{result['name']}.log")
+        with open(log_path, "w") as f:
+            f.write(result.pop("log"))
+            if result["error"]:
+                f.write("\n" + result["error"])
+        result["log_path"] = log_path
+        for stage, seconds in result["stages"].items():
+            stage_totals[stage] = stage_totals.get(stage, 0.0) + seconds
+
+    summary = {
+        "workers": workers,
+        "mode": "mayapy" if mayapy else "pool",
+        "rigs": len(results),
+        "failed": sum(1 for result in results if result["error"]),
+        "wall_seconds": wall_seconds,
+        "build_seconds": sum(result["seconds"] for result in results),
+        "rigs_per_minute": len(results) / wall_seconds * 60.0 if wall_seconds else 0.0,
+        "stage_totals": stage_totals,
+        "jobs": results,
+    }
+    with open(os.path.join(output_dir, "batch_summary.json"), "w") as f:
+        json.dump(summary, f, indent=2)
+
+    print(f"Built {summary['rigs'] - summary['failed']}/{summary['rigs']} rigs with {workers} workers "
+          f"in {wall_seconds:.1f}s ({summary['rigs_per_minute']:.1f} rigs/min)")
+    return summary
+
+def main(argv=None):
+    """
+    Command line entry point:
+
+        mayapy rig_batch_pool.py variants/*.json -d build_output --workers 8
+        python rig_batch_pool.py variants/*.json -d build_output --mayapy "C:/Program Files/Autodesk/Maya2025/bin/mayapy.exe"
+    """
+    parser = argparse.ArgumentParser(description="Build many rig descriptions in parallel.")
+    parser.add_argument("descriptions", nargs="+", help="Rig description JSON files.")
+    parser.add_argument("-d", "--output-dir", default="rig_builds", help="Folder for scenes, logs and the summary.")
+    parser.add_argument("-w", "--workers", type=int, help="Number of parallel builds (defaults to the CPU count).")
+    parser.add_argument("--mayapy", help="Run every build as its own process of this mayapy.")
+    args = parser.parse_args(argv)
+
+    summary = run_batch(args.descriptions, args.output_dir, workers=args.workers, mayapy=args.mayapy)
+    return 1 if summary["failed"] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,179 @@
+import maya.cmds as cmds
+import maya.api.OpenMaya as om
+import numpy as np
+import hashlib
+import skeleton_io
+
+# bump when the array layout below changes
+SNAPSHOT_FORMAT_VERSION = 2
+
+DEFAULT_POSITION_TOLERANCE = 1e-3
+DEFAULT_ROTATION_TOLERANCE = 1e-4  # on the matrix axes, about 0.006 degrees
+
+def _color(node_fn, path):
+    """(index, r, g, b) of the drawing override of a node or its first shape, index -1 when there is none."""
+    for fn in [node_fn] + [om.MFnDependencyNode(path.child(i)) for i in range(path.childCount())
+                           if path.child(i).hasFn(om.MFn.kShape)][:1]:
+        enabled, use_rgb, color_index, rgb = skeleton_io._read_override(fn)
+        if enabled:
+            return [-2 if use_rgb else color_index] + rgb
+    return [-1, 0.0, 0.0, 0.0]
+
+def snapshot_hash(snapshot):
+    """SHA1 of a snapshot's structure, rounded world matrices, rotate orders and colors."""
+    digest = hashlib.sha1()
+    digest.update("\n".join(snapshot["names"].tolist()).encode("utf-8"))
+    digest.update(snapshot["parents"].astype(np.int32).tobytes())
+    digest.update(np.round(snapshot["world_matrix"], 4).astype(np.float64).tobytes())
+    digest.update(snapshot["rotate_order"].astype(np.int8).tobytes())
+    digest.update(np.round(snapshot["color"], 4).astype(np.float64).tobytes())
+    return digest.hexdigest()
+
+def capture_snapshot(roots):
+    """
+    Captures the hierarchies under the roots as arrays: names, parent indices, world
+    matrices, rotate orders and colors, plus a hash of all of it. Names are paths relative to
+    the snapshot roots (root|child|...), so where the roots sit in the scene does not matter.
+
+    :param roots: Names of the rig's root nodes.
+    :return: Dictionary of NumPy arrays and the "hash" string.
+    """
+    dag_paths, parents = skeleton_io.collect_hierarchy(roots)
+    count = len(dag_paths)
+    names = []
+    world_matrix = np.empty((count, 16))
+    rotate_order = np.empty(count, dtype=np.int8)
+    color = np.empty((count, 4), dtype=np.float32)
+    for i, path in enumerate(dag_paths):
+        node_fn = om.MFnDependencyNode(path.node())
+        names.append(node_fn.name() if parents[i] < 0 else f"{names[parents[i]]}|{node_fn.name()}")
+        world_matrix[i] = list(path.inclusiveMatrix())
+        rotate_order[i] = node_fn.findPlug("rotateOrder", False).asInt()
+        color[i] = _color(node_fn, path)
+
+    snapshot = {"names": np.array(names), "parents": np.array(parents, dtype=np.int32),
+                "world_matrix": world_matrix, "rotate_order": rotate_order, "color": color}
+    snapshot["hash"] = snapshot_hash(snapshot)
+    return snapshot
+
+def save_snapshot(snapshot, path):
+    """Saves a snapshot to a .npz file."""
+    with open(path, "wb") as f:
+        np.savez_compressed(f, format_version=np.int32(SNAPSHOT_FORMAT_VERSION),
+                            hash=np.array(snapshot["hash"]),
+                            **{key: value for key, value in snapshot.items() if key != "hash"})
+    print(f"Saved snapshot of {len(snapshot['names'])} node(s) ({snapshot['hash'][:12]}) to {path}")
+
+def load_snapshot(path):
+    """Loads a snapshot saved by save_snapshot."""
+    with np.load(path, allow_pickle=False) as archive:
+        snapshot = {key: archive[key] for key in archive.files}
+    if int(snapshot.pop("format_version")) != SNAPSHOT_FORMAT_VERSION:
+        cmds.error(f"'{path}' is not a rig snapshot of format {SNAPSHOT_FORMAT_VERSION}.")
+        return
+    snapshot["hash"] = str(snapshot["hash"])
+    return snapshot
+
+def _match_keys(snapshot):
+    """
+    Key per node to match it across snapshots: its short name, so a node is still found after
+    being reparented, or its relative path when the short name is not unique in the snapshot.
+    """
+    names = snapshot["names"].tolist()
+    short_names = [name.rsplit("|", 1)[-1] for name in names]
+    counts = {}
+    for short_name in short_names:
+        counts[short_name] = counts.get(short_name, 0) + 1
+    return [short_name if counts[short_name] == 1 else name for name, short_name in zip(names, short_names)]
+
+def compare_snapshots(before, after, position_tolerance=DEFAULT_POSITION_TOLERANCE,
+                      rotation_tolerance=DEFAULT_ROTATION_TOLERANCE):
+    """
+    Compares two snapshots node by node (matched by short name, see _match_keys), all checks
+    vectorized.
+
+    :param before: Reference snapshot.
+    :param after: Snapshot to check.
+    :param position_tolerance: Largest world position change that still counts as equal.
+    :param rotation_tolerance: Largest change of any world matrix axis component (rotation and scale).
+    :return: Dictionary with "identical" and lists of "added", "removed" names and of
+             (name, value) pairs for "moved", "rotated", "reparented", "rotate_order", "color".
+    """
+    report = {"identical": before["hash"] == after["hash"], "added": [], "removed": [], "moved": [],
+              "rotated": [], "reparented": [], "rotate_order": [], "color": []}
+    if report["identical"]:
+        return report
+
+    before_keys = _match_keys(before)
+    after_keys = _match_keys(after)
+    index_of = {key: i for i, key in enumerate(after_keys)}
+    rows_before = np.array([i for i, key in enumerate(before_keys) if key in index_of], dtype=np.int64)
+    rows_after = np.array([index_of[before_keys[i]] for i in rows_before], dtype=np.int64)
+    report["removed"] = [str(before["names"][i]) for i, key in enumerate(before_keys) if key not in index_of]
+    kept = set(before_keys)
+    report["added"] = [str(after["names"][i]) for i, key in enumerate(after_keys) if key not in kept]
+    if not len(rows_before):
+        return report
+    names = after["names"][rows_after]
+
+    matrix_before = before["world_matrix"][rows_before].reshape(-1, 4, 4)
+    matrix_after = after["world_matrix"][rows_after].reshape(-1, 4, 4)
+    moved = np.linalg.norm(matrix_after[:, 3, :3] - matrix_before[:, 3, :3], axis=1)
+    rotated = np.abs(matrix_after[:, :3, :3] - matrix_before[:, :3, :3]).max(axis=(1, 2))
+
+    def parent_keys(snapshot, keys, rows):
+        # roots have parent -1, which picks the trailing ""
+        return np.array(keys + [""])[snapshot["parents"][rows]]
+
+    reparented = parent_keys(before, before_keys, rows_before) != parent_keys(after, after_keys, rows_after)
+    order_changed = before["rotate_order"][rows_before] != after["rotate_order"][rows_after]
+    color_changed = np.abs(before["color"][rows_before] - after["color"][rows_after]).max(axis=1) > 1e-4
+
+    for key, mask, values in (("moved", moved > position_tolerance, moved),
+                              ("rotated", rotated > rotation_tolerance, rotated),
+                              ("reparented", reparented, parent_keys(after, after_keys, rows_after)),
+                              ("rotate_order", order_changed, after["rotate_order"][rows_after]),
+                              ("color", color_changed, after["color"][rows_after][:, 0])):
+        hits = np.flatnonzero(mask)
+        report[key] = [(str(names[i]), values[i].item()) for i in hits]
+    return report
+
+def print_diff(report, limit=10):
+    """Prints a compare_snapshots report, at most limit entries per kind of change."""
+    if report["identical"]:
+        print("Rig snapshots are identical.")
+        return
+    counts = ", ".join(f"{len(report[key])} {key.replace('_', ' ')}" for key in
+                       ("added", "removed", "moved", "rotated", "reparented", "rotate_order", "color"))
+    print(f"Rig snapshots differ: {counts}")
+    for key in ("added", "removed"):
+        for name in report[key][:limit]:
+            print(f"  {key}: {name}")
+    for key in ("moved", "rotated", "reparented", "rotate_order", "color"):
+        entries = sorted(report[key], key=lambda entry: -entry[1]) if key in ("moved", "rotated") else report[key]
+        for name, value in entries[:limit]:
+            print(f"  {key}: {name} ({value:.6g})" if isinstance(value, float) else f"  {key}: {name} ({value})")
+        if len(entries) > limit:
+            print(f"  ... {len(entries) - limit} more {key.replace('_', ' ')}")
+
+def save_selected_snapshot():
+    """Asks for a file and saves a snapshot of the selected rig roots."""
+    selected = cmds.ls(selection=True, type="transform")
+    if not selected:
+        cmds.warning("Please select the root joint(s) or control group(s) of the rig.")
+        return
+    path = cmds.fileDialog2(fileFilter="Rig snapshot (*.npz)", dialogStyle=2, fileMode=0)
+    if path:
+        save_snapshot(capture_snapshot(selected), path[0])
+
+def compare_selected_with_file():
+    """Asks for a saved snapshot and prints how the selected rig differs from it."""
+    selected = cmds.ls(selection=True, type="transform")
+    if not selected:
+        cmds.warning("Please select the root joint(s) or control group(s) of the rig.")
+        return
+    path = cmds.fileDialog2(fileFilter="Rig snapshot (*.npz)", dialogStyle=2, fileMode=1)
+    if path:
+        report = compare_snapshots(load_snapshot(path[0]), capture_snapshot(selected))
+        print_diff(report)
+        return report
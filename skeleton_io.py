@@ -0,0 +1,269 @@
+import maya.cmds as cmds
+import maya.api.OpenMaya as om
+import numpy as np
+import undoable_modifier
+
+# bump when the array layout below changes
+SKELETON_FORMAT_VERSION = 1
+
+# node_types values
+NODE_JOINT = 0
+NODE_TRANSFORM = 1
+
+def collect_hierarchy(roots):
+    """
+    Walks the transforms (joints, groups, controls) under the given roots depth first.
+
+    :param roots: Names of the root nodes.
+    :return: (dag_paths, parents) where parents[i] is the index of node i's parent in
+             dag_paths, or -1 when the parent is outside the walked hierarchy.
+    """
+    selection = om.MSelectionList()
+    for root in roots:
+        selection.add(root)
+
+    dag_paths = []
+    parents = []
+    index_of = {}
+    for i in range(selection.length()):
+        dag_iter = om.MItDag(om.MItDag.kDepthFirst, om.MFn.kTransform)
+        dag_iter.reset(selection.getDagPath(i), om.MItDag.kDepthFirst, om.MFn.kTransform)
+        while not dag_iter.isDone():
+            path = dag_iter.getPath()
+            full_name = path.fullPathName()
+            if full_name not in index_of:
+                parent_name = full_name.rsplit("|", 1)[0]
+                index_of[full_name] = len(dag_paths)
+                dag_paths.append(path)
+                parents.append(index_of.get(parent_name, -1))
+            dag_iter.next()
+    return dag_paths, parents
+
+def _read_override(node_fn):
+    """Returns (enabled, use_rgb, color_index, (r, g, b)) of a node's drawing override."""
+    return (node_fn.findPlug("overrideEnabled", False).asBool(),
+            node_fn.findPlug("overrideRGBColors", False).asBool(),
+            node_fn.findPlug("overrideColor", False).asInt(),
+            [node_fn.findPlug(attr, False).asFloat() for attr in ("overrideColorR", "overrideColorG", "overrideColorB")])
+
+def _write_override(modifier, node_fn, enabled, use_rgb, color_index, rgb):
+    """Queues a node's drawing override on the modifier."""
+    modifier.newPlugValueBool(node_fn.findPlug("overrideEnabled", False), bool(enabled))
+    modifier.newPlugValueBool(node_fn.findPlug("overrideRGBColors", False), bool(use_rgb))
+    modifier.newPlugValueInt(node_fn.findPlug("overrideColor", False), int(color_index))
+    for attr, value in zip(("overrideColorR", "overrideColorG", "overrideColorB"), rgb):
+        modifier.newPlugValueFloat(node_fn.findPlug(attr, False), float(value))
+
+def read_skeleton(roots):
+    """
+    Reads the hierarchies under the roots into contiguous typed arrays.
+
+    Joints and transforms get one row each (local transform, joint orient, radius, rotate
+    order, override color). NURBS curve shapes of controls are stored once for all curves:
+    their CVs and knots are packed back to back and sliced with the offset arrays.
+
+    :param roots: Names of the root nodes (e.g. "hip_JNT" or a control's _OFFSET group).
+    :return: Dictionary of NumPy arrays (see export_skeleton).
+    """
+    dag_paths, parents = collect_hierarchy(roots)
+    count = len(dag_paths)
+
+    names = []
+    node_types = np.zeros(count, dtype=np.int8)
+    translate = np.zeros((count, 3), dtype=np.float64)
+    rotate = np.zeros((count, 3), dtype=np.float64)
+    joint_orient = np.zeros((count, 3), dtype=np.float64)
+    scale = np.ones((count, 3), dtype=np.float64)
+    radius = np.zeros(count, dtype=np.float32)
+    rotate_order = np.zeros(count, dtype=np.int8)
+    override = np.zeros((count, 3), dtype=np.int8)  # enabled, use rgb, color index
+    override_rgb = np.zeros((count, 3), dtype=np.float32)
+
+    curve_node, curve_degree, curve_form, curve_override, curve_override_rgb = [], [], [], [], []
+    cv_offsets, knot_offsets = [0], [0]
+    cvs, knots = [], []
+
+    for i, path in enumerate(dag_paths):
+        transform_fn = om.MFnTransform(path)
+        names.append(transform_fn.name())
+        is_joint = path.apiType() == om.MFn.kJoint
+        node_types[i] = NODE_JOINT if is_joint else NODE_TRANSFORM
+
+        position = transform_fn.translation(om.MSpace.kTransform)
+        translate[i] = (position.x, position.y, position.z)
+        euler = transform_fn.rotation(om.MSpace.kTransform, asQuaternion=False)
+        rotate[i] = (euler.x, euler.y, euler.z)
+        rotate_order[i] = euler.order
+        scale[i] = transform_fn.scale()
+        if is_joint:
+            joint_orient[i] = [transform_fn.findPlug(attr, False).asDouble()
+                               for attr in ("jointOrientX", "jointOrientY", "jointOrientZ")]
+            radius[i] = transform_fn.findPlug("radius", False).asDouble()
+        enabled, use_rgb, color_index, rgb = _read_override(transform_fn)
+        override[i] = (enabled, use_rgb, color_index)
+        override_rgb[i] = rgb
+
+        for child_index in range(path.childCount()):
+            child = path.child(child_index)
+            if not child.hasFn(om.MFn.kNurbsCurve):
+                continue
+            curve_fn = om.MFnNurbsCurve(child)
+            if curve_fn.isIntermediateObject:
+                continue
+            curve_node.append(i)
+            curve_degree.append(curve_fn.degree)
+            curve_form.append(curve_fn.form)
+            cvs.extend((p.x, p.y, p.z) for p in curve_fn.cvPositions(om.MSpace.kObject))
+            knots.extend(curve_fn.knots())
+            cv_offsets.append(len(cvs))
+            knot_offsets.append(len(knots))
+            enabled, use_rgb, color_index, rgb = _read_override(curve_fn)
+            curve_override.append((enabled, use_rgb, color_index))
+            curve_override_rgb.append(rgb)
+
+    return {
+        "format_version": np.array(SKELETON_FORMAT_VERSION, dtype=np.int32),
+        "names": np.array(names, dtype=np.str_),
+        "node_types": node_types,
+        "parents": np.array(parents, dtype=np.int32),
+        "translate": translate,
+        "rotate": rotate,
+        "joint_orient": joint_orient,
+        "scale": scale,
+        "radius": radius,
+        "rotate_order": rotate_order,
+        "override": override,
+        "override_rgb": override_rgb,
+        "curve_node": np.array(curve_node, dtype=np.int32),
+        "curve_degree": np.array(curve_degree, dtype=np.int8),
+        "curve_form": np.array(curve_form, dtype=np.int8),
+        "curve_override": np.array(curve_override, dtype=np.int8).reshape(-1, 3),
+        "curve_override_rgb": np.array(curve_override_rgb, dtype=np.float32).reshape(-1, 3),
+        "cv_offsets": np.array(cv_offsets, dtype=np.int32),
+        "cvs": np.array(cvs, dtype=np.float64).reshape(-1, 3),
+        "knot_offsets": np.array(knot_offsets, dtype=np.int32),
+        "knots": np.array(knots, dtype=np.float64),
+    }
+
+def export_skeleton(roots, path, compressed=False):
+    """
+    Saves the joint hierarchies and controls under the roots to a .npz file.
+
+    :param roots: Names of the root nodes.
+    :param path: File to write.
+    :param compressed: Zip-compress the arrays (smaller file, slower save and load).
+    :return: Number of nodes written.
+    """
+    data = read_skeleton(roots)
+    save = np.savez_compressed if compressed else np.savez
+    with open(path, "wb") as f:
+        save(f, **data)
+    print(f"Exported {len(data['names'])} node(s) and {len(data['curve_node'])} control curve(s) to {path}")
+    return len(data["names"])
+
+def load_skeleton(path):
+    """
+    Loads the arrays of an exported skeleton file.
+
+    :param path: .npz file written by export_skeleton.
+    :return: Dictionary of NumPy arrays.
+    """
+    with np.load(path, allow_pickle=False) as archive:
+        data = {key: archive[key] for key in archive.files}
+    if int(data["format_version"]) != SKELETON_FORMAT_VERSION:
+        cmds.error(f"'{path}' is skeleton format {int(data['format_version'])}, expected {SKELETON_FORMAT_VERSION}.")
+        return
+    return data
+
+def build_skeleton(data, parent=None):
+    """
+    Recreates the hierarchy from skeleton arrays. All joints and transforms, their names,
+    parenting, transforms, radii, rotate orders and colors, and the control curve shapes,
+    are queued on a single MDagModifier and committed with undoable_modifier, so the whole
+    import is one undo step.
+
+    :param data: Dictionary of arrays from read_skeleton or load_skeleton.
+    :param parent: Optional node to parent the imported roots under.
+    :return: Names of the created nodes, in the same order as data["names"].
+    """
+    parent_obj = om.MObject.kNullObj
+    if parent:
+        selection = om.MSelectionList()
+        selection.add(parent)
+        parent_obj = selection.getDependNode(0)
+
+    names = data["names"]
+    parents = data["parents"]
+    modifier = om.MDagModifier()
+    objects = []
+    for i in range(len(names)):
+        node_parent = objects[parents[i]] if parents[i] >= 0 else parent_obj
+        node_type = "joint" if data["node_types"][i] == NODE_JOINT else "transform"
+        obj = modifier.createNode(node_type, node_parent)
+        modifier.renameNode(obj, str(names[i]))
+        objects.append(obj)
+
+        node_fn = om.MFnDependencyNode(obj)
+        for attr, values in (("translate", data["translate"][i]), ("rotate", data["rotate"][i]),
+                             ("scale", data["scale"][i])):
+            for axis, value in zip("XYZ", values):
+                modifier.newPlugValueDouble(node_fn.findPlug(attr + axis, False), float(value))
+        modifier.newPlugValueInt(node_fn.findPlug("rotateOrder", False), int(data["rotate_order"][i]))
+        if node_type == "joint":
+            for axis, value in zip("XYZ", data["joint_orient"][i]):
+                modifier.newPlugValueDouble(node_fn.findPlug("jointOrient" + axis, False), float(value))
+            modifier.newPlugValueDouble(node_fn.findPlug("radius", False), float(data["radius"][i]))
+        if data["override"][i][0]:
+            _write_override(modifier, node_fn, *data["override"][i], data["override_rgb"][i])
+
+    # Control shapes, sliced out of the packed CV and knot arrays into curve data that the
+    # new shape keeps as its cached geometry
+    cv_offsets = data["cv_offsets"]
+    knot_offsets = data["knot_offsets"]
+    curve_fn = om.MFnNurbsCurve()
+    for c, node_index in enumerate(data["curve_node"]):
+        points = om.MPointArray([om.MPoint(*cv) for cv in data["cvs"][cv_offsets[c]:cv_offsets[c + 1]]])
+        knots = om.MDoubleArray(data["knots"][knot_offsets[c]:knot_offsets[c + 1]].tolist())
+        curve_data = om.MFnNurbsCurveData().create()
+        curve_fn.create(points, knots, int(data["curve_degree"][c]), int(data["curve_form"][c]),
+                        False, True, curve_data)
+        shape = modifier.createNode("nurbsCurve", objects[node_index])
+        modifier.renameNode(shape, str(names[node_index]) + "Shape")
+        shape_fn = om.MFnDependencyNode(shape)
+        modifier.newPlugValue(shape_fn.findPlug("cached", False), curve_data)
+        if data["curve_override"][c][0]:
+            _write_override(modifier, shape_fn, *data["curve_override"][c], data["curve_override_rgb"][c])
+    undoable_modifier.commit(modifier)
+
+    return [om.MFnDependencyNode(obj).name() for obj in objects]
+
+def import_skeleton(path, parent=None):
+    """
+    Imports a skeleton file written by export_skeleton into the scene.
+
+    :param path: .npz file to read.
+    :param parent: Optional node to parent the imported roots under.
+    :return: Names of the created nodes.
+    """
+    data = load_skeleton(path)
+    if data is None:
+        return
+    created = build_skeleton(data, parent)
+    print(f"Imported {len(created)} node(s) and {len(data['curve_node'])} control curve(s) from {path}")
+    return created
+
+def export_selected_skeleton():
+    """Asks for a file and exports the hierarchies under the selected nodes."""
+    selected = cmds.ls(selection=True, type="transform")
+    if not selected:
+        cmds.warning("Please select the root joint(s) or control group(s) to export.")
+        return
+    path = cmds.fileDialog2(fileFilter="Skeleton (*.npz)", dialogStyle=2, fileMode=0)
+    if path:
+        export_skeleton(selected, path[0])
+
+def import_skeleton_file():
+    """Asks for an exported skeleton file and imports it."""
+    path = cmds.fileDialog2(fileFilter="Skeleton (*.npz)", dialogStyle=2, fileMode=1)
+    if path:
+        import_skeleton(path[0])
@@ -0,0 +1,123 @@
+import maya.cmds as cmds
+import maya.api.OpenMaya as om
+import numpy as np
+import time
+import ribbon_chain
+
+DEFAULT_MAX_INFLUENCES = 4
+DEFAULT_FALLOFF = 4.0
+VERTEX_CHUNK = 10000  # vertices per block, keeps the (vertices x segments) arrays small
+
+def project_on_chain(vertices, joint_positions):
+    """
+    Projects every vertex onto every bone segment of a chain.
+
+    :param vertices: (V, 3) array of vertex positions.
+    :param joint_positions: (J, 3) array of joint positions from root to tip.
+    :return: (distances, t) arrays of shape (V, J - 1): distance from each vertex to the closest
+             point on each segment, and where that point lies along the segment (0 at the start, 1 at the end).
+    """
+    starts = joint_positions[:-1]
+    bones = joint_positions[1:] - starts
+    lengths_sq = np.maximum(np.einsum("ij,ij->i", bones, bones), 1e-12)
+    offsets = vertices[:, None, :] - starts[None, :, :]
+    t = np.clip(np.einsum("vsk,sk->vs", offsets, bones) / lengths_sq, 0.0, 1.0)
+    closest = offsets - t[:, :, None] * bones[None, :, :]
+    return np.sqrt(np.einsum("vsk,vsk->vs", closest, closest)), t
+
+def compute_chain_weights(vertices, joint_positions, max_influences=DEFAULT_MAX_INFLUENCES, falloff=DEFAULT_FALLOFF):
+    """
+    Smooth distance based skin weights of a mesh on a chain.
+
+    Each segment pulls on a vertex by the inverse of its distance to the power of falloff,
+    shared between the segment's two joints by where the vertex projects along it, so the
+    weights blend across the joints instead of stepping at them. Only the max_influences
+    largest weights per vertex are kept, renormalized to 1.
+
+    :param vertices: (V, 3) array of vertex positions.
+    :param joint_positions: (J, 3) array of joint positions from root to tip.
+    :param max_influences: Influences kept per vertex.
+    :param falloff: Higher values make each vertex follow its closest bone more strictly.
+    :return: (V, J) array of weights.
+    """
+    vertices = np.asarray(vertices, dtype=np.float64)
+    joint_positions = np.asarray(joint_positions, dtype=np.float64)
+    joint_count = len(joint_positions)
+    max_influences = max(1, min(max_influences, joint_count))
+    weights = np.zeros((len(vertices), joint_count))
+
+    for start in range(0, len(vertices), VERTEX_CHUNK):
+        block = slice(start, start + VERTEX_CHUNK)
+        distances, t = project_on_chain(vertices[block], joint_positions)
+        # relative to the closest segment so the powers stay in range on large meshes
+        nearest = np.maximum(distances.min(axis=1, keepdims=True), 1e-6)
+        pull = (nearest / np.maximum(distances, 1e-6)) ** falloff
+        block_weights = weights[block]
+        block_weights[:, :-1] += pull * (1.0 - t)
+        block_weights[:, 1:] += pull * t
+
+        if max_influences < joint_count:
+            dropped = np.argpartition(block_weights, joint_count - max_influences, axis=1)[:, :joint_count - max_influences]
+            np.put_along_axis(block_weights, dropped, 0.0, axis=1)
+        block_weights /= block_weights.sum(axis=1, keepdims=True)
+    return weights
+
+def _mesh_path(mesh):
+    selection = om.MSelectionList()
+    selection.add(mesh)
+    return selection.getDagPath(0).extendToShape()
+
+def bind_mesh_to_chain(mesh, joints, max_influences=DEFAULT_MAX_INFLUENCES, falloff=DEFAULT_FALLOFF):
+    """
+    Skins a mesh to a generated chain (create_joint_chain, chain_on_curve, ...) with the
+    weights from compute_chain_weights instead of a heat map bind.
+
+    The skinCluster is created with a closest distance bind, which is quick, and all of its
+    weights are then replaced with one MFnSkinCluster.setWeights call.
+
+    :param mesh: Mesh transform or shape.
+    :param joints: Chain joints from root to tip.
+    :param max_influences: Influences kept per vertex.
+    :param falloff: Falloff power of the distance weights.
+    :return: The skinCluster node.
+    """
+    if len(joints) < 2:
+        cmds.warning("A skin binding needs a chain of at least two joints.")
+        return
+    start = time.perf_counter()
+    mesh_path = _mesh_path(mesh)
+    vertices = np.array(om.MFnMesh(mesh_path).getPoints(om.MSpace.kWorld))[:, :3]
+    joint_positions = np.array(cmds.xform(joints, query=True, worldSpace=True, translation=True)).reshape(-1, 3)
+    weights = compute_chain_weights(vertices, joint_positions, max_influences, falloff)
+    computed = time.perf_counter()
+
+    skin_cluster = cmds.skinCluster(joints, mesh_path.fullPathName(), toSelectedBones=True, bindMethod=0,
+                                    maximumInfluences=max_influences, normalizeWeights=1,
+                                    name=mesh_path.partialPathName() + "_skinCluster")[0]
+    selection = om.MSelectionList()
+    selection.add(skin_cluster)
+    skin_fn = om.MFnSkinCluster(selection.getDependNode(0))
+
+    # the weight columns follow the joint order, the skinCluster addresses influences by index
+    influence_index = {path.partialPathName(): skin_fn.indexForInfluenceObject(path)
+                       for path in skin_fn.influenceObjects()}
+    influences = om.MIntArray([influence_index[cmds.ls(joint)[0]] for joint in joints])
+    components = om.MFnSingleIndexedComponent().create(om.MFn.kMeshVertComponent)
+    om.MFnSingleIndexedComponent(components).setCompleteData(len(vertices))
+    skin_fn.setWeights(mesh_path, components, influences, om.MDoubleArray(weights.ravel().tolist()),
+                       normalize=False, returnOldWeights=False)
+
+    end = time.perf_counter()
+    print(f"Bound {len(vertices)} vertices to {len(joints)} joint(s) in {end - start:.2f}s "
+          f"(weights {computed - start:.2f}s, skinCluster {end - computed:.2f}s).")
+    return skin_cluster
+
+def bind_selected_mesh_to_chain(max_influences=DEFAULT_MAX_INFLUENCES, falloff=DEFAULT_FALLOFF):
+    """Binds the selected mesh to the chain under the selected root joint."""
+    root = cmds.ls(selection=True, type="joint")
+    meshes = [obj for obj in cmds.ls(selection=True, type="transform")
+              if cmds.listRelatives(obj, shapes=True, type="mesh")]
+    if not root or not meshes:
+        cmds.warning("Please select the mesh and the root joint of the chain.")
+        return
+    return bind_mesh_to_chain(meshes[0], ribbon_chain.chain_from_root(root[0]), max_influences, falloff)
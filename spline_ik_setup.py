@@ -0,0 +1,104 @@
+import maya.cmds as cmds
+import joint_chain_calc
+import joint_spline_chain
+import ribbon_chain
+import rig_analyzer
+
+def build_spline_ik(joints, curve, name="spline", twist_start=None, twist_end=None, stretch=True):
+    """
+    One step spline IK: handle, advanced twist and uniform stretch on a chain and curve,
+    e.g. from chain_on_curve and create_curve_from_joints.
+
+    The stretch network is one curveInfo and one multiplyDivide whatever the joint count;
+    the stretch factor fans out to every joint's scaleX. The chain is oriented X down the
+    bones first, which both the twist and the scaleX stretch rely on.
+
+    :param joints: Chain joints from root to tip.
+    :param curve: Curve transform the chain follows.
+    :param name: Prefix for the created nodes.
+    :param twist_start: Object whose rotation sets the twist at the start (a locator is created if None).
+    :param twist_end: Object whose rotation sets the twist at the end (a locator is created if None).
+    :param stretch: Add the stretch network.
+    :return: Dictionary with the handle, effector, twist objects, stretch nodes and the list of all created nodes.
+    """
+    created = []
+    cmds.joint(joints[0], edit=True, orientJoint="xyz", secondaryAxisOrient="yup", children=True, zeroScaleOrient=True)
+    cmds.setAttr(f"{joints[-1]}.jointOrient", 0, 0, 0)
+
+    handle, effector = cmds.ikHandle(startJoint=joints[0], endEffector=joints[-1], solver="ikSplineSolver",
+                                     curve=curve, createCurve=False, parentCurve=False, name=f"{name}_IKH")[:2]
+    created += [handle, effector]
+
+    # Advanced twist: object rotation up (start/end), +X forward, +Y up
+    twist_objects = []
+    for obj, joint, suffix in ((twist_start, joints[0], "twistStart"), (twist_end, joints[-1], "twistEnd")):
+        if obj is None:
+            obj = cmds.spaceLocator(name=f"{name}_{suffix}_LOC")[0]
+            cmds.matchTransform(obj, joint, position=True, rotation=True)
+            created.append(obj)
+        twist_objects.append(obj)
+    cmds.setAttr(f"{handle}.dTwistControlEnable", 1)
+    cmds.setAttr(f"{handle}.dWorldUpType", 4)
+    cmds.setAttr(f"{handle}.dForwardAxis", 0)
+    cmds.setAttr(f"{handle}.dWorldUpAxis", 0)
+    cmds.setAttr(f"{handle}.dWorldUpVector", 0, 1, 0)
+    cmds.setAttr(f"{handle}.dWorldUpVectorEnd", 0, 1, 0)
+    cmds.connectAttr(f"{twist_objects[0]}.worldMatrix[0]", f"{handle}.dWorldUpMatrix")
+    cmds.connectAttr(f"{twist_objects[1]}.worldMatrix[0]", f"{handle}.dWorldUpMatrixEnd")
+
+    curve_info = stretch_factor = None
+    if stretch:
+        curve_shape = cmds.listRelatives(curve, shapes=True, type="nurbsCurve")[0]
+        curve_info = cmds.createNode("curveInfo", name=f"{name}_curveInfo")
+        cmds.connectAttr(f"{curve_shape}.worldSpace[0]", f"{curve_info}.inputCurve")
+        stretch_factor = cmds.createNode("multiplyDivide", name=f"{name}_stretch_MD")
+        cmds.setAttr(f"{stretch_factor}.operation", 2)  # divide
+        cmds.connectAttr(f"{curve_info}.arcLength", f"{stretch_factor}.input1X")
+        cmds.setAttr(f"{stretch_factor}.input2X", cmds.getAttr(f"{curve_info}.arcLength"))
+        for joint in joints[:-1]:
+            cmds.connectAttr(f"{stretch_factor}.outputX", f"{joint}.scaleX")
+        created += [curve_info, stretch_factor]
+
+    print(f"Spline IK '{handle}' on {len(joints)} joint(s) created with {len(created)} node(s).")
+    return {"handle": handle, "effector": effector, "twist": twist_objects,
+            "curve_info": curve_info, "stretch": stretch_factor, "created": created}
+
+def create_spline_ik_on_selection():
+    """Builds the spline IK from the selected chain root joint and the selected curve."""
+    root = cmds.ls(selection=True, type="joint")
+    curves = [obj for obj in cmds.ls(selection=True, type="transform")
+              if cmds.listRelatives(obj, shapes=True, type="nurbsCurve")]
+    if not root or not curves:
+        cmds.warning("Please select the root joint of the chain and the curve.")
+        return
+    return build_spline_ik(ribbon_chain.chain_from_root(root[0]), curves[0])
+
+def benchmark_spline_ik(joint_counts=(50, 200, 500), length=500.0, frames=50):
+    """
+    Builds the spline IK for several chain sizes in the current scene, measures the per frame
+    evaluation time of each with the rig analyzer and deletes them again.
+
+    :param joint_counts: Chain sizes to test.
+    :param length: Length of the test chains.
+    :param frames: Frames played per measurement.
+    :return: List of (joint count, network node count, milliseconds per frame).
+    """
+    results = []
+    for count in joint_counts:
+        joints = joint_chain_calc.build_joint_chain((0, 0, 0), (length, 0, 0), 1.0, count, 1.0,
+                                                    name_prefix=f"splineBench{count}")
+        # a four CV curve from the start, thirds and end of the chain
+        cmds.select([joints[0], joints[count // 3], joints[2 * count // 3], joints[-1]], replace=True)
+        curve = joint_spline_chain.create_curve_from_joints()
+        setup = build_spline_ik(joints, curve, name=f"splineBench{count}")
+        cmds.setAttr(f"{setup['twist'][1]}.rotateX", 90)
+
+        nodes, _ = rig_analyzer.collect_rig_nodes([joints[0], curve, setup["handle"]] + setup["twist"])
+        fps = rig_analyzer.measure_playback(nodes, 1, frames)
+        results.append((count, len(setup["created"]), 1000.0 / fps if fps else 0.0))
+        leftovers = [joints[0], curve, setup["handle"]] + setup["twist"] + [setup["curve_info"], setup["stretch"]]
+        cmds.delete([node for node in leftovers if cmds.objExists(node)])
+
+    for count, node_count, ms in results:
+        print(f"{count:5d} joints: {node_count} setup nodes, {ms:.3f} ms/frame")
+    return results
@@ -0,0 +1,142 @@
+import maya.cmds as cmds
+import maya.api.OpenMaya as om
+import math
+import joint_chain_calc
+import reverse_foot
+
+def _world_matrix(node):
+    return om.MMatrix(cmds.xform(node, query=True, worldSpace=True, matrix=True))
+
+def _position(node):
+    return om.MVector(cmds.xform(node, query=True, worldSpace=True, translation=True))
+
+def aim_frame(start, end, up, position):
+    """World matrix with X from start to end, Y as close to up as possible, placed at position."""
+    x_axis = (end - start).normal()
+    z_axis = (x_axis ^ up).normal()
+    y_axis = z_axis ^ x_axis
+    return om.MMatrix([x_axis.x, x_axis.y, x_axis.z, 0,
+                       y_axis.x, y_axis.y, y_axis.z, 0,
+                       z_axis.x, z_axis.y, z_axis.z, 0,
+                       position.x, position.y, position.z, 1])
+
+def _set_matrix(plug, matrix):
+    cmds.setAttr(plug, *[matrix[i] for i in range(16)], type="matrix")
+
+def _load_plugins():
+    # decomposeMatrix comes from matrixNodes, quatNormalize and quatToEuler from quatNodes
+    for plugin in ("matrixNodes", "quatNodes"):
+        if not cmds.pluginInfo(plugin, query=True, loaded=True):
+            cmds.loadPlugin(plugin, quiet=True)
+
+def add_segment_twist(start, end, driver, count, spread_factor=1.0, counter=False, up=None, name=None):
+    """
+    Adds count twist joints between two joints, parented under start and spaced with
+    calculate_points_spread, all driven by one twist extraction of the driver's rotation.
+
+    The extraction is multMatrix -> decomposeMatrix -> quatNormalize -> quatToEuler: the
+    driver's local matrix is put between two constant matrices that express it in an aim
+    frame along the segment, relative to its pose at build time, and only the X (twist) part
+    of that rotation's quaternion is kept. Each twist joint then takes its share of the twist
+    through a unitConversion used as a plain multiplier, so a twist joint costs one node.
+
+    :param start: Joint at the start of the segment; the twist joints become its children.
+    :param end: Joint at the end of the segment.
+    :param driver: Joint whose twist is distributed (start itself for a counter twist, end otherwise).
+    :param count: Number of twist joints.
+    :param spread_factor: Spacing along the segment (see calculate_points_spread).
+    :param counter: Counter the driver's twist near the start (weights -(1 - t)) instead of
+                    picking it up towards the end (weights t), t running 0..1 along the segment.
+    :param up: World up vector of the aim frames (defaults to world Y).
+    :param name: Prefix for the created nodes (defaults to the start joint's name).
+    :return: Dictionary with the twist joints, their weights and the created utility nodes.
+    """
+    _load_plugins()
+    name = name or start.rsplit("|", 1)[-1].replace("_JNT", "")
+    start_pos, end_pos = _position(start), _position(end)
+    if up is None:
+        up = om.MVector(0, 1, 0)
+    length = (end_pos - start_pos).length()
+    radius = cmds.getAttr(f"{start}.radius") * 0.5
+
+    # Twist joints, oriented X down the segment with the rotation frozen into jointOrient
+    points = joint_chain_calc.calculate_points_spread(tuple(start_pos), tuple(end_pos), spread_factor, count + 2)[1:-1]
+    rotation = om.MTransformationMatrix(aim_frame(start_pos, end_pos, up, start_pos)).rotation()
+    twist_joints = []
+    weights = []
+    for i, point in enumerate(points):
+        cmds.select(clear=True)
+        joint = cmds.joint(position=point, radius=radius, name=f"{name}Twist{i + 1:02d}_JNT")
+        joint = cmds.parent(joint, start)[0]
+        cmds.xform(joint, worldSpace=True, rotation=[math.degrees(rotation.x), math.degrees(rotation.y), math.degrees(rotation.z)])
+        t = (om.MVector(point) - start_pos).length() / length if length else 0.0
+        weights.append(-(1.0 - t) if counter else t)
+        twist_joints.append(joint)
+    cmds.makeIdentity(twist_joints, apply=True, rotate=True)
+    cmds.select(clear=True)
+
+    # One twist extraction for the segment
+    driver_world = _world_matrix(driver)
+    driver_local = om.MMatrix(cmds.getAttr(f"{driver}.matrix"))
+    to_driver = aim_frame(start_pos, end_pos, up, _position(driver)) * driver_world.inverse()
+    mult = cmds.createNode("multMatrix", name=f"{name}Twist_MM")
+    _set_matrix(f"{mult}.matrixIn[0]", to_driver)
+    cmds.connectAttr(f"{driver}.matrix", f"{mult}.matrixIn[1]")
+    _set_matrix(f"{mult}.matrixIn[2]", (to_driver * driver_local).inverse())
+    decompose = cmds.createNode("decomposeMatrix", name=f"{name}Twist_DM")
+    cmds.connectAttr(f"{mult}.matrixSum", f"{decompose}.inputMatrix")
+    normalize = cmds.createNode("quatNormalize", name=f"{name}Twist_QN")
+    cmds.connectAttr(f"{decompose}.outputQuatX", f"{normalize}.inputQuatX")
+    cmds.connectAttr(f"{decompose}.outputQuatW", f"{normalize}.inputQuatW")
+    to_euler = cmds.createNode("quatToEuler", name=f"{name}Twist_Q2E")
+    cmds.connectAttr(f"{normalize}.outputQuat", f"{to_euler}.inputQuat")
+
+    weight_nodes = []
+    for joint, weight in zip(twist_joints, weights):
+        weight_node = cmds.createNode("unitConversion", name=joint.replace("_JNT", "_UC"))
+        cmds.setAttr(f"{weight_node}.conversionFactor", weight)
+        cmds.connectAttr(f"{to_euler}.outputRotateX", f"{weight_node}.input")
+        cmds.connectAttr(f"{weight_node}.output", f"{joint}.rotateX")
+        weight_nodes.append(weight_node)
+
+    return {"joints": twist_joints, "weights": weights,
+            "extraction": [mult, decompose, normalize, to_euler], "weight_nodes": weight_nodes}
+
+def add_leg_twist(hip, upper_count=3, lower_count=3, spread_factor=1.0):
+    """
+    Twist joints for a foot_joint_creation leg: the thigh counters the hip's twist near the
+    hip and the shin picks up the ankle's twist towards the ankle.
+
+    :param hip: The hip joint of the chain.
+    :param upper_count: Twist joints between hip and knee.
+    :param lower_count: Twist joints between knee and ankle.
+    :param spread_factor: Spacing along each segment (see calculate_points_spread).
+    :return: Dictionary with the "upper" and "lower" add_segment_twist results.
+    """
+    joints = reverse_foot.find_foot_joints(hip)
+    if joints is None:
+        return
+    knee = cmds.listRelatives(joints["ankle"], parent=True, fullPath=True)[0]
+    # both segments' aim frames use the leg plane normal as up (world Y for a straight leg)
+    hip_pos, knee_pos, ankle_pos = _position(joints["hip"]), _position(knee), _position(joints["ankle"])
+    up = (knee_pos - hip_pos) ^ (ankle_pos - knee_pos)
+    up = up.normal() if up.length() > 1e-6 else om.MVector(0, 1, 0)
+
+    twist = {}
+    if upper_count:
+        twist["upper"] = add_segment_twist(joints["hip"], knee, joints["hip"], upper_count,
+                                           spread_factor, counter=True, up=up, name="thigh")
+    if lower_count:
+        twist["lower"] = add_segment_twist(knee, joints["ankle"], joints["ankle"], lower_count,
+                                           spread_factor, up=up, name="shin")
+    created = sum(len(segment["joints"]) for segment in twist.values())
+    print(f"Added {created} twist joint(s) driven by {len(twist)} twist extraction(s)")
+    return twist
+
+def add_leg_twist_on_selection(upper_count=3, lower_count=3, spread_factor=1.0):
+    """Adds the leg twist joints to the selected hip joint (hip_JNT when nothing is selected)."""
+    selected = cmds.ls(selection=True, type="joint") or cmds.ls("hip_JNT", type="joint")
+    if not selected:
+        cmds.warning("Please select the hip joint of a foot chain.")
+        return
+    return add_leg_twist(selected[0], upper_count, lower_count, spread_factor)
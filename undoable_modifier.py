@@ -0,0 +1,73 @@
+import maya.cmds as cmds
+import maya.api.OpenMaya as om
+import sys
+import types
+
+# A modifier's doIt run from a script never reaches Maya's undo queue. This module is also a
+# plugin that registers COMMAND_NAME, a command that runs a queued modifier and keeps it for
+# undo and redo, so tools can batch their edits in one modifier and still be undoable.
+COMMAND_NAME = "dinoCommitModifier"
+PLUGIN_NAME = "undoable_modifier"
+
+# Maya loads the plugin as its own module, separate from the one the tools import, so the
+# modifiers handed to the command are passed through a module both of them can find
+_QUEUE_MODULE = "_dino_undoable_modifier_queue"
+_queue = sys.modules.setdefault(_QUEUE_MODULE, types.ModuleType(_QUEUE_MODULE))
+if not hasattr(_queue, "pending"):
+    _queue.pending = []
+
+def maya_useNewAPI():
+    """The plugin uses the Python API 2.0."""
+    pass
+
+class CommitModifierCommand(om.MPxCommand):
+    """Runs the modifier queued by commit; undo and redo call the modifier's undoIt and doIt."""
+
+    def __init__(self):
+        om.MPxCommand.__init__(self)
+        self.modifier = None
+
+    @staticmethod
+    def creator():
+        return CommitModifierCommand()
+
+    def isUndoable(self):
+        return self.modifier is not None
+
+    def doIt(self, args):
+        if not _queue.pending:
+            om.MGlobal.displayWarning(f"{COMMAND_NAME} has no modifier to commit.")
+            return
+        self.modifier = _queue.pending.pop()
+        self.redoIt()
+
+    def redoIt(self):
+        self.modifier.doIt()
+
+    def undoIt(self):
+        self.modifier.undoIt()
+
+def initializePlugin(plugin):
+    om.MFnPlugin(plugin, "SKetchPoint").registerCommand(COMMAND_NAME, CommitModifierCommand.creator)
+
+def uninitializePlugin(plugin):
+    om.MFnPlugin(plugin).deregisterCommand(COMMAND_NAME)
+
+def commit(modifier):
+    """
+    Runs a MDGModifier or MDagModifier as one undoable step. Inside an undo chunk it undoes
+    together with the cmds calls around it.
+
+    :param modifier: Modifier with its edits queued and doIt not yet called.
+    """
+    if not cmds.undoInfo(query=True, state=True):
+        modifier.doIt()
+        return
+    if not cmds.pluginInfo(PLUGIN_NAME, query=True, loaded=True):
+        cmds.loadPlugin(__file__, quiet=True)
+    _queue.pending.append(modifier)
+    try:
+        getattr(cmds, COMMAND_NAME)()
+    finally:
+        if modifier in _queue.pending:
+            _queue.pending.remove(modifier)